@@ -0,0 +1,103 @@
+import asyncio
+import time
+
+from django.core.management import BaseCommand, CommandError
+
+from bot.tg.async_client import AsyncTgClient
+from bot.tg.client import TgClient
+from bot.tg.dispatcher import AsyncChatDispatcher, ChatDispatcher
+from bot.tg.fake_server import FakeTelegramServer
+
+
+class Command(BaseCommand):
+    """
+    Класс команды для измерения пропускной способности обработки обновлений бота.
+    Поднимает локальный сервер, имитирующий Telegram API с задержкой sendMessage,
+    и прогоняет через ChatDispatcher одинаковый поток сообщений при разном числе потоков.
+    Обработчик отвечает на каждое сообщение, порядок ответов в каждом чате проверяется.
+    С --async сообщения обрабатывает AsyncChatDispatcher с AsyncTgClient,
+    а --workers задает число соединений с API
+    """
+    help = 'Measures bot update throughput against a local fake Telegram server'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--updates', type=int, default=1_000, help='Количество входящих сообщений')
+        parser.add_argument('--chats', type=int, default=50, help='Количество чатов')
+        parser.add_argument('--workers', type=int, nargs='+', default=[1, 8, 32], help='Количество потоков')
+        parser.add_argument('--max-pending', type=int, default=100)
+        parser.add_argument('--latency', type=float, default=0.01, help='Задержка sendMessage, секунд')
+        parser.add_argument('--async', dest='use_async', action='store_true', help='Асинхронный клиент и диспетчер')
+
+    def handle(self, *args, **options):
+        updates_count = max(options['updates'], 1)
+        chats = max(options['chats'], 1)
+        for workers in options['workers']:
+            with FakeTelegramServer(latency=options['latency']) as server:
+                for number in range(updates_count):
+                    server.add_message(chat_id=number % chats + 1, text=str(number))
+                if options['use_async']:
+                    elapsed, stats = asyncio.run(self.run_async(server, updates_count, workers, options['max_pending']))
+                else:
+                    elapsed, stats = self.run(server, updates_count, workers, options['max_pending'])
+                self.check_order(server, chats)
+            send_stats = stats.get('sendMessage', {})
+            label = 'connections' if options['use_async'] else 'workers'
+            self.stdout.write(
+                f"{label}={workers:<4} {updates_count / elapsed:>10.0f} updates/s  ({elapsed:.2f} s)  "
+                f"sendMessage avg={send_stats.get('latency_avg', 0) * 1000:.1f} ms "
+                f"retries={send_stats.get('retries', 0)}"
+            )
+
+    @staticmethod
+    def run(server: FakeTelegramServer, updates_count: int, workers: int, max_pending: int) -> tuple[float, dict]:
+        """ Метод для прогона всех сообщений через диспетчер, возвращает затраченное время и счетчики клиента """
+        tg_client = TgClient('benchmark', api_url=server.url, pool_size=workers)
+        dispatcher = ChatDispatcher(
+            lambda message: tg_client.send_message(chat_id=message.chat.id, text=message.text),
+            workers=workers,
+            max_pending=max_pending,
+        )
+        start = time.perf_counter()
+        offset, received = 0, 0
+        while received < updates_count:
+            for item in tg_client.get_updates(offset=offset, timeout=1).result:
+                dispatcher.submit(item.message.chat.id, item.message)
+                offset = item.update_id + 1
+                received += 1
+        dispatcher.shutdown()
+        elapsed = time.perf_counter() - start
+        tg_client.close()
+        return elapsed, tg_client.get_stats()
+
+    @staticmethod
+    async def run_async(server: FakeTelegramServer, updates_count: int, connections: int, max_pending: int):
+        """ Метод для прогона всех сообщений через асинхронный диспетчер, возвращает время и счетчики клиента """
+        tg_client = AsyncTgClient('benchmark', api_url=server.url, pool_size=connections)
+
+        async def handler(message):
+            await tg_client.send_message(chat_id=message.chat.id, text=message.text)
+
+        dispatcher = AsyncChatDispatcher(handler, max_pending=max_pending)
+        start = time.perf_counter()
+        offset, received = 0, 0
+        while received < updates_count:
+            for item in (await tg_client.get_updates(offset=offset, timeout=1)).result:
+                await dispatcher.submit(item.message.chat.id, item.message)
+                offset = item.update_id + 1
+                received += 1
+        await dispatcher.shutdown()
+        elapsed = time.perf_counter() - start
+        await tg_client.close()
+        return elapsed, tg_client.get_stats()
+
+    @staticmethod
+    def check_order(server: FakeTelegramServer, chats: int) -> None:
+        """ Метод для проверки, что ответы в каждом чате идут в порядке входящих сообщений """
+        by_chat = {}
+        for message in server.sent:
+            by_chat.setdefault(message['chat_id'], []).append(int(message['text']))
+        for chat_id, numbers in by_chat.items():
+            if numbers != sorted(numbers):
+                raise CommandError(f"Replies in chat {chat_id} are out of order")
+        if len(by_chat) != min(chats, len(server.sent)):
+            raise CommandError("Some chats got no replies")
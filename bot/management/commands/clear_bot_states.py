@@ -0,0 +1,18 @@
+from django.core.management import BaseCommand
+
+from bot.models import TgChatUpdate
+from bot.tg.state import get_state_store
+
+
+class Command(BaseCommand):
+    """
+    Класс команды удаления истекших состояний диалогов бота и отметок обработанных обновлений вебхука.
+    runbot удаляет состояния сам; команда нужна при работе через вебхук, например по cron
+    """
+    help = 'Deletes expired telegram bot chat states and webhook update marks'
+
+    def handle(self, *args, **options):
+        deleted = get_state_store().clear_expired()
+        self.stdout.write(self.style.SUCCESS(f"Cleared {deleted} expired chat states"))
+        deleted = TgChatUpdate.clear_expired()
+        self.stdout.write(self.style.SUCCESS(f"Cleared {deleted} expired webhook updates"))
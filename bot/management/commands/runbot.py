@@ -1,140 +1,278 @@
+import asyncio
+import signal
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property
 from django.core.management import BaseCommand
+from django.db import close_old_connections
+from django.utils.crypto import get_random_string
 
 from bot.models import TgUser
-from bot.tg.client import TgClient
-from bot.tg.dc import Message
-from goals.models import Goal, GoalCategory
+from bot.tg.async_client import AsyncTgClient
+from bot.tg.client import BaseTgClient, TgClient, TgClientError
+from bot.tg.dc import Message, UpdateObj
+from bot.tg.dispatcher import AsyncChatDispatcher, ChatDispatcher, close_pool_connections
+from bot.tg.state import BaseStateStore, TgState, get_state_store
+from goals.models import Goal, GoalCategory, user_board_ids
 
 
-class TgState:
-    """ Кдасс для отслеживания этапов создания целей """
-    DEFAULT = 0
-    CATEGORY_CHOOSE = 1
-    GOAL_CREATE = 2
-
-    def __init__(self, state, category_id=None):
-        self.state = state
-        self.category_id = category_id
-
-    def set_state(self, state):
-        """ Метод задающий этап создания цели """
-        self.state = state
-
-    def set_category_id(self, category_id):
-        """ Метод присваения категории для цели """
-        self.category_id = category_id
-
-
-STATE = TgState(state=TgState.DEFAULT)
+class PollInterrupted(Exception):
+    """ Класс исключения для прерывания ожидающего getUpdates при остановке бота """
 
 
 class Command(BaseCommand):
     """ Класс управления командами для телеграмм-бота """
     help = 'Runs telegramm bot'
     tg_client = TgClient("5987351996:AAHn5lnwAgMi2uooEYKuzMD3pii-F6CYCAE")
+    # Состояние текущего опроса, по которому stop прерывает ожидание getUpdates
+    polling = False
+    loop: asyncio.AbstractEventLoop | None = None
+    poll_task: asyncio.Future | None = None
+    next_clear = 0.0
+
+    @cached_property
+    def state_store(self) -> BaseStateStore:
+        """ Хранилище состояний диалогов по id чата, выбирается настройкой BOT_STATE_STORE """
+        return get_state_store()
 
-    def choose_category(self, msg: Message, tg_user: TgUser):
+    def choose_category(self, tg_user: TgUser, state: TgState) -> str:
         """ Метод для выбора категории """
-        goal_categories = GoalCategory.objects.filter(
-            board__participants__user=tg_user.user,
-            is_deleted=False,
-        )
+        goal_categories = GoalCategory.alive.filter(board_id__in=user_board_ids(tg_user.user))
         goal_categories_str = '\n'.join(['- ' + goal.title for goal in goal_categories])
+        state.set_state(TgState.CATEGORY_CHOOSE)
+        return f'Выберите категорию: \n {goal_categories_str}'
 
-        self.tg_client.send_message(
-            chat_id=msg.chat.id,
-            text=f'Выберите категорию: \n {goal_categories_str}'
-        )
-        STATE.set_state(TgState.CATEGORY_CHOOSE)
-
-    def check_category(self, msg: Message):
+    def check_category(self, msg: Message, state: TgState) -> str:
         """ Метод для проверки наличия имеющихся категорий """
-        category = GoalCategory.objects.filter(title=msg.text).first()
-        if category:
-            self.tg_client.send_message(
-                chat_id=msg.chat.id,
-                text=f'Введите название цели'
-            )
-            STATE.set_category_id(category.id)
-            STATE.set_state(TgState.GOAL_CREATE)
-        else:
-            self.tg_client.send_message(
-                chat_id=msg.chat.id,
-                text=f'Категории "{msg.text}" не существует'
-            )
+        category = GoalCategory.alive.filter(title=msg.text).first()
+        if not category:
+            return f'Категории "{msg.text}" не существует'
+        state.set_category_id(category.id)
+        state.set_state(TgState.GOAL_CREATE)
+        return f'Введите название цели'
 
-    def create_goal(self,  msg: Message, tg_user: TgUser):
+    def create_goal(self, msg: Message, tg_user: TgUser, state: TgState) -> str:
         """ Метод создания цели """
-        category = GoalCategory.objects.get(pk=STATE.category_id)
+        category = GoalCategory.objects.get(pk=state.category_id)
         goal = Goal.objects.create(
             title=msg.text,
             user=tg_user.user,
             category=category,
             due_date=datetime.now().date(),
         )
-        self.tg_client.send_message(
-            chat_id=msg.chat.id,
-            text=f'Цель "{goal.title}" создана'
-        )
-        STATE.set_state(TgState.DEFAULT)
+        state.set_state(TgState.DEFAULT)
+        state.set_category_id(None)
+        return f'Цель "{goal.title}" создана'
 
-    def get_goals(self, msg: Message, tg_user: TgUser):
+    def get_goals(self, tg_user: TgUser) -> str:
         """ Метод для выведения имеющихся целей """
-        goals = Goal.objects.filter(
-            category__board__participants__user=tg_user.user,
-        ).exclude(status=Goal.Status.archived)
+        goals = Goal.alive.filter(board_id__in=user_board_ids(tg_user.user))
         goals_str = '\n'.join([goal.title for goal in goals])
+        return f'Список целей: \n {goals_str}'
 
-        self.tg_client.send_message(
-            chat_id=msg.chat.id,
-            text=f'Список целей: \n {goals_str}'
-        )
-
-    def cancel_operation(self, msg: Message):
+    def cancel_operation(self, state: TgState) -> str:
         """ Метод отмены текущего действия """
-        STATE.set_state(TgState.DEFAULT)
-        self.tg_client.send_message(
-            chat_id=msg.chat.id,
-            text=f'Операция отменена'
-        )
+        state.set_state(TgState.DEFAULT)
+        state.set_category_id(None)
+        return f'Операция отменена'
 
-    def handle_message(self, msg: Message):
-        """ Метод для обработки получаемых сообщений """
+    def process_message(self, msg: Message) -> list[str]:
+        """
+        Метод для обработки сообщения без обращения к Telegram API: работает с БД
+        и состоянием диалога и возвращает тексты ответов в порядке отправки
+        """
+        replies = []
+        # Код задается сразу при создании: пустые коды пользователей, которые создаются
+        # параллельно из разных чатов, нарушали бы уникальность verification_code
         tg_user, created = TgUser.objects.get_or_create(
             tg_user_id=msg.msg_from.id,
             tg_chat_id=msg.chat.id,
+            defaults={'verification_code': get_random_string(10)},
         )
         if created:
-            tg_user.generate_verification_code()
-            self.tg_client.send_message(
-                chat_id=msg.chat.id,
-                text=f"Подтвердите свой аккаунт."
-                     f"Для подтверждения необходимо ввести код: {tg_user.verification_code} на сайте"
+            replies.append(
+                f"Подтвердите свой аккаунт."
+                f"Для подтверждения необходимо ввести код: {tg_user.verification_code} на сайте"
             )
+        state = self.state_store.get(msg.chat.id)
+        loaded = (state.state, state.category_id)
         if msg.text == '/goals':
-            self.get_goals(msg, tg_user)
+            replies.append(self.get_goals(tg_user))
         elif msg.text == '/create':
-            self.choose_category(msg, tg_user)
+            replies.append(self.choose_category(tg_user, state))
         elif msg.text == '/cancel':
-            self.cancel_operation(msg)
-        elif STATE.state == TgState.CATEGORY_CHOOSE:
-            self.check_category(msg)
-        elif STATE.state == TgState.GOAL_CREATE:
-            self.create_goal(msg, tg_user)
-
+            replies.append(self.cancel_operation(state))
+        elif state.state == TgState.CATEGORY_CHOOSE:
+            replies.append(self.check_category(msg, state))
+        elif state.state == TgState.GOAL_CREATE:
+            replies.append(self.create_goal(msg, tg_user, state))
         else:
-            self.tg_client.send_message(
-                chat_id=msg.chat.id,
-                text=f'Неизвестная команда {msg.text}'
-            )
+            replies.append(f'Неизвестная команда {msg.text}')
+        # Сообщения одного чата обрабатываются по порядку, поэтому состояние
+        # можно сохранять без блокировок; неизменное состояние не перезаписывается
+        if (state.state, state.category_id) != loaded:
+            self.state_store.set(msg.chat.id, state)
+        return replies
+
+    def handle_message(self, msg: Message):
+        """ Метод для обработки получаемых сообщений """
+        for text in self.process_message(msg):
+            self.tg_client.send_message(chat_id=msg.chat.id, text=text)
+
+    def process_message_in_thread(self, msg: Message) -> list[str]:
+        """ Метод для обработки сообщения в потоке пула асинхронного режима """
+        close_old_connections()
+        return self.process_message(msg)
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=8, help='Количество потоков обработки сообщений')
+        parser.add_argument(
+            '--max-pending', type=int, default=100, help='Количество необработанных сообщений, после которого опрос ждет'
+        )
+        parser.add_argument('--poll-timeout', type=int, default=60, help='Таймаут long polling, секунд')
+        parser.add_argument(
+            '--async', dest='use_async', action='store_true',
+            help='Опрос и отправка ответов в asyncio, работа с БД в пуле из --workers потоков',
+        )
+        parser.add_argument(
+            '--connections', type=int, default=100, help='Количество соединений с Telegram API в режиме --async'
+        )
+        parser.add_argument(
+            '--clear-interval', type=int, default=600, help='Период удаления истекших состояний диалогов, секунд'
+        )
+
+    def stop(self, signum, frame):
+        """
+        Метод для плавной остановки по SIGTERM и SIGINT: принятые сообщения обрабатываются до выхода.
+        Ожидающий long polling прерывается сразу, иначе остановка ждала бы до --poll-timeout секунд,
+        дольше, чем Docker ждет перед SIGKILL. Неподтвержденные обновления Telegram отдаст повторно
+        """
+        self.running = False
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.cancel_poll)
+        elif self.polling:
+            # Обработчик сигнала выполняется в основном потоке, исключение прерывает запрос requests
+            self.polling = False
+            raise PollInterrupted
+
+    def cancel_poll(self):
+        """ Метод для отмены ожидающего getUpdates асинхронного режима """
+        if self.poll_task is not None:
+            self.poll_task.cancel()
+
+    def clear_expired_states(self, interval: int) -> None:
+        """ Метод для удаления истекших состояний диалогов не чаще раза в interval секунд """
+        now = time.monotonic()
+        if now < self.next_clear:
+            return
+        self.next_clear = now + interval
+        deleted = self.state_store.clear_expired()
+        if deleted:
+            self.stdout.write(f"Cleared {deleted} expired chat states")
+
+    def submit(self, dispatcher: ChatDispatcher, item: UpdateObj) -> bool:
+        """ Метод для передачи обновления диспетчеру: ждет свободного места, пока бот не остановлен """
+        if not hasattr(item, 'message'):
+            return True
+        while not dispatcher.submit(item.message.chat.id, item.message, timeout=1):
+            if not self.running:
+                return False
+        return True
 
     def handle(self, *args, **options):
         """ Метод для получения актуальной информации от телеграмм-бота"""
+        self.running = True
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        if options['use_async']:
+            asyncio.run(self.poll_async(options))
+        else:
+            self.poll(options)
+
+    def poll(self, options):
+        """ Метод для long polling с обработкой сообщений в пуле потоков ChatDispatcher """
+        dispatcher = ChatDispatcher(self.handle_message, options['workers'], options['max_pending'])
+        offset = 0
+        try:
+            while self.running:
+                self.clear_expired_states(options['clear_interval'])
+                self.polling = True
+                try:
+                    res = self.tg_client.get_updates(offset=offset, timeout=options['poll_timeout'])
+                except TgClientError as error:
+                    # Клиент уже повторил запрос с паузами, опрос продолжается со следующей итерации
+                    self.stderr.write(f"getUpdates failed: {error}")
+                    continue
+                finally:
+                    self.polling = False
+                for item in res.result:
+                    if not self.submit(dispatcher, item):
+                        break
+                    offset = item.update_id + 1
+        except PollInterrupted:
+            pass
+        finally:
+            self.polling = False
+            dispatcher.shutdown()
+        # Подтверждаем обработанные обновления, чтобы после перезапуска они не пришли повторно
+        if offset:
+            self.tg_client.get_updates(offset=offset, timeout=0)
+        self.write_stats(self.tg_client)
+
+    async def poll_async(self, options):
+        """
+        Метод для long polling в asyncio: следующий getUpdates запрашивается сразу,
+        пока принятые сообщения обрабатываются. Работа с БД идет в пуле из workers потоков,
+        ответы отправляются AsyncTgClient без занятия потоков
+        """
+        # Асинхронный клиент ходит с тем же токеном и по тому же адресу, что и синхронный
+        tg_client = AsyncTgClient(
+            self.tg_client.token, api_url=self.tg_client.api_url, pool_size=options['connections']
+        )
+        executor = ThreadPoolExecutor(max_workers=options['workers'], thread_name_prefix='tg-orm')
+        loop = asyncio.get_running_loop()
+
+        async def handle_message(msg: Message):
+            replies = await loop.run_in_executor(executor, self.process_message_in_thread, msg)
+            for text in replies:
+                await tg_client.send_message(chat_id=msg.chat.id, text=text)
+
+        dispatcher = AsyncChatDispatcher(handle_message, options['max_pending'])
         offset = 0
-        while True:
-            res = self.tg_client.get_updates(offset=offset)
-            for item in res.result:
-                offset = item.update_id + 1
-                if hasattr(item, 'message'):
-                    self.handle_message(item.message)
+        self.loop = loop
+        try:
+            while self.running:
+                await loop.run_in_executor(executor, self.clear_expired_states, options['clear_interval'])
+                self.poll_task = asyncio.ensure_future(
+                    tg_client.get_updates(offset=offset, timeout=options['poll_timeout'])
+                )
+                try:
+                    res = await self.poll_task
+                except asyncio.CancelledError:
+                    break
+                except TgClientError as error:
+                    self.stderr.write(f"getUpdates failed: {error}")
+                    continue
+                finally:
+                    self.poll_task = None
+                for item in res.result:
+                    if hasattr(item, 'message'):
+                        await dispatcher.submit(item.message.chat.id, item.message)
+                    offset = item.update_id + 1
+        finally:
+            self.loop = None
+            await dispatcher.shutdown()
+            await loop.run_in_executor(None, close_pool_connections, executor, options['workers'])
+        if offset:
+            await tg_client.get_updates(offset=offset, timeout=0)
+        await tg_client.close()
+        self.write_stats(tg_client)
+
+    def write_stats(self, tg_client: BaseTgClient):
+        """ Метод для вывода счетчиков вызовов Telegram API за время работы бота """
+        for method, stats in tg_client.get_stats().items():
+            self.stdout.write(
+                f"{method}: calls={stats['calls']} errors={stats['errors']} retries={stats['retries']} "
+                f"latency avg={stats['latency_avg'] * 1000:.1f} ms max={stats['latency_max'] * 1000:.1f} ms"
+            )
@@ -0,0 +1,49 @@
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+from bot.management.commands.runbot import Command as BotCommand
+from bot.tg.client import TgClientError
+
+
+class Command(BaseCommand):
+    """
+    Класс команды для регистрации и удаления вебхука телеграмм-бота.
+    set регистрирует адрес вьюшки BotWebhookView с секретом BOT_WEBHOOK_SECRET,
+    после чего Telegram перестает отдавать обновления через getUpdates и runbot не нужен.
+    delete удаляет вебхук и возвращает бота к long polling
+    """
+    help = 'Registers or removes the telegram bot webhook'
+    tg_client = BotCommand.tg_client
+
+    def add_arguments(self, parser):
+        parser.add_argument('action', choices=['set', 'delete'])
+        parser.add_argument('url', nargs='?', help='HTTPS-адрес вебхука, например https://example.com/bot/webhook')
+        parser.add_argument('--max-connections', type=int, help='Количество одновременных запросов вебхука от Telegram')
+        parser.add_argument(
+            '--drop-pending-updates', action='store_true', help='Удалить обновления, накопившиеся в Telegram'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            if options['action'] == 'set':
+                response = self.set_webhook(options)
+            else:
+                response = self.tg_client.delete_webhook(drop_pending_updates=options['drop_pending_updates'])
+        except TgClientError as error:
+            raise CommandError(str(error))
+        if not response.ok:
+            raise CommandError(response.description or 'Telegram API error')
+        self.stdout.write(response.description or 'OK')
+
+    def set_webhook(self, options):
+        """ Метод для регистрации вебхука """
+        if not options['url']:
+            raise CommandError('Webhook url is required')
+        if not settings.BOT_WEBHOOK_SECRET:
+            raise CommandError('BOT_WEBHOOK_SECRET is not set')
+        return self.tg_client.set_webhook(
+            options['url'],
+            secret_token=settings.BOT_WEBHOOK_SECRET,
+            max_connections=options['max_connections'],
+            drop_pending_updates=options['drop_pending_updates'],
+        )
@@ -0,0 +1,27 @@
+# Generated by Django 4.0.1 on 2026-10-18 20:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bot', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TgChatState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tg_chat_id', models.BigIntegerField(unique=True)),
+                ('state', models.PositiveSmallIntegerField(verbose_name='Этап')),
+                ('category_id', models.IntegerField(null=True, verbose_name='Категория')),
+                ('expires', models.DateTimeField(db_index=True, verbose_name='Срок действия')),
+            ],
+            options={
+                'verbose_name': 'Состояние чата',
+                'verbose_name_plural': 'Состояния чатов',
+            },
+        ),
+    ]
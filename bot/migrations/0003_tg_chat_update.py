@@ -0,0 +1,25 @@
+# Generated by Django 4.0.1 on 2026-10-18 21:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bot', '0002_tg_chat_state'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TgChatUpdate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tg_chat_id', models.BigIntegerField(unique=True)),
+                ('update_id', models.BigIntegerField(verbose_name='Последнее обновление')),
+            ],
+            options={
+                'verbose_name': 'Обновление чата',
+                'verbose_name_plural': 'Обновления чатов',
+            },
+        ),
+    ]
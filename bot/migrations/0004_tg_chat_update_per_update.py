@@ -0,0 +1,34 @@
+# Generated by Django 4.0.1 on 2026-10-18 22:10
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bot', '0003_tg_chat_update'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='tgchatupdate',
+            name='tg_chat_id',
+            field=models.BigIntegerField(),
+        ),
+        migrations.AlterField(
+            model_name='tgchatupdate',
+            name='update_id',
+            field=models.BigIntegerField(verbose_name='Обновление'),
+        ),
+        migrations.AddField(
+            model_name='tgchatupdate',
+            name='created',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now, verbose_name='Дата обработки'),
+            preserve_default=False,
+        ),
+        migrations.AddConstraint(
+            model_name='tgchatupdate',
+            constraint=models.UniqueConstraint(fields=('tg_chat_id', 'update_id'), name='bot_tgchatupdate_unique_update'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.0.1 on 2026-10-18 22:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+# Ссылки на категории, удаленные за время диалога, обнуляются до создания внешнего ключа
+CLEAR_DANGLING = """
+UPDATE bot_tgchatstate SET category_id = NULL
+WHERE category_id IS NOT NULL AND category_id NOT IN (SELECT id FROM goals_goalcategory);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0019_backfill_change_seq'),
+        ('bot', '0004_tg_chat_update_per_update'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CLEAR_DANGLING, migrations.RunSQL.noop),
+        # Колонка category_id остается той же, меняется только ее тип; состояние модели
+        # сразу получает внешний ключ без ограничения, а ограничение и индекс добавляет AlterField
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    "ALTER TABLE bot_tgchatstate ALTER COLUMN category_id TYPE bigint",
+                    "ALTER TABLE bot_tgchatstate ALTER COLUMN category_id TYPE integer",
+                ),
+            ],
+            state_operations=[
+                migrations.RemoveField(
+                    model_name='tgchatstate',
+                    name='category_id',
+                ),
+                migrations.AddField(
+                    model_name='tgchatstate',
+                    name='category',
+                    field=models.ForeignKey(db_constraint=False, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='goals.goalcategory', verbose_name='Категория'),
+                ),
+            ],
+        ),
+        migrations.AlterField(
+            model_name='tgchatstate',
+            name='category',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='goals.goalcategory', verbose_name='Категория'),
+        ),
+    ]
@@ -1,4 +1,8 @@
-from django.db import models
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, models
+from django.utils import timezone
 from django.utils.crypto import get_random_string
 
 
@@ -29,3 +33,67 @@ class TgUser(models.Model):
         self.verification_code = code
         self.save()
         return code
+
+
+class TgChatState(models.Model):
+    """
+    Модель класса TgChatState - состояние диалога чата для хранилища DBStateStore
+    ------
+    tg_chat_id : int
+    state : int
+    category : int
+    expires : str
+    """
+    class Meta:
+        verbose_name = "Состояние чата"
+        verbose_name_plural = "Состояния чатов"
+
+    tg_chat_id = models.BigIntegerField(unique=True)
+    state = models.PositiveSmallIntegerField(verbose_name="Этап")
+    # Если категорию удалят за время диалога, ссылка обнуляется, а не остается висячей
+    category = models.ForeignKey(
+        'goals.GoalCategory', verbose_name="Категория", on_delete=models.SET_NULL, null=True, related_name='+'
+    )
+    expires = models.DateTimeField(verbose_name="Срок действия", db_index=True)
+
+
+class TgChatUpdate(models.Model):
+    """
+    Модель класса TgChatUpdate - обновление чата, обработанное по вебхуку
+    ------
+    tg_chat_id : int
+    update_id : int
+    created : str
+    """
+    class Meta:
+        verbose_name = "Обновление чата"
+        verbose_name_plural = "Обновления чатов"
+        constraints = [
+            models.UniqueConstraint(fields=["tg_chat_id", "update_id"], name="bot_tgchatupdate_unique_update"),
+        ]
+
+    tg_chat_id = models.BigIntegerField()
+    update_id = models.BigIntegerField(verbose_name="Обновление")
+    created = models.DateTimeField(verbose_name="Дата обработки", db_index=True)
+
+    @classmethod
+    def register(cls, chat_id: int, update_id: int) -> bool:
+        """
+        Метод для отметки обновления чата обработанным одной вставкой.
+        Возвращает False, если это обновление уже обработано; обновления с меньшим id,
+        пришедшие позже (повтор после ошибки или доставка не по порядку), обрабатываются
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {cls._meta.db_table} (tg_chat_id, update_id, created) VALUES (%s, %s, %s) "
+                f"ON CONFLICT (tg_chat_id, update_id) DO NOTHING RETURNING id",
+                [chat_id, update_id, timezone.now()],
+            )
+            return cursor.fetchone() is not None
+
+    @classmethod
+    def clear_expired(cls) -> int:
+        """ Метод для удаления отметок старше BOT_UPDATE_TTL: Telegram столько обновление не повторяет """
+        expires = timezone.now() - timedelta(seconds=settings.BOT_UPDATE_TTL)
+        deleted, _ = cls.objects.filter(created__lt=expires).delete()
+        return deleted
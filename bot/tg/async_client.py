@@ -0,0 +1,82 @@
+import asyncio
+import time
+
+import aiohttp
+
+from bot.tg.client import BaseTgClient, TgClientError
+from bot.tg.dc import GetUpdatesResponse, SendMessageResponse, GET_UPDATES_SCHEMA, SEND_MESSAGE_RESPONSE_SCHEMA
+
+
+class AsyncTgClient(BaseTgClient):
+    """
+    Класс асинхронного телеграмм-клиента с теми же методами, что у TgClient.
+    Запросы идут через aiohttp.ClientSession с пулом из не более pool_size keep-alive соединений,
+    поэтому тысячи корутин могут отправлять сообщения одновременно, не занимая потоков;
+    корутины сверх пула ждут свободного соединения. Повторы, паузы и счетчики такие же,
+    как у синхронного клиента
+    """
+    def __init__(self, token, api_url: str = "https://api.telegram.org", pool_size: int = 100, **options):
+        super().__init__(token, api_url, **options)
+        self.pool_size = pool_size
+        self.session: aiohttp.ClientSession | None = None
+        self.sleep = asyncio.sleep
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """ Метод для получения сессии; она создается в работающем цикле событий, как требует aiohttp """
+        if self.session is None:
+            self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self.pool_size))
+        return self.session
+
+    async def get_updates(self, offset: int = 0, timeout: int = 60) -> GetUpdatesResponse:
+        data = await self.request(
+            'getUpdates', {"offset": offset, "timeout": timeout}, read_timeout=timeout + self.read_timeout
+        )
+        return GET_UPDATES_SCHEMA.load(data)
+
+    async def send_message(self, chat_id: int, text: str) -> SendMessageResponse:
+        # Повтор после таймаута чтения мог бы отправить сообщение дважды
+        data = await self.request('sendMessage', {"chat_id": chat_id, "text": text}, retry_read_timeout=False)
+        return SEND_MESSAGE_RESPONSE_SCHEMA.load(data)
+
+    async def request(
+        self, method: str, params: dict, read_timeout: float | None = None, retry_read_timeout: bool = True
+    ) -> dict:
+        """ Метод для вызова метода API с повторами, возвращает тело ответа """
+        # Ожидание свободного соединения пула не ограничено: его задает нагрузка, а не сеть
+        timeout = aiohttp.ClientTimeout(
+            total=None, sock_connect=self.connect_timeout, sock_read=read_timeout or self.read_timeout
+        )
+        for attempt in range(self.retries + 1):
+            last_attempt = attempt == self.retries
+            start = time.perf_counter()
+            try:
+                async with self.get_session().get(self.get_url(method), params=params, timeout=timeout) as response:
+                    status, body = response.status, await response.read()
+                    retry_after_header = response.headers.get('Retry-After')
+            # До Python 3.11 asyncio.TimeoutError - не встроенный TimeoutError, поэтому перехватывается явно
+            except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+                self.record(method, time.perf_counter() - start, error=True, retry=not last_attempt)
+                read_timeout_error = isinstance(error, asyncio.TimeoutError) and not isinstance(
+                    error, aiohttp.ConnectionTimeoutError
+                )
+                if last_attempt or (read_timeout_error and not retry_read_timeout):
+                    raise TgClientError(f"{method}: {error!r}") from error
+                await self.sleep(self.get_delay(attempt))
+                continue
+
+            retry = status in self.retry_statuses
+            self.record(method, time.perf_counter() - start, error=retry, retry=retry and not last_attempt)
+            data = self.load_body(body)
+            if not retry:
+                if data is None:
+                    raise TgClientError(f"{method}: HTTP {status} without JSON body")
+                return data
+            if last_attempt:
+                raise TgClientError(f"{method}: HTTP {status}")
+            await self.sleep(self.get_delay(attempt, self.get_retry_after(data, retry_after_header)))
+
+    async def close(self) -> None:
+        """ Метод для закрытия соединений пула """
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
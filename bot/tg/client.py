@@ -1,22 +1,186 @@
+import json
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass
+
 import requests
+from requests.adapters import HTTPAdapter
+
+from bot.tg.dc import (
+    GetUpdatesResponse, SendMessageResponse, WebhookResponse,
+    GET_UPDATES_SCHEMA, SEND_MESSAGE_RESPONSE_SCHEMA, WEBHOOK_RESPONSE_SCHEMA,
+)
+
+
+class TgClientError(Exception):
+    """ Ошибка обращения к Telegram API после исчерпания повторных попыток """
+
 
-from bot.tg.dc import GetUpdatesResponse, SendMessageResponse, GET_UPDATES_SCHEMA, SEND_MESSAGE_RESPONSE_SCHEMA
+@dataclass
+class MethodStats:
+    """ Счетчики вызовов одного метода Telegram API """
+    calls: int = 0
+    errors: int = 0
+    retries: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
 
+    @property
+    def latency_avg(self) -> float:
+        return self.latency_total / self.calls if self.calls else 0.0
 
-class TgClient:
-    """ Класс телеграмм-клиента для обращения в Telegram API """
-    def __init__(self, token):
+
+class BaseTgClient:
+    """
+    Общая часть синхронного и асинхронного телеграмм-клиентов: адреса методов,
+    паузы между повторами и счетчики вызовов по методам
+    """
+    retry_statuses = (429, 500, 502, 503, 504)
+
+    def __init__(
+        self,
+        token,
+        api_url: str = "https://api.telegram.org",
+        connect_timeout: float = 3.05,
+        read_timeout: float = 10,
+        retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30,
+    ):
         self.token = token
+        self.api_url = api_url
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.stats: dict[str, MethodStats] = {}
+        self.stats_lock = threading.Lock()
 
     def get_url(self, method: str):
-        return f"https://api.telegram.org/bot{self.token}/{method}"
+        return f"{self.api_url}/bot{self.token}/{method}"
+
+    def get_delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """ Метод для расчета паузы перед повтором: retry_after Telegram или full jitter backoff """
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    @staticmethod
+    def load_body(body: bytes) -> dict | None:
+        """ Метод для разбора JSON-тела ответа, для не-JSON ответов возвращает None """
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return None
+        return data if isinstance(data, dict) else None
+
+    @staticmethod
+    def get_retry_after(data: dict | None, header: str | None) -> float | None:
+        """ Метод для получения retry_after из тела ответа 429 или заголовка Retry-After """
+        retry_after = (data or {}).get('parameters', {}).get('retry_after')
+        if retry_after is None:
+            retry_after = header
+        try:
+            return float(retry_after) if retry_after is not None else None
+        except ValueError:
+            return None
+
+    def record(self, method: str, latency: float, error: bool = False, retry: bool = False) -> None:
+        """ Метод для учета одной попытки вызова метода """
+        with self.stats_lock:
+            stats = self.stats.setdefault(method, MethodStats())
+            stats.calls += 1
+            stats.errors += error
+            stats.retries += retry
+            stats.latency_total += latency
+            stats.latency_max = max(stats.latency_max, latency)
+
+    def get_stats(self) -> dict[str, dict]:
+        """ Метод для получения копии счетчиков по методам, со средней задержкой """
+        with self.stats_lock:
+            return {
+                method: {**asdict(stats), 'latency_avg': stats.latency_avg} for method, stats in self.stats.items()
+            }
+
+
+class TgClient(BaseTgClient):
+    """
+    Класс телеграмм-клиента для обращения в Telegram API.
+    Запросы идут через одну сессию с пулом keep-alive соединений, поэтому клиент можно
+    использовать из нескольких потоков. Ответы 429 и 5xx и ошибки соединения повторяются
+    с экспоненциальной задержкой со случайной составляющей, а при 429 - через retry_after
+    из ответа Telegram. Таймаут чтения getUpdates считается от таймаута long polling
+    """
+    def __init__(self, token, api_url: str = "https://api.telegram.org", pool_size: int = 16, **options):
+        super().__init__(token, api_url, **options)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.sleep = time.sleep
 
     def get_updates(self, offset: int = 0, timeout: int = 60) -> GetUpdatesResponse:
-        url = self.get_url('getUpdates')
-        response = requests.get(url, params={"offset": offset, "timeout": timeout})
-        return GET_UPDATES_SCHEMA.load(response.json())
+        data = self.request(
+            'getUpdates', {"offset": offset, "timeout": timeout}, read_timeout=timeout + self.read_timeout
+        )
+        return GET_UPDATES_SCHEMA.load(data)
 
     def send_message(self, chat_id: int, text: str) -> SendMessageResponse:
-        url = self.get_url('sendMessage')
-        response = requests.get(url, params={"chat_id": chat_id, "text": text})
-        return SEND_MESSAGE_RESPONSE_SCHEMA.load(response.json())
+        # Повтор после таймаута чтения мог бы отправить сообщение дважды
+        data = self.request('sendMessage', {"chat_id": chat_id, "text": text}, retry_read_timeout=False)
+        return SEND_MESSAGE_RESPONSE_SCHEMA.load(data)
+
+    def set_webhook(
+        self, url: str, secret_token: str, max_connections: int | None = None, drop_pending_updates: bool = False
+    ) -> WebhookResponse:
+        params = {
+            "url": url,
+            "secret_token": secret_token,
+            # Бот обрабатывает только сообщения, остальные обновления Telegram не присылает
+            "allowed_updates": json.dumps(["message"]),
+            "drop_pending_updates": json.dumps(drop_pending_updates),
+        }
+        if max_connections is not None:
+            params["max_connections"] = max_connections
+        return WEBHOOK_RESPONSE_SCHEMA.load(self.request('setWebhook', params))
+
+    def delete_webhook(self, drop_pending_updates: bool = False) -> WebhookResponse:
+        data = self.request('deleteWebhook', {"drop_pending_updates": json.dumps(drop_pending_updates)})
+        return WEBHOOK_RESPONSE_SCHEMA.load(data)
+
+    def request(
+        self, method: str, params: dict, read_timeout: float | None = None, retry_read_timeout: bool = True
+    ) -> dict:
+        """ Метод для вызова метода API с повторами, возвращает тело ответа """
+        timeout = (self.connect_timeout, read_timeout or self.read_timeout)
+        for attempt in range(self.retries + 1):
+            last_attempt = attempt == self.retries
+            start = time.perf_counter()
+            try:
+                response = self.session.get(self.get_url(method), params=params, timeout=timeout)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                self.record(method, time.perf_counter() - start, error=True, retry=not last_attempt)
+                read_timeout_error = isinstance(error, requests.ReadTimeout)
+                if last_attempt or (read_timeout_error and not retry_read_timeout):
+                    raise TgClientError(f"{method}: {error}") from error
+                self.sleep(self.get_delay(attempt))
+                continue
+
+            retry = response.status_code in self.retry_statuses
+            self.record(method, time.perf_counter() - start, error=retry, retry=retry and not last_attempt)
+            data = self.load_body(response.content)
+            if not retry:
+                # HTML-страница или пустое тело от прокси - ошибка клиента, а не исключение разбора JSON
+                if data is None:
+                    raise TgClientError(f"{method}: HTTP {response.status_code} without JSON body")
+                return data
+            if last_attempt:
+                raise TgClientError(f"{method}: HTTP {response.status_code}")
+            retry_after = self.get_retry_after(data, response.headers.get('Retry-After'))
+            self.sleep(self.get_delay(attempt, retry_after))
+
+    def close(self) -> None:
+        """ Метод для закрытия соединений пула """
+        self.session.close()
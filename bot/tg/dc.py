@@ -71,5 +71,17 @@ class SendMessageResponse:
         unknown = EXCLUDE
 
 
+@dataclass
+class WebhookResponse:
+    ok: bool
+    result: bool | None = None
+    description: str | None = None
+
+    class Meta:
+        unknown = EXCLUDE
+
+
+UPDATE_SCHEMA = class_schema(UpdateObj)()
 GET_UPDATES_SCHEMA = class_schema(GetUpdatesResponse)()
 SEND_MESSAGE_RESPONSE_SCHEMA = class_schema(SendMessageResponse)()
+WEBHOOK_RESPONSE_SCHEMA = class_schema(WebhookResponse)()
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import close_old_connections, connections
+
+logger = logging.getLogger(__name__)
+
+
+def close_pool_connections(executor: ThreadPoolExecutor, workers: int) -> None:
+    """ Функция для закрытия соединений с БД во всех потоках пула и остановки пула """
+    # Задачи ждут друг друга на барьере, поэтому каждая выполняется в своем потоке пула
+    barrier = threading.Barrier(workers)
+
+    def close_connections():
+        connections.close_all()
+        barrier.wait()
+
+    for _ in range(workers):
+        executor.submit(close_connections)
+    executor.shutdown(wait=True)
+
+
+class ChatDispatcher:
+    """
+    Класс для параллельной обработки обновлений телеграмм-бота.
+    Обновления одного чата обрабатываются строго по порядку, разные чаты - параллельно
+    в пуле из workers потоков. Задача пула обрабатывает одно обновление и, если у чата
+    есть еще, ставит себя в конец очереди пула, поэтому занятый чат не занимает поток надолго.
+    Не больше max_pending обновлений могут ждать обработки: submit блокируется,
+    пока потоки не освободятся, и цикл опроса Telegram останавливается вместе с ним
+    """
+    def __init__(self, handler, workers: int = 8, max_pending: int = 100):
+        self.handler = handler
+        self.workers = workers
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='tg-dispatcher')
+        self.slots = threading.BoundedSemaphore(max_pending)
+        self.lock = threading.Condition()
+        self.queues: dict[int, deque] = {}
+
+    def submit(self, chat_id: int, item, timeout: float | None = None) -> bool:
+        """
+        Метод для постановки обновления чата в очередь.
+        Ждет свободного места не дольше timeout секунд и возвращает False, если не дождался
+        """
+        if not self.slots.acquire(timeout=timeout):
+            return False
+        with self.lock:
+            queue = self.queues.get(chat_id)
+            if queue is not None:
+                # Чат уже обрабатывается, обновление заберет та же цепочка задач
+                queue.append(item)
+                return True
+            self.queues[chat_id] = deque([item])
+        self.executor.submit(self.process, chat_id)
+        return True
+
+    def process(self, chat_id: int) -> None:
+        """ Метод задачи пула: обработка следующего обновления чата """
+        with self.lock:
+            item = self.queues[chat_id][0]
+        close_old_connections()
+        try:
+            self.handler(item)
+        except Exception:
+            logger.exception("Failed to handle update of chat %s", chat_id)
+        finally:
+            self.slots.release()
+            with self.lock:
+                queue = self.queues[chat_id]
+                queue.popleft()
+                has_more = bool(queue)
+                if not has_more:
+                    del self.queues[chat_id]
+                    self.lock.notify_all()
+            if has_more:
+                self.executor.submit(self.process, chat_id)
+
+    def shutdown(self) -> None:
+        """ Метод для остановки: ожидает обработки всех принятых обновлений и закрывает соединения с БД потоков """
+        with self.lock:
+            self.lock.wait_for(lambda: not self.queues)
+        close_pool_connections(self.executor, self.workers)
+
+
+class AsyncChatDispatcher:
+    """
+    Класс для конкурентной обработки обновлений телеграмм-бота в asyncio.
+    Как и в ChatDispatcher, обновления одного чата обрабатываются по порядку, а разные
+    чаты - одновременно: на каждый чат с необработанными обновлениями заводится задача,
+    которая разбирает его очередь. handler - корутинная функция. Не больше max_pending
+    обновлений могут ждать обработки, submit ждет, пока место не освободится
+    """
+    def __init__(self, handler, max_pending: int = 1000):
+        self.handler = handler
+        self.slots = asyncio.Semaphore(max_pending)
+        self.queues: dict[int, deque] = {}
+        self.tasks: set[asyncio.Task] = set()
+        self.idle = asyncio.Event()
+        self.idle.set()
+
+    async def submit(self, chat_id: int, item) -> None:
+        """ Метод для постановки обновления чата в очередь """
+        await self.slots.acquire()
+        queue = self.queues.get(chat_id)
+        if queue is not None:
+            queue.append(item)
+            return
+        self.queues[chat_id] = deque([item])
+        self.idle.clear()
+        # Ссылка на задачу хранится до ее завершения, иначе ее может собрать сборщик мусора
+        task = asyncio.create_task(self.process(chat_id))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def process(self, chat_id: int) -> None:
+        """ Метод задачи чата: обработка обновлений, пока очередь чата не опустеет """
+        queue = self.queues[chat_id]
+        while queue:
+            try:
+                await self.handler(queue[0])
+            except Exception:
+                logger.exception("Failed to handle update of chat %s", chat_id)
+            finally:
+                queue.popleft()
+                self.slots.release()
+        del self.queues[chat_id]
+        if not self.queues:
+            self.idle.set()
+
+    async def shutdown(self) -> None:
+        """ Метод для остановки: ожидает обработки всех принятых обновлений """
+        await self.idle.wait()
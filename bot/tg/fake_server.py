@@ -0,0 +1,189 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+
+class FakeTelegramHandler(BaseHTTPRequestHandler):
+    """ Обработчик HTTP-запросов к FakeTelegramServer в формате Telegram Bot API """
+    server: 'FakeTelegramHTTPServer'
+    # Соединения остаются открытыми между запросами, как у api.telegram.org;
+    # без Nagle заголовки и тело ответа не ждут подтверждения клиента
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.respond(dict(parse_qsl(urlsplit(self.path).query)))
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        if self.headers.get('Content-Type', '').startswith('application/json'):
+            params = json.loads(body or b'{}')
+        else:
+            params = dict(parse_qsl(body.decode()))
+        self.respond({**dict(parse_qsl(urlsplit(self.path).query)), **params})
+
+    def respond(self, params: dict) -> None:
+        """ Метод для вызова метода API по последней части пути /bot<token>/<method> """
+        method = urlsplit(self.path).path.rsplit('/', 1)[-1]
+        status, data = self.server.telegram.call(method, params)
+        # Байты отдаются как есть, например HTML-страница ошибки прокси
+        raw = isinstance(data, bytes)
+        payload = data if raw else json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html' if raw else 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeTelegramHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Очередь соединений по умолчанию (5) мала для параллельных клиентов бенчмарка
+    request_queue_size = 1024
+
+    def __init__(self, telegram: 'FakeTelegramServer'):
+        super().__init__(('127.0.0.1', 0), FakeTelegramHandler)
+        self.telegram = telegram
+
+
+class FakeTelegramServer:
+    """
+    Класс локального сервера, имитирующего Telegram Bot API для тестов и бенчмарков.
+    Поддерживает long polling getUpdates с подтверждением через offset и sendMessage
+    с задержкой latency секунд; отправленные сообщения сохраняются в sent.
+    Ошибки следующих вызовов метода задаются через fail_next. Как и Telegram,
+    при установленном вебхуке (setWebhook) getUpdates отвечает 409
+    """
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.updates: list[dict] = []
+        self.sent: list[dict] = []
+        self.calls: list[str] = []
+        self.failures: dict[str, list[tuple[int, int | None]]] = {}
+        self.webhook: dict | None = None
+        self.condition = threading.Condition()
+        self.next_update_id = 1
+        self.http = FakeTelegramHTTPServer(self)
+        self.thread = threading.Thread(target=self.http.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.http.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        with self.condition:
+            self.condition.notify_all()
+        self.http.shutdown()
+        self.http.server_close()
+
+    @staticmethod
+    def make_message(chat_id: int, text: str, message_id: int = 1, user_id: int | None = None) -> dict:
+        """ Метод для построения сообщения в формате Telegram """
+        return {
+            'message_id': message_id,
+            'from': {
+                'id': user_id or chat_id, 'is_bot': False, 'first_name': 'Test', 'last_name': None,
+                'username': f"user{user_id or chat_id}",
+            },
+            'chat': {
+                'id': chat_id, 'first_name': 'Test', 'last_name': None, 'username': f"user{chat_id}",
+                'type': 'private', 'title': None,
+            },
+            'date': int(time.time()),
+            'text': text,
+        }
+
+    def add_message(self, chat_id: int, text: str, user_id: int | None = None) -> dict:
+        """ Метод для добавления входящего сообщения в очередь getUpdates """
+        with self.condition:
+            update = {
+                'update_id': self.next_update_id,
+                'message': self.make_message(chat_id, text, self.next_update_id, user_id),
+            }
+            self.next_update_id += 1
+            self.updates.append(update)
+            self.condition.notify_all()
+        return update
+
+    def fail_next(self, method: str, status: int = 500, retry_after: int | None = None, count: int = 1) -> None:
+        """ Метод для ответа ошибкой status на следующие count вызовов метода """
+        with self.condition:
+            self.failures.setdefault(method, []).extend([(status, retry_after)] * count)
+
+    def call(self, method: str, params: dict) -> tuple[int, dict]:
+        """ Метод для выполнения метода API, возвращает статус ответа и тело """
+        with self.condition:
+            self.calls.append(method)
+            failures = self.failures.get(method)
+            failure = failures.pop(0) if failures else None
+        if failure is not None:
+            status, retry_after = failure
+            data = {'ok': False, 'error_code': status, 'description': 'Fake error'}
+            if retry_after is not None:
+                data['parameters'] = {'retry_after': retry_after}
+            return status, data
+        handler = getattr(self, f"api_{method}", None)
+        if handler is None:
+            return 404, {'ok': False, 'error_code': 404, 'description': 'Not Found'}
+        return handler(params)
+
+    def api_getUpdates(self, params: dict) -> tuple[int, dict]:
+        if self.webhook is not None:
+            return 409, {
+                'ok': False, 'error_code': 409,
+                'description': "Conflict: can't use getUpdates method while webhook is active",
+            }
+        offset = int(params.get('offset') or 0)
+        limit = int(params.get('limit') or 100)
+        deadline = time.monotonic() + float(params.get('timeout') or 0)
+        with self.condition:
+            # Обновления с id меньше offset считаются подтвержденными и удаляются
+            self.updates = [update for update in self.updates if update['update_id'] >= offset]
+            while not self.updates and time.monotonic() < deadline and self.thread.is_alive():
+                self.condition.wait(min(deadline - time.monotonic(), 0.1))
+            result = self.updates[:limit]
+        return 200, {'ok': True, 'result': result}
+
+    def api_sendMessage(self, params: dict) -> tuple[int, dict]:
+        if self.latency:
+            time.sleep(self.latency)
+        chat_id, text = int(params['chat_id']), params['text']
+        with self.condition:
+            self.sent.append({'chat_id': chat_id, 'text': text})
+            message_id = len(self.sent)
+            self.condition.notify_all()
+        return 200, {'ok': True, 'result': self.make_message(chat_id, text, message_id)}
+
+    def api_setWebhook(self, params: dict) -> tuple[int, dict]:
+        if not params.get('url', '').startswith('https://'):
+            return 400, {
+                'ok': False, 'error_code': 400,
+                'description': 'Bad Request: bad webhook: HTTPS url must be provided for webhook',
+            }
+        with self.condition:
+            self.webhook = params
+            if params.get('drop_pending_updates') == 'true':
+                self.updates = []
+        return 200, {'ok': True, 'result': True, 'description': 'Webhook was set'}
+
+    def api_deleteWebhook(self, params: dict) -> tuple[int, dict]:
+        with self.condition:
+            self.webhook = None
+            if params.get('drop_pending_updates') == 'true':
+                self.updates = []
+        return 200, {'ok': True, 'result': True, 'description': 'Webhook was deleted'}
+
+    def wait_sent(self, count: int, timeout: float = 10) -> bool:
+        """ Метод для ожидания count отправленных сообщений """
+        with self.condition:
+            return self.condition.wait_for(lambda: len(self.sent) >= count, timeout)
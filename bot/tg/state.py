@@ -0,0 +1,154 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from bot.models import TgChatState
+
+
+class TgState:
+    """ Кдасс для отслеживания этапов создания целей """
+    DEFAULT = 0
+    CATEGORY_CHOOSE = 1
+    GOAL_CREATE = 2
+
+    def __init__(self, state=DEFAULT, category_id=None):
+        self.state = state
+        self.category_id = category_id
+
+    def set_state(self, state):
+        """ Метод задающий этап создания цели """
+        self.state = state
+
+    def set_category_id(self, category_id):
+        """ Метод присваения категории для цели """
+        self.category_id = category_id
+
+    @property
+    def is_default(self) -> bool:
+        """ Свойство, показывающее, что чат не находится в процессе создания цели """
+        return self.state == self.DEFAULT and self.category_id is None
+
+
+class BaseStateStore(ABC):
+    """
+    Базовый класс хранилища состояний диалогов бота по id чата.
+    Состояние, не менявшееся дольше ttl секунд, считается брошенным и сбрасывается;
+    состояние по умолчанию не хранится
+    """
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+
+    @abstractmethod
+    def get(self, chat_id: int) -> TgState:
+        """ Метод для получения состояния чата """
+
+    @abstractmethod
+    def set(self, chat_id: int, state: TgState) -> None:
+        """ Метод для сохранения состояния чата """
+
+    def clear_expired(self) -> int:
+        """ Метод для удаления истекших состояний; в памяти и в кеше они истекают сами """
+        return 0
+
+
+class MemoryStateStore(BaseStateStore):
+    """ Хранилище в памяти процесса: не больше max_size чатов, давно не использованные вытесняются """
+    def __init__(self, ttl: int, max_size: int = 10_000):
+        super().__init__(ttl)
+        self.max_size = max_size
+        self.lock = threading.Lock()
+        self.states: OrderedDict[int, tuple[float, int, int | None]] = OrderedDict()
+
+    def get(self, chat_id):
+        with self.lock:
+            expires, state, category_id = self.states.get(chat_id, (0, TgState.DEFAULT, None))
+            if expires < time.monotonic():
+                self.states.pop(chat_id, None)
+                return TgState()
+            self.states.move_to_end(chat_id)
+        return TgState(state, category_id)
+
+    def set(self, chat_id, state):
+        with self.lock:
+            if state.is_default:
+                self.states.pop(chat_id, None)
+                return
+            self.states[chat_id] = (time.monotonic() + self.ttl, state.state, state.category_id)
+            self.states.move_to_end(chat_id)
+            while len(self.states) > self.max_size:
+                self.states.popitem(last=False)
+
+
+class CacheStateStore(BaseStateStore):
+    """ Хранилище в кеше Django, общее для процессов при общем бэкенде кеша; TTL задается таймаутом ключа """
+    key_prefix = 'bot:state'
+
+    def __init__(self, ttl: int, cache_alias: str = 'default'):
+        super().__init__(ttl)
+        self.cache = caches[cache_alias]
+
+    def get_key(self, chat_id: int) -> str:
+        return f"{self.key_prefix}:{chat_id}"
+
+    def get(self, chat_id):
+        value = self.cache.get(self.get_key(chat_id))
+        return TgState(*value) if value is not None else TgState()
+
+    def set(self, chat_id, state):
+        if state.is_default:
+            self.cache.delete(self.get_key(chat_id))
+        else:
+            self.cache.set(self.get_key(chat_id), (state.state, state.category_id), self.ttl)
+
+
+class DBStateStore(BaseStateStore):
+    """
+    Хранилище в таблице TgChatState, общее для процессов; истекшие строки удаляет clear_expired,
+    который периодически вызывает runbot, а при работе через вебхук - команда clear_bot_states
+    """
+    def get(self, chat_id):
+        row = TgChatState.objects.filter(tg_chat_id=chat_id, expires__gt=timezone.now()).first()
+        return TgState(row.state, row.category_id) if row else TgState()
+
+    def set(self, chat_id, state):
+        if state.is_default:
+            TgChatState.objects.filter(tg_chat_id=chat_id).delete()
+            return
+        TgChatState.objects.update_or_create(
+            tg_chat_id=chat_id,
+            defaults={
+                'state': state.state,
+                'category_id': state.category_id,
+                'expires': timezone.now() + timedelta(seconds=self.ttl),
+            },
+        )
+
+    @staticmethod
+    def clear_expired() -> int:
+        """ Метод для удаления истекших состояний, возвращает количество удаленных """
+        deleted, _ = TgChatState.objects.filter(expires__lte=timezone.now()).delete()
+        return deleted
+
+
+STATE_STORES = {
+    'memory': MemoryStateStore,
+    'cache': CacheStateStore,
+    'db': DBStateStore,
+}
+
+
+def get_state_store() -> BaseStateStore:
+    """
+    Функция для создания хранилища состояний по настройке BOT_STATE_STORE:
+    memory, cache, db или путь к своему классу хранилища
+    """
+    name = getattr(settings, 'BOT_STATE_STORE', 'memory')
+    store_class = STATE_STORES.get(name) or import_string(name)
+    return store_class(ttl=getattr(settings, 'BOT_STATE_TTL', 3600))
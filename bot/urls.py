@@ -3,4 +3,5 @@ from bot import views
 
 urlpatterns = [
     path("virify", views.BotVerifyView.as_view()),
+    path("webhook", views.BotWebhookView.as_view()),
 ]
\ No newline at end of file
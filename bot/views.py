@@ -1,11 +1,26 @@
+import hmac
+import logging
+
+from django.conf import settings
+from django.db import connection, transaction
+from marshmallow import ValidationError
 from rest_framework import status
 from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.views import APIView
 
-from bot.models import TgUser
+from bot.management.commands.runbot import Command as BotCommand
+from bot.models import TgChatUpdate, TgUser
 from bot.serializers import TgUserSerializer
 from bot.tg.client import TgClient
+from bot.tg.dc import UPDATE_SCHEMA
+
+logger = logging.getLogger(__name__)
+
+# Первый ключ двухключевых advisory-блокировок чатов бота, чтобы они не пересекались
+# с блокировками по одному bigint-ключу; второй ключ - хеш id чата
+CHAT_LOCK_CLASS = 7467
 
 
 class BotVerifyView(GenericAPIView):
@@ -29,3 +44,51 @@ class BotVerifyView(GenericAPIView):
             text='Успешно'
         )
         return Response(data=data, status=status.HTTP_201_CREATED)
+
+
+class BotWebhookView(APIView):
+    """
+    Вьюшка для приема обновлений Telegram по вебхуку.
+    Запрос принимается только с секретом BOT_WEBHOOK_SECRET в заголовке X-Telegram-Bot-Api-Secret-Token.
+    Сообщение обрабатывается той же логикой, что и в runbot; последний ответ возвращается
+    в теле ответа на вебхук, и Telegram отправляет его сам, без отдельного вызова sendMessage.
+    Telegram повторяет обновление, если не дождался ответа, поэтому обработанные
+    update_id чатов отмечаются в TgChatUpdate, и повторы пропускаются
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    http_method_names = ['post']
+    bot = BotCommand()
+
+    def post(self, request, *args, **kwargs):
+        """ Метод для обработки обновления Telegram """
+        secret = settings.BOT_WEBHOOK_SECRET
+        received = request.headers.get('X-Telegram-Bot-Api-Secret-Token', '')
+        if not secret or not hmac.compare_digest(received.encode(), secret.encode()):
+            return Response(status=status.HTTP_403_FORBIDDEN)
+        if 'message' not in request.data:
+            return Response(status=status.HTTP_200_OK)
+        try:
+            update = UPDATE_SCHEMA.load(request.data)
+        except ValidationError:
+            return Response(status=status.HTTP_400_BAD_REQUEST)
+        msg = update.message
+
+        try:
+            with transaction.atomic():
+                # Telegram доставляет обновления параллельно по нескольким соединениям, блокировка
+                # по id чата не дает двум сообщениям одного чата одновременно менять его состояние
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT pg_advisory_xact_lock(%s, hashtext(%s::text))", [CHAT_LOCK_CLASS, msg.chat.id]
+                    )
+                if not TgChatUpdate.register(msg.chat.id, update.update_id):
+                    return Response(status=status.HTTP_200_OK)
+                replies = self.bot.process_message(msg)
+            for text in replies[:-1]:
+                self.bot.tg_client.send_message(chat_id=msg.chat.id, text=text)
+        except Exception:
+            # Ответ с ошибкой заставил бы Telegram повторять то же обновление
+            logger.exception("Failed to handle webhook update of chat %s", msg.chat.id)
+            return Response(status=status.HTTP_200_OK)
+        return Response({'method': 'sendMessage', 'chat_id': msg.chat.id, 'text': replies[-1]})
@@ -0,0 +1,50 @@
+from django.db import connection, transaction
+
+from goals.models import Goal, GoalComment
+from goals.signals import boards_changed
+
+
+def reconcile_batch(first_id: int, last_id: int) -> int:
+    """
+    Функция для исправления comment_count и last_activity_at целей с id в диапазоне [first_id, last_id].
+    Цели диапазона блокируются, поэтому одновременные комментарии дождутся пересчета
+    и применят свои F-выражения к уже исправленным значениям. Дата активности только
+    сдвигается вперед: удаление комментария ее не меняет. Возвращает количество исправленных целей
+    """
+    goal_table, comment_table = Goal._meta.db_table, GoalComment._meta.db_table
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT id FROM {goal_table} WHERE id BETWEEN %s AND %s ORDER BY id FOR UPDATE",
+            [first_id, last_id],
+        )
+        cursor.execute(
+            f"WITH actual AS ("
+            f"SELECT goal.id, count(comment.id) AS count, max(comment.updated) AS last_activity_at "
+            f"FROM {goal_table} AS goal LEFT JOIN {comment_table} AS comment ON comment.goal_id = goal.id "
+            f"WHERE goal.id BETWEEN %s AND %s GROUP BY goal.id"
+            f") "
+            f"UPDATE {goal_table} AS goal SET comment_count = actual.count, "
+            f"last_activity_at = GREATEST(goal.last_activity_at, actual.last_activity_at) "
+            f"FROM actual WHERE goal.id = actual.id AND (goal.comment_count <> actual.count "
+            f"OR goal.last_activity_at IS DISTINCT FROM GREATEST(goal.last_activity_at, actual.last_activity_at)) "
+            f"RETURNING goal.board_id",
+            [first_id, last_id],
+        )
+        board_ids = [board_id for board_id, in cursor.fetchall()]
+        if board_ids:
+            boards_changed.send(sender=Goal, board_ids=set(board_ids))
+    return len(board_ids)
+
+
+def reconcile_activity(batch_size: int = 10_000) -> int:
+    """
+    Функция для исправления расхождений счетчиков комментариев всех целей пачками по batch_size id,
+    каждая пачка в своей транзакции. Возвращает количество исправленных целей
+    """
+    bounds = Goal.objects.order_by('id').values_list('id', flat=True)
+    first_id, last_id = bounds.first(), bounds.last()
+    if first_id is None:
+        return 0
+    return sum(
+        reconcile_batch(start, start + batch_size - 1) for start in range(first_id, last_id + 1, batch_size)
+    )
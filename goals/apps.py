@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class GoalsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'goals'
+
+    def ready(self):
+        # Подключение обработчиков сигналов
+        from goals import cache, signals  # noqa: F401
@@ -0,0 +1,102 @@
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.dispatch import receiver
+
+from goals.models import BoardParticipant
+from goals.signals import boards_changed
+
+KEY_PREFIX = 'goals:list'
+STATS_KEYS = {
+    'hits': f'{KEY_PREFIX}:stats:hits',
+    'misses': f'{KEY_PREFIX}:stats:misses',
+}
+DUMMY_BACKEND = 'django.core.cache.backends.dummy.DummyCache'
+# Бэкенды, у которых у каждого процесса свой кеш
+PROCESS_LOCAL_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    DUMMY_BACKEND,
+)
+
+
+def list_cache_enabled() -> bool:
+    """
+    Функция для проверки, можно ли кешировать списки и строить ETag по версии кеша.
+    Версия сбрасывается через boards_changed в процессе, который пишет в БД, поэтому
+    кеш процесса подходит, пока писатель один. При GOALS_MULTIPLE_WRITERS (бот, board_deletions,
+    archive_goals, import_goals) сброс доходит до API только через общий кеш.
+    Dummy-кеш версий не хранит, с ним кеш списков выключен всегда
+    """
+    backend = settings.CACHES['default']['BACKEND']
+    if backend == DUMMY_BACKEND:
+        return False
+    return not settings.GOALS_MULTIPLE_WRITERS or backend not in PROCESS_LOCAL_BACKENDS
+
+
+def get_user_version_key(user_id: int) -> str:
+    return f'{KEY_PREFIX}:user:{user_id}'
+
+
+def get_user_version(user_id: int) -> str:
+    """ Функция для получения версии кеша пользователя, меняющейся при любом изменении его досок """
+    key = get_user_version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def get_list_cache_key(request, view_name: str, version: str) -> str:
+    """ Функция для построения ключа кеша по пользователю, его версии кеша, вьюшке и параметрам запроса """
+    params = sorted(request.query_params.lists())
+    raw = f'{request.get_host()}:{request.path}:{params}'
+    digest = hashlib.md5(raw.encode()).hexdigest()
+    return f'{KEY_PREFIX}:{view_name}:{request.user.id}:{version}:{digest}'
+
+
+def invalidate_users(user_ids) -> None:
+    """ Функция для сброса кеша списков пользователей сменой их версии """
+    if user_ids:
+        cache.set_many({get_user_version_key(user_id): uuid.uuid4().hex for user_id in user_ids}, timeout=None)
+
+
+def invalidate_boards(board_ids, user_ids=()) -> None:
+    """ Функция для сброса кеша списков всех участников досок """
+    user_ids = set(user_ids)
+    if board_ids:
+        user_ids.update(
+            BoardParticipant.objects.filter(board_id__in=board_ids).values_list('user_id', flat=True)
+        )
+    invalidate_users(user_ids)
+
+
+def record(stat: str) -> None:
+    """ Функция для увеличения счетчика попаданий или промахов """
+    key = STATS_KEYS[stat]
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        pass
+
+
+def get_stats() -> dict:
+    """ Функция для получения счетчиков попаданий и промахов кеша """
+    values = cache.get_many(STATS_KEYS.values())
+    return {'enabled': list_cache_enabled(), **{stat: values.get(key, 0) for stat, key in STATS_KEYS.items()}}
+
+
+@receiver(boards_changed)
+def invalidate_list_cache(sender, board_ids=(), user_ids=(), **kwargs):
+    """
+    Обработчик сброса кеша списков. Внутри транзакции кеш сбрасывается дважды:
+    сразу и после коммита, чтобы не закешировать данные, прочитанные до коммита
+    """
+    board_ids, user_ids = set(board_ids), set(user_ids)
+    invalidate_boards(board_ids, user_ids)
+    if connection.in_atomic_block:
+        transaction.on_commit(lambda: invalidate_boards(board_ids, user_ids))
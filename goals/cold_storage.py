@@ -0,0 +1,74 @@
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from goals.models import ArchivedGoal, ArchivedGoalComment, Goal, GoalComment
+from goals.signals import boards_changed
+
+GOAL_COLUMNS = (
+    'id', 'title', 'description', 'status', 'priority', 'due_date',
+    'user_id', 'category_id', 'board_id', 'created', 'updated', 'comment_count', 'last_activity_at',
+)
+COMMENT_COLUMNS = ('id', 'text', 'user_id', 'goal_id', 'board_id', 'created', 'updated')
+
+
+def move_rows(cursor, source, target, columns, key: str, ids: list, extra: dict | None = None) -> None:
+    """
+    Функция для переноса строк между таблицами одним запросом DELETE ... RETURNING + INSERT.
+    extra - значения дополнительных колонок таблицы назначения
+    """
+    extra = extra or {}
+    returning = ', '.join(columns)
+    target_columns = ', '.join([*columns, *extra])
+    placeholders = ''.join(', %s' for _ in extra)
+    cursor.execute(
+        f"WITH moved AS (DELETE FROM {source._meta.db_table} WHERE {key} = ANY(%s) RETURNING {returning}) "
+        f"INSERT INTO {target._meta.db_table} ({target_columns}) SELECT {returning}{placeholders} FROM moved",
+        [ids, *extra.values()],
+    )
+
+
+def archive_batch(days: int, batch_size: int) -> int:
+    """
+    Функция для переноса одной пачки целей, архивированных более days дней назад,
+    вместе с комментариями в холодное хранилище. Строки блокируются через SKIP LOCKED,
+    поэтому перенос можно запускать параллельно. Возвращает количество перенесенных целей
+    """
+    older_than = timezone.now() - timedelta(days=days)
+    with transaction.atomic():
+        goals = list(
+            Goal.objects.select_for_update(skip_locked=True)
+            .filter(status=Goal.Status.archived, updated__lt=older_than)
+            .order_by('updated')
+            .values_list('id', 'board_id')[:batch_size]
+        )
+        if not goals:
+            return 0
+        ids = [goal_id for goal_id, _ in goals]
+        with connection.cursor() as cursor:
+            move_rows(cursor, Goal, ArchivedGoal, GOAL_COLUMNS, 'id', ids, {'archived': timezone.now()})
+            move_rows(cursor, GoalComment, ArchivedGoalComment, COMMENT_COLUMNS, 'goal_id', ids)
+        boards_changed.send(sender=ArchivedGoal, board_ids={board_id for _, board_id in goals})
+    return len(goals)
+
+
+def restore_goals(ids) -> list[int]:
+    """
+    Функция для возврата целей с комментариями из холодного хранилища в goals_goal.
+    Цели сохраняют id и статус, дата обновления сбрасывается, чтобы цели
+    не попали в следующий перенос сразу после восстановления. Возвращает id восстановленных целей
+    """
+    with transaction.atomic():
+        goals = list(
+            ArchivedGoal.objects.select_for_update().filter(id__in=ids).values_list('id', 'board_id')
+        )
+        if not goals:
+            return []
+        ids = [goal_id for goal_id, _ in goals]
+        columns = tuple(column for column in GOAL_COLUMNS if column != 'updated')
+        with connection.cursor() as cursor:
+            move_rows(cursor, ArchivedGoal, Goal, columns, 'id', ids, {'updated': timezone.now()})
+            move_rows(cursor, ArchivedGoalComment, GoalComment, COMMENT_COLUMNS, 'goal_id', ids)
+        boards_changed.send(sender=ArchivedGoal, board_ids={board_id for _, board_id in goals})
+    return ids
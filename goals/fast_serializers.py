@@ -0,0 +1,115 @@
+import functools
+
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+
+class ValuesSerializer:
+    """
+    Класс для быстрой сериализации списков на чтение.
+    По полям существующего сериализатора строит список колонок для queryset.values(),
+    а затем собирает из строк обычные словари в том же порядке и формате полей,
+    включая вложенные сериализаторы (например, UserSerializer). Поля DRF вызываются
+    только там, где меняется представление значения (даты и время)
+    """
+    converted_fields = (serializers.DateTimeField, serializers.DateField, serializers.TimeField)
+
+    def __init__(self, serializer_class):
+        self.serializer_class = serializer_class
+        self.fields = self.get_fields(serializer_class().fields)
+
+    def get_fields(self, fields, prefix: str = '') -> list[tuple]:
+        """ Метод для построения полей в виде (имя, ключ values() или вложенные поля, поле DRF для конвертации) """
+        result = []
+        for name, field in fields.items():
+            if field.write_only:
+                continue
+            source = f"{prefix}{field.source.replace('.', '__')}"
+            if isinstance(field, serializers.BaseSerializer):
+                result.append((name, self.get_fields(field.fields, f"{source}__"), None))
+            elif isinstance(field, self.converted_fields):
+                result.append((name, source, field))
+            else:
+                result.append((name, source, None))
+        return result
+
+    def get_values_names(self, fields: list | None = None) -> list[str]:
+        """ Метод для получения списка колонок для queryset.values() """
+        names = []
+        for _, source, _ in self.fields if fields is None else fields:
+            if isinstance(source, list):
+                names.extend(self.get_values_names(source))
+            else:
+                names.append(source)
+        return names
+
+    def get_field_names(self, fields: list | None = None, prefix: str = '') -> list[str]:
+        """ Метод для получения имен полей ответа, вложенные поля записываются через точку """
+        names = []
+        for name, source, _ in self.fields if fields is None else fields:
+            if isinstance(source, list):
+                names.extend(self.get_field_names(source, f"{prefix}{name}."))
+            else:
+                names.append(f"{prefix}{name}")
+        return names
+
+    def get_queryset(self, queryset):
+        """ Метод для перевода queryset в values() с сохранением аннотаций для сортировки и курсоров """
+        return queryset.values(*self.get_values_names(), *queryset.query.annotations)
+
+    def get_columns(self, fields: list | None = None) -> list[tuple]:
+        """ Метод для получения колонок с конвертерами, привязанными к текущему часовому поясу """
+        columns = []
+        for name, source, field in self.fields if fields is None else fields:
+            if isinstance(source, list):
+                columns.append((name, self.get_columns(source), None))
+            else:
+                columns.append((name, source, field and self.get_converter(field)))
+        return columns
+
+    def get_converter(self, field):
+        """ Метод для получения функции представления значения поля """
+        if isinstance(field, serializers.DateTimeField) and not hasattr(field, 'timezone'):
+            output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+            field_timezone = field.default_timezone()
+            if isinstance(output_format, str) and output_format.lower() == ISO_8601 and field_timezone is not None:
+                return functools.partial(
+                    self.format_datetime, field_timezone=field_timezone, fallback=field.to_representation
+                )
+        return field.to_representation
+
+    @staticmethod
+    def format_datetime(value, field_timezone, fallback) -> str:
+        """ Метод для представления даты и времени так же, как DateTimeField, без повторного поиска часового пояса """
+        if value.utcoffset() is None:
+            return fallback(value)
+        value = value.astimezone(field_timezone).isoformat()
+        return f"{value[:-6]}Z" if value.endswith('+00:00') else value
+
+    def to_representation(self, row: dict, columns: list) -> dict:
+        """ Метод для построения словаря из одной строки values() """
+        data = {}
+        for name, source, convert in columns:
+            if isinstance(source, list):
+                data[name] = self.to_representation(row, source)
+                continue
+            value = row[source]
+            data[name] = convert(value) if convert is not None and value is not None else value
+        return data
+
+    def many(self, rows) -> list[dict]:
+        """ Метод для сериализации списка строк values() """
+        columns = self.get_columns()
+        return [self.to_representation(row, columns) for row in rows]
+
+    def iterator(self, rows):
+        """ Метод для ленивой сериализации строк values(), например из queryset.iterator() """
+        columns = self.get_columns()
+        for row in rows:
+            yield self.to_representation(row, columns)
+
+
+@functools.lru_cache(maxsize=None)
+def get_values_serializer(serializer_class) -> ValuesSerializer:
+    """ Функция для получения быстрого сериализатора, построенного один раз на класс сериализатора """
+    return ValuesSerializer(serializer_class)
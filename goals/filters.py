@@ -1,6 +1,10 @@
 import django_filters
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramWordSimilarity
 from django.db import models
+from django.db.models import F
 from django_filters import rest_framework
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.settings import api_settings
 
 from goals.models import Goal
 
@@ -19,3 +23,74 @@ class GoalDateFilter(rest_framework.FilterSet):
     filter_overrides = {
         models.DateTimeField: {"filter_class": django_filters.IsoDateTimeFilter},
     }
+
+
+class FullTextSearchFilter(BaseFilterBackend):
+    """
+    Класс для полнотекстового поиска по полю search_vector модели.
+    Результаты ранжируются по релевантности, если не задана явная сортировка
+    """
+    search_param = api_settings.SEARCH_PARAM
+    search_config = 'russian'
+    search_vector_field = 'search_vector'
+
+    def filter_queryset(self, request, queryset, view):
+        search = request.query_params.get(self.search_param, '').strip()
+        if not search:
+            return queryset
+
+        query = SearchQuery(search, config=self.search_config, search_type='websearch')
+        queryset = queryset.annotate(
+            rank=SearchRank(F(self.search_vector_field), query)
+        ).filter(**{self.search_vector_field: query})
+
+        if api_settings.ORDERING_PARAM not in request.query_params:
+            queryset = queryset.order_by('-rank', '-id')
+        return queryset
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.search_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Полнотекстовый поиск',
+                'schema': {'type': 'string'},
+            },
+        ]
+
+
+class TrigramSearchFilter(BaseFilterBackend):
+    """
+    Класс для нечеткого поиска по названию с помощью pg_trgm.
+    Условие title %> search использует GIN-индекс gin_trgm_ops,
+    результаты ранжируются по похожести, если не задана явная сортировка
+    """
+    search_param = api_settings.SEARCH_PARAM
+    search_field = 'title'
+
+    def filter_queryset(self, request, queryset, view):
+        search = request.query_params.get(self.search_param, '').strip()
+        if not search:
+            return queryset
+        return self.search(queryset, search, ordered=api_settings.ORDERING_PARAM not in request.query_params)
+
+    def search(self, queryset, search: str, ordered: bool = True):
+        """ Метод для фильтрации и ранжирования queryset по похожести названия """
+        queryset = queryset.annotate(
+            similarity=TrigramWordSimilarity(search, self.search_field)
+        ).filter(**{f"{self.search_field}__trigram_word_similar": search})
+        if ordered:
+            queryset = queryset.order_by('-similarity', 'id')
+        return queryset
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.search_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Поиск по названию',
+                'schema': {'type': 'string'},
+            },
+        ]
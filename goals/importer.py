@@ -0,0 +1,258 @@
+import csv
+import io
+import json
+from abc import ABC, abstractmethod
+
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework import status
+
+from core.models import User
+from goals.models import BoardParticipant, Goal, GoalCategory, GoalComment
+from goals.serializers import GoalCommentImportSerializer, GoalImportSerializer
+from goals.signals import boards_changed
+
+IMPORT_FORMATS = ('csv', 'ndjson')
+
+
+def read_rows(lines, import_format: str):
+    """
+    Функция для построчного чтения файла импорта.
+    Возвращает пары (номер строки данных, словарь или None для нераспознанной строки);
+    пустые значения CSV считаются отсутствующими
+    """
+    if import_format == 'csv':
+        for number, row in enumerate(csv.DictReader(lines), start=1):
+            yield number, {key: value for key, value in row.items() if key is not None and value != ''}
+    elif import_format == 'ndjson':
+        number = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            number += 1
+            try:
+                data = json.loads(line)
+            except ValueError:
+                data = None
+            yield number, data if isinstance(data, dict) else None
+    else:
+        raise ValueError(f"Unsupported import format: {import_format}")
+
+
+class BaseImporter(ABC):
+    """
+    Базовый класс импорта строк в доску.
+    Строки проверяются сериализатором по отдельности и пачками загружаются через COPY
+    во временную таблицу. Ссылки на пользователей и объекты доски проверяются для всего
+    файла несколькими запросами, а корректные строки вставляются одним INSERT ... SELECT.
+    Результат - отчет по каждой строке: id созданного объекта или ошибки
+    """
+    model = None
+    serializer_class = None
+    staging_table = None
+    # Колонки промежуточной таблицы, заполняемые из файла, в виде (имя, тип SQL)
+    staging_columns: tuple[tuple[str, str], ...] = ()
+    # Колонки промежуточной таблицы, которые переносятся в таблицу модели как есть
+    insert_columns: tuple[str, ...] = ()
+    # Значения колонок модели, одинаковые для всех вставляемых строк
+    insert_defaults: dict = {}
+    copy_batch_size = 10_000
+
+    def __init__(self, board, user):
+        self.board = board
+        self.user = user
+        self.created: dict[int, int] = {}
+        self.errors: dict[int, dict] = {}
+        self.now = None
+
+    def run(self, lines, import_format: str) -> list[dict]:
+        """ Метод для импорта строк файла и получения отчета """
+        with transaction.atomic(), connection.cursor() as cursor:
+            columns = ', '.join(f"{name} {sql_type}" for name, sql_type in self.staging_columns)
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE {self.staging_table} "
+                f"(line integer PRIMARY KEY, id bigint, user_id bigint, username varchar(150), {columns}) "
+                f"ON COMMIT DROP"
+            )
+            self.copy_rows(cursor, read_rows(lines, import_format))
+            self.check_users(cursor)
+            self.check_references(cursor)
+            self.insert(cursor)
+            cursor.execute(f"DROP TABLE {self.staging_table}")
+            if self.created:
+                boards_changed.send(sender=self.model, board_ids={self.board.id})
+        return self.get_report()
+
+    @abstractmethod
+    def get_staging_values(self, data: dict) -> list:
+        """ Метод для получения значений колонок промежуточной таблицы из проверенной строки """
+
+    def copy_rows(self, cursor, rows) -> None:
+        """ Метод для проверки строк и загрузки корректных строк через COPY пачками по copy_batch_size """
+        columns = ', '.join(['line', 'username', *(name for name, _ in self.staging_columns)])
+        sql = f"COPY {self.staging_table} ({columns}) FROM STDIN WITH (FORMAT csv)"
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        count = 0
+        for number, data in rows:
+            if data is None:
+                self.errors[number] = {'non_field_errors': ['Invalid row.']}
+                continue
+            serializer = self.serializer_class(data=data)
+            if not serializer.is_valid():
+                self.errors[number] = serializer.errors
+                continue
+            values = serializer.validated_data
+            writer.writerow([number, values.get('user', self.user.username), *self.get_staging_values(values)])
+            count += 1
+            if count % self.copy_batch_size == 0:
+                self.copy(cursor, sql, buffer)
+        self.copy(cursor, sql, buffer)
+
+    @staticmethod
+    def copy(cursor, sql: str, buffer: io.StringIO) -> None:
+        """ Метод для отправки накопленных строк в COPY и очистки буфера """
+        if not buffer.tell():
+            return
+        buffer.seek(0)
+        cursor.copy_expert(sql, buffer)
+        buffer.seek(0)
+        buffer.truncate()
+
+    def check_users(self, cursor) -> None:
+        """
+        Метод для проверки авторов строк: автор должен быть участником доски.
+        Другого участника автором может указать только владелец доски, как и при создании
+        целей и комментариев через API, где автором всегда становится текущий пользователь
+        """
+        is_owner = BoardParticipant.objects.filter(
+            board=self.board, user=self.user, role=BoardParticipant.Role.owner
+        ).exists()
+        cursor.execute(
+            f"UPDATE {self.staging_table} AS staging SET user_id = participant.user_id "
+            f"FROM {BoardParticipant._meta.db_table} AS participant "
+            f"JOIN {User._meta.db_table} AS users ON users.id = participant.user_id "
+            f"WHERE participant.board_id = %s AND users.username = staging.username "
+            f"AND (%s OR participant.user_id = %s)",
+            [self.board.id, is_owner, self.user.id],
+        )
+        cursor.execute(f"SELECT line, username FROM {self.staging_table} WHERE user_id IS NULL")
+        for number, username in cursor.fetchall():
+            if is_owner or username == self.user.username:
+                self.add_error(number, 'user', f"User with username={username} is not a participant of the board.")
+            else:
+                self.add_error(number, 'user', "Only the board owner can import rows of other users.")
+
+    @abstractmethod
+    def check_references(self, cursor) -> None:
+        """ Метод для проверки ссылок строк на объекты доски """
+
+    def add_error(self, number: int, field: str, message: str) -> None:
+        """ Метод для добавления ошибки поля к строке отчета """
+        self.errors.setdefault(number, {}).setdefault(field, []).append(message)
+
+    def insert(self, cursor) -> None:
+        """ Метод для вставки корректных строк одним запросом """
+        if self.errors:
+            cursor.execute(f"DELETE FROM {self.staging_table} WHERE line = ANY(%s)", [list(self.errors)])
+        cursor.execute(
+            f"UPDATE {self.staging_table} SET id = nextval(pg_get_serial_sequence(%s, 'id'))",
+            [self.model._meta.db_table],
+        )
+        columns = ', '.join([*self.insert_columns, *self.insert_defaults])
+        values = ', '.join([*self.insert_columns, *('%s' for _ in self.insert_defaults)])
+        self.now = timezone.now()
+        cursor.execute(
+            f"INSERT INTO {self.model._meta.db_table} (id, {columns}, board_id, user_id, created, updated) "
+            f"SELECT id, {values}, %s, user_id, %s, %s FROM {self.staging_table} ORDER BY line",
+            [*self.insert_defaults.values(), self.board.id, self.now, self.now],
+        )
+        cursor.execute(f"SELECT line, id FROM {self.staging_table}")
+        self.created = dict(cursor.fetchall())
+
+    def get_report(self) -> list[dict]:
+        """ Метод для построения отчета по каждой строке файла """
+        results = [
+            {'row': number, 'status': status.HTTP_201_CREATED, 'id': object_id}
+            for number, object_id in self.created.items()
+        ]
+        results += [
+            {'row': number, 'status': status.HTTP_400_BAD_REQUEST, 'errors': errors}
+            for number, errors in self.errors.items()
+        ]
+        return sorted(results, key=lambda result: result['row'])
+
+
+class GoalImporter(BaseImporter):
+    """ Класс импорта целей: категория должна принадлежать доске и не быть удаленной """
+    model = Goal
+    serializer_class = GoalImportSerializer
+    staging_table = 'goals_import_goal'
+    staging_columns = (
+        ('title', 'varchar(255)'),
+        ('description', 'text'),
+        ('status', 'smallint'),
+        ('priority', 'smallint'),
+        ('due_date', 'date'),
+        ('category_id', 'bigint'),
+    )
+    insert_columns = ('title', 'description', 'status', 'priority', 'due_date', 'category_id')
+    insert_defaults = {'comment_count': 0}
+
+    def get_staging_values(self, data):
+        return [
+            data['title'],
+            data.get('description'),
+            data.get('status', Goal.Status.to_do),
+            data.get('priority', Goal.Priority.medium),
+            data.get('due_date'),
+            data['category'],
+        ]
+
+    def check_references(self, cursor):
+        cursor.execute(
+            f"SELECT staging.line, staging.category_id FROM {self.staging_table} AS staging "
+            f"LEFT JOIN {GoalCategory._meta.db_table} AS category ON category.id = staging.category_id "
+            f"AND category.board_id = %s AND NOT category.is_deleted "
+            f"WHERE category.id IS NULL",
+            [self.board.id],
+        )
+        for number, category_id in cursor.fetchall():
+            self.add_error(number, 'category', f'Invalid pk "{category_id}" - object does not exist.')
+
+
+class GoalCommentImporter(BaseImporter):
+    """ Класс импорта комментариев: цель должна принадлежать доске """
+    model = GoalComment
+    serializer_class = GoalCommentImportSerializer
+    staging_table = 'goals_import_comment'
+    staging_columns = (
+        ('text', 'text'),
+        ('goal_id', 'bigint'),
+    )
+    insert_columns = ('text', 'goal_id')
+
+    def get_staging_values(self, data):
+        return [data['text'], data['goal']]
+
+    def insert(self, cursor):
+        super().insert(cursor)
+        # Вставка идет в обход сигналов, поэтому счетчики целей обновляются одним запросом
+        cursor.execute(
+            f"UPDATE {Goal._meta.db_table} AS goal "
+            f"SET comment_count = goal.comment_count + staging.count, "
+            f"last_activity_at = GREATEST(goal.last_activity_at, %s) "
+            f"FROM (SELECT goal_id, count(*) AS count FROM {self.staging_table} GROUP BY goal_id) AS staging "
+            f"WHERE goal.id = staging.goal_id",
+            [self.now],
+        )
+
+    def check_references(self, cursor):
+        cursor.execute(
+            f"SELECT staging.line, staging.goal_id FROM {self.staging_table} AS staging "
+            f"LEFT JOIN {Goal._meta.db_table} AS goal ON goal.id = staging.goal_id AND goal.board_id = %s "
+            f"WHERE goal.id IS NULL",
+            [self.board.id],
+        )
+        for number, goal_id in cursor.fetchall():
+            self.add_error(number, 'goal', f'Invalid pk "{goal_id}" - object does not exist.')
@@ -0,0 +1,43 @@
+import signal
+
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from goals.cold_storage import archive_batch, restore_goals
+
+
+class Command(BaseCommand):
+    """
+    Класс команды переноса давно архивированных целей в холодное хранилище.
+    Цели переносятся вместе с комментариями пачками, каждая пачка - отдельная транзакция.
+    С --restore возвращает указанные цели обратно
+    """
+    help = 'Moves goals archived more than N days ago with their comments to cold storage'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int, default=settings.GOALS_COLD_STORAGE_DAYS,
+            help='Сколько дней цель должна пробыть в архиве',
+        )
+        parser.add_argument('--batch-size', type=int, default=1_000, help='Количество целей в одной пачке')
+        parser.add_argument('--restore', type=int, nargs='+', metavar='ID', help='Восстановить цели по id')
+
+    def handle(self, *args, **options):
+        if options['restore']:
+            restored = restore_goals(options['restore'])
+            self.stdout.write(self.style.SUCCESS(f"Restored {len(restored)} goals"))
+            return
+
+        self.stopped = False
+        signal.signal(signal.SIGTERM, self.stop)
+        moved = 0
+        while not self.stopped:
+            count = archive_batch(options['days'], options['batch_size'])
+            if not count:
+                break
+            moved += count
+        self.stdout.write(self.style.SUCCESS(f"Moved {moved} goals to cold storage"))
+
+    def stop(self, signum, frame):
+        """ Метод для остановки после завершения текущей пачки """
+        self.stopped = True
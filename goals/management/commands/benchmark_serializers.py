@@ -0,0 +1,99 @@
+import time
+from datetime import date, timedelta
+
+from django.core.management import BaseCommand, CommandError
+from django.db import models
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from core.models import User
+from goals.fast_serializers import ValuesSerializer
+from goals.models import Board, Goal, GoalCategory, GoalComment
+from goals.renderers import FastJSONRenderer
+from goals.serializers import GoalCategorySerializer, GoalCommentSerializer, GoalSerializer
+
+
+class Command(BaseCommand):
+    """
+    Класс команды для сравнения пропускной способности сериализации списков.
+    Строит синтетические объекты в памяти, без обращений к БД, и в одном потоке
+    сериализует их через ModelSerializer с JSONRenderer и через ValuesSerializer
+    с FastJSONRenderer, выводя количество строк в секунду на одно ядро
+    """
+    help = 'Compares single-core throughput of ModelSerializer and the values() fast read path'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1_000, help='Количество строк в странице')
+        parser.add_argument('--repeat', type=int, default=20, help='Количество повторов')
+
+    def handle(self, *args, **options):
+        rows_count = max(options['rows'], 1)
+        repeat = max(options['repeat'], 1)
+        for name, serializer_class, instances in self.get_datasets(rows_count):
+            values_serializer = ValuesSerializer(serializer_class)
+            rows = [self.to_row(instance, values_serializer.get_values_names()) for instance in instances]
+
+            def serialize():
+                return JSONRenderer().render(serializer_class(instances, many=True).data)
+
+            def serialize_fast():
+                return FastJSONRenderer().render(values_serializer.many(rows))
+
+            if serialize() != serialize_fast():
+                raise CommandError(f"{name}: fast read output differs from {serializer_class.__name__}")
+
+            default_rate = self.measure(serialize, rows_count, repeat)
+            fast_rate = self.measure(serialize_fast, rows_count, repeat)
+            self.stdout.write(
+                f"{name:<10} ModelSerializer: {default_rate:>10.0f} rows/s  "
+                f"fast read: {fast_rate:>10.0f} rows/s  x{fast_rate / default_rate:.1f}"
+            )
+
+    @staticmethod
+    def measure(func, rows_count: int, repeat: int) -> float:
+        """ Метод для измерения количества строк в секунду в текущем потоке """
+        start = time.process_time()
+        for _ in range(repeat):
+            func()
+        elapsed = time.process_time() - start
+        return rows_count * repeat / max(elapsed, 1e-9)
+
+    @staticmethod
+    def to_row(instance, names: list[str]) -> dict:
+        """ Метод для построения строки values() из объекта модели """
+        row = {}
+        for name in names:
+            value = instance
+            for part in name.split('__'):
+                value = getattr(value, part)
+            row[name] = value.pk if isinstance(value, models.Model) else value
+        return row
+
+    @staticmethod
+    def get_datasets(rows_count: int) -> list[tuple]:
+        """ Метод для построения синтетических категорий, целей и комментариев """
+        now = timezone.now()
+        user = User(id=1, username='benchmark', first_name='Иван', last_name='Петров', email='ivan@example.com')
+        board = Board(id=1, title='Доска', created=now, updated=now)
+        categories = [
+            GoalCategory(id=number, user=user, board=board, title=f"Категория {number}", created=now, updated=now)
+            for number in range(1, rows_count + 1)
+        ]
+        goals = [
+            Goal(
+                id=number, user=user, category=categories[0], board=board, title=f"Цель {number}",
+                description='Описание цели', due_date=date.today() + timedelta(days=number % 30),
+                created=now, updated=now,
+            )
+            for number in range(1, rows_count + 1)
+        ]
+        comments = [
+            GoalComment(id=number, user=user, goal=goals[0], board=board, text=f"Комментарий {number}",
+                        created=now, updated=now)
+            for number in range(1, rows_count + 1)
+        ]
+        return [
+            ('category', GoalCategorySerializer, categories),
+            ('goal', GoalSerializer, goals),
+            ('comment', GoalCommentSerializer, comments),
+        ]
@@ -0,0 +1,138 @@
+import random
+import re
+from datetime import date, timedelta
+
+from django.core.management import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import RequestFactory
+from rest_framework.request import Request
+
+from core.models import User
+from goals.models import Board, BoardParticipant, Goal, GoalCategory, GoalComment
+from goals.views import GoalCategoryListView, GoalCommentListView, GoalListView
+
+SEQ_SCAN_RE = re.compile(r"Seq Scan on (goals_\w+)")
+
+
+class Command(BaseCommand):
+    """
+    Класс команды для проверки планов горячих запросов.
+    Создает синтетический набор данных, выполняет EXPLAIN (ANALYZE) для запросов
+    списков целей, категорий и комментариев и отмечает последовательные сканирования.
+    Данные удаляются откатом транзакции
+    """
+    help = 'Runs EXPLAIN ANALYZE for hot list queries on a synthetic dataset and flags sequential scans'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--goals', type=int, default=200_000, help='Количество синтетических целей')
+        parser.add_argument('--boards', type=int, default=1_000, help='Количество синтетических досок')
+        parser.add_argument('--batch-size', type=int, default=5_000)
+        parser.add_argument('--strict', action='store_true', help='Завершиться с ошибкой при Seq Scan')
+        parser.add_argument('--verbose-plans', action='store_true', help='Выводить планы целиком')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            user, category, goal = self.create_dataset(options)
+            flagged = []
+            for name, view_class, params in self.get_hot_queries(category, goal):
+                queryset = self.get_view_queryset(view_class, user, params)
+                plan = queryset.explain(analyze=True)
+                seq_scans = sorted(set(SEQ_SCAN_RE.findall(plan)))
+                if seq_scans:
+                    flagged.append(name)
+                    self.stdout.write(self.style.WARNING(f"SEQ SCAN  {name}: {', '.join(seq_scans)}"))
+                else:
+                    self.stdout.write(self.style.SUCCESS(f"OK        {name}"))
+                if options['verbose_plans'] or seq_scans:
+                    self.stdout.write(plan)
+            transaction.set_rollback(True)
+
+        if flagged and options['strict']:
+            raise CommandError(f"Sequential scans in: {', '.join(flagged)}")
+
+    def get_hot_queries(self, category: GoalCategory, goal: Goal) -> list[tuple]:
+        """ Метод со списком горячих запросов в виде (название, вьюшка, параметры запроса) """
+        today = date.today()
+        return [
+            ('goal list ordered by title', GoalListView, {}),
+            ('goal list ordered by created', GoalListView, {'ordering': '-created'}),
+            ('goal list by category', GoalListView, {'category': category.id}),
+            ('goal list by category and status', GoalListView, {
+                'category': category.id, 'status': Goal.Status.in_progress,
+            }),
+            ('goal list by priority', GoalListView, {'priority__in': f"{Goal.Priority.high},{Goal.Priority.critical}"}),
+            ('goal list by due date', GoalListView, {
+                'due_date__gte': today.isoformat(), 'due_date__lte': (today + timedelta(days=7)).isoformat(),
+            }),
+            ('goal comment list by goal', GoalCommentListView, {'goal': goal.id}),
+            ('goal category list', GoalCategoryListView, {}),
+        ]
+
+    def get_view_queryset(self, view_class, user: User, params: dict):
+        """ Метод для получения первой страницы queryset вьюшки так, как его строит запрос к API """
+        request = Request(RequestFactory().get('/', params))
+        request.user = user
+        view = view_class(request=request, args=(), kwargs={}, format_kwarg=None)
+        queryset = view.filter_queryset(view.get_queryset())
+        return queryset[:view.paginator.keyset_default_limit]
+
+    def create_dataset(self, options) -> tuple[User, GoalCategory, Goal]:
+        """ Метод для создания синтетических досок, категорий, целей и комментариев """
+        batch_size = options['batch_size']
+        boards_count = max(options['boards'], 1)
+        goals_count = max(options['goals'], 1)
+        self.stdout.write(f"Creating {boards_count} boards and {goals_count} goals...")
+
+        owner = User.objects.create_user(username=f"explain-owner-{random.getrandbits(32)}")
+        user = User.objects.create_user(username=f"explain-user-{random.getrandbits(32)}")
+        boards = Board.objects.bulk_create(
+            [Board(title=f"Board {number}") for number in range(boards_count)], batch_size=batch_size
+        )
+        participants = [BoardParticipant(board=board, user=owner) for board in boards]
+        # Проверяемый пользователь участвует в небольшой доле досок, как в реальных данных
+        participants += [
+            BoardParticipant(board=board, user=user, role=BoardParticipant.Role.writer)
+            for board in boards[::100]
+        ]
+        BoardParticipant.objects.bulk_create(participants, batch_size=batch_size)
+        categories = GoalCategory.objects.bulk_create(
+            [
+                GoalCategory(board=board, user=owner, title=f"Category {board.id}-{number}")
+                for board in boards for number in range(3)
+            ],
+            batch_size=batch_size,
+        )
+
+        today = date.today()
+        statuses = Goal.Status.values
+        priorities = Goal.Priority.values
+        for start in range(0, goals_count, batch_size):
+            goals = []
+            for number in range(start, min(start + batch_size, goals_count)):
+                category = random.choice(categories)
+                goals.append(Goal(
+                    title=f"Goal {number}",
+                    user=owner,
+                    category=category,
+                    board_id=category.board_id,
+                    status=random.choice(statuses),
+                    priority=random.choice(priorities),
+                    due_date=today + timedelta(days=random.randint(-365, 365)),
+                ))
+            Goal.objects.bulk_create(goals)
+
+        category = next(category for category in categories if category.board_id == boards[0].id)
+        goal = Goal.objects.filter(category=category).first() or Goal.objects.create(
+            title="Goal", user=owner, category=category
+        )
+        GoalComment.objects.bulk_create(
+            [
+                GoalComment(goal=goal, board_id=goal.board_id, user=owner, text=f"Comment {number}")
+                for number in range(100)
+            ]
+        )
+
+        with connection.cursor() as cursor:
+            for model in (Board, BoardParticipant, GoalCategory, Goal, GoalComment):
+                cursor.execute(f"ANALYZE {model._meta.db_table}")
+        return user, category, goal
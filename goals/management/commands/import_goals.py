@@ -0,0 +1,68 @@
+import json
+from pathlib import Path
+
+from django.core.management import BaseCommand, CommandError
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+
+from core.models import User
+from goals.importer import IMPORT_FORMATS, GoalCommentImporter, GoalImporter
+from goals.models import Board, BoardParticipant
+
+
+class Command(BaseCommand):
+    """
+    Класс команды импорта целей или комментариев в доску из файла CSV или NDJSON.
+    Строки без автора импортируются от имени пользователя --user (по умолчанию - владельца доски).
+    Отчет по строкам с ошибками выводится в NDJSON, полный отчет можно записать в файл --report
+    """
+    help = 'Imports goals or comments into a board from a CSV or NDJSON file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('board', type=int, help='id доски')
+        parser.add_argument('path', type=Path, help='Путь к файлу CSV или NDJSON')
+        parser.add_argument('--comments', action='store_true', help='Импортировать комментарии вместо целей')
+        parser.add_argument('--format', choices=IMPORT_FORMATS, help='Формат файла, по умолчанию - по расширению')
+        parser.add_argument('--user', help='username автора по умолчанию')
+        parser.add_argument('--report', help='Путь для записи полного отчета в NDJSON')
+
+    def handle(self, *args, **options):
+        board = Board.alive.filter(pk=options['board']).first()
+        if board is None:
+            raise CommandError(f"Board {options['board']} does not exist")
+
+        import_format = options['format'] or options['path'].suffix.lstrip('.').lower()
+        if import_format not in IMPORT_FORMATS:
+            raise CommandError(f"Unsupported import format: {import_format}")
+
+        user = self.get_user(board, options['user'])
+        importer_class = GoalCommentImporter if options['comments'] else GoalImporter
+        try:
+            with options['path'].open(encoding='utf-8-sig', newline='') as lines:
+                report = importer_class(board, user).run(lines, import_format)
+        except (OSError, UnicodeDecodeError) as error:
+            raise CommandError(f"Cannot read {options['path']}: {error}")
+
+        if options['report']:
+            with Path(options['report']).open('wb') as report_file:
+                for result in report:
+                    report_file.write(JSONRenderer().render(result) + b'\n')
+
+        failed = [result for result in report if result['status'] != status.HTTP_201_CREATED]
+        for result in failed:
+            self.stdout.write(json.dumps(result, ensure_ascii=False))
+        message = f"Imported {len(report) - len(failed)} rows, failed {len(failed)} rows"
+        self.stdout.write(self.style.WARNING(message) if failed else self.style.SUCCESS(message))
+
+    @staticmethod
+    def get_user(board: Board, username: str | None) -> User:
+        """ Метод для получения автора строк по умолчанию """
+        if username is not None:
+            user = User.objects.filter(username=username).first()
+            if user is None:
+                raise CommandError(f"User {username} does not exist")
+            return user
+        participant = board.participants.filter(role=BoardParticipant.Role.owner).select_related('user').first()
+        if participant is None:
+            raise CommandError(f"Board {board.id} has no owner")
+        return participant.user
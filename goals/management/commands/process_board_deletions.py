@@ -0,0 +1,53 @@
+import signal
+import time
+
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from goals.models import BoardDeletion
+
+
+class Command(BaseCommand):
+    """
+    Класс команды фонового удаления досок.
+    Обрабатывает задачи BoardDeletion пачками ограниченного размера, каждая пачка -
+    отдельная короткая транзакция. Задача блокируется через SKIP LOCKED,
+    поэтому можно запускать несколько обработчиков
+    """
+    help = 'Processes deleted boards: soft-deletes categories and archives goals in batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1_000, help='Количество строк в одной пачке')
+        parser.add_argument('--interval', type=float, default=5.0, help='Пауза при пустой очереди, сек')
+        parser.add_argument('--once', action='store_true', help='Обработать очередь и завершиться')
+
+    def handle(self, *args, **options):
+        self.stopped = False
+        signal.signal(signal.SIGTERM, self.stop)
+
+        while not self.stopped:
+            processed = self.process_next(options['batch_size'])
+            if processed:
+                continue
+            if options['once']:
+                break
+            time.sleep(options['interval'])
+
+    def stop(self, signum, frame):
+        """ Метод для остановки после завершения текущей пачки """
+        self.stopped = True
+
+    def process_next(self, batch_size: int) -> bool:
+        """ Метод для обработки одной пачки первой незавершенной задачи """
+        with transaction.atomic():
+            deletion = (
+                BoardDeletion.objects.select_for_update(skip_locked=True)
+                .exclude(status=BoardDeletion.Status.done)
+                .order_by('id')
+                .first()
+            )
+            if deletion is None:
+                return False
+            if deletion.run_batch(batch_size):
+                self.stdout.write(f"Board {deletion.board_id} deleted")
+        return True
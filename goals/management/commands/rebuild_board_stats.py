@@ -0,0 +1,20 @@
+from django.core.management import BaseCommand
+
+from goals.stats import rebuild_stats
+
+
+class Command(BaseCommand):
+    """
+    Класс команды полного пересчета статистики досок.
+    Обычно статистика поддерживается триггерами БД, пересчет нужен после ручного
+    вмешательства в данные или для проверки расхождений
+    """
+    help = 'Recomputes board goal statistics from scratch'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--board', type=int, action='append', help='id доски, можно указать несколько раз')
+
+    def handle(self, *args, **options):
+        rebuild_stats(options['board'])
+        boards = ', '.join(map(str, options['board'])) if options['board'] else 'all boards'
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt goal statistics for {boards}"))
@@ -0,0 +1,19 @@
+from django.core.management import BaseCommand
+
+from goals.activity import reconcile_activity
+
+
+class Command(BaseCommand):
+    """
+    Класс команды исправления счетчиков комментариев целей.
+    Обычно comment_count и last_activity_at поддерживаются при записи комментариев,
+    пересчет нужен после записи в обход моделей или ручного вмешательства в данные
+    """
+    help = 'Repairs drift of goal comment_count and last_activity_at'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=10_000, help='Количество id целей в одной транзакции')
+
+    def handle(self, *args, **options):
+        fixed = reconcile_activity(options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Reconciled comment activity of {fixed} goals"))
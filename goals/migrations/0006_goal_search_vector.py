@@ -0,0 +1,81 @@
+# Generated by Django 4.0.1 on 2026-10-18 19:10
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+# Поисковые векторы поддерживаются триггерами БД, поэтому остаются актуальными
+# при любых способах записи: save(), bulk_create(), update() и сыром SQL
+GOAL_SEARCH_TRIGGER = """
+CREATE FUNCTION goals_goal_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('russian', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('russian', coalesce(NEW.description, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER goals_goal_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, description ON goals_goal
+    FOR EACH ROW EXECUTE FUNCTION goals_goal_search_vector_update();
+
+UPDATE goals_goal SET title = title;
+"""
+
+COMMENT_SEARCH_TRIGGER = """
+CREATE FUNCTION goals_goalcomment_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := to_tsvector('russian', coalesce(NEW.text, ''));
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER goals_goalcomment_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF text ON goals_goalcomment
+    FOR EACH ROW EXECUTE FUNCTION goals_goalcomment_search_vector_update();
+
+UPDATE goals_goalcomment SET text = text;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0005_alter_goalcategory_board'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='goal',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='Поисковый вектор'),
+        ),
+        migrations.AddField(
+            model_name='goalcomment',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='Поисковый вектор'),
+        ),
+        migrations.RunSQL(
+            GOAL_SEARCH_TRIGGER,
+            reverse_sql="""
+                DROP TRIGGER goals_goal_search_vector_trigger ON goals_goal;
+                DROP FUNCTION goals_goal_search_vector_update();
+            """,
+        ),
+        migrations.RunSQL(
+            COMMENT_SEARCH_TRIGGER,
+            reverse_sql="""
+                DROP TRIGGER goals_goalcomment_search_vector_trigger ON goals_goalcomment;
+                DROP FUNCTION goals_goalcomment_search_vector_update();
+            """,
+        ),
+        migrations.AddIndex(
+            model_name='goal',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='goals_goal_search_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='goalcomment',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='goals_comment_search_idx'),
+        ),
+    ]
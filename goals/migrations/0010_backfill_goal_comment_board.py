@@ -0,0 +1,45 @@
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+BATCH_SIZE = 10_000
+
+
+def backfill_in_batches(model, source_model, source_field):
+    """ Проставляет board пачками по id, каждая пачка коммитится отдельно """
+    board_subquery = Subquery(
+        source_model.objects.filter(pk=OuterRef(source_field)).values('board_id')[:1]
+    )
+    last_id = 0
+    while True:
+        ids = list(
+            model.objects.filter(pk__gt=last_id, board__isnull=True)
+            .order_by('pk')
+            .values_list('pk', flat=True)[:BATCH_SIZE]
+        )
+        if not ids:
+            break
+        model.objects.filter(pk__in=ids).update(board_id=board_subquery)
+        last_id = ids[-1]
+
+
+def backfill_board(apps, schema_editor):
+    GoalCategory = apps.get_model("goals", "GoalCategory")
+    Goal = apps.get_model("goals", "Goal")
+    GoalComment = apps.get_model("goals", "GoalComment")
+
+    # Сначала цели, так как доска комментария берется из его цели
+    backfill_in_batches(Goal, GoalCategory, 'category_id')
+    backfill_in_batches(GoalComment, Goal, 'goal_id')
+
+
+class Migration(migrations.Migration):
+    # Без общей транзакции, чтобы не держать блокировки на всех строках сразу
+    atomic = False
+
+    dependencies = [
+        ('goals', '0009_goal_comment_board'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_board, migrations.RunPython.noop),
+    ]
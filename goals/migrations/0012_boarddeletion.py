@@ -0,0 +1,32 @@
+# Generated by Django 4.0.1 on 2026-10-18 19:21
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0011_alter_goal_comment_board'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardDeletion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.PositiveSmallIntegerField(choices=[(1, 'В очереди'), (2, 'Выполняется'), (3, 'Завершено')], default=1, verbose_name='Статус')),
+                ('categories_deleted', models.PositiveIntegerField(default=0, verbose_name='Удалено категорий')),
+                ('goals_archived', models.PositiveIntegerField(default=0, verbose_name='Архивировано целей')),
+                ('goals_total', models.PositiveIntegerField(default=None, null=True, verbose_name='Целей к архивации')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Дата создания')),
+                ('updated', models.DateTimeField(auto_now=True, verbose_name='Дата последнего обновления')),
+                ('finished', models.DateTimeField(default=None, null=True, verbose_name='Дата завершения')),
+                ('board', models.OneToOneField(on_delete=django.db.models.deletion.PROTECT, related_name='deletion', to='goals.board', verbose_name='Доска')),
+            ],
+            options={
+                'verbose_name': 'Удаление доски',
+                'verbose_name_plural': 'Удаления досок',
+            },
+        ),
+    ]
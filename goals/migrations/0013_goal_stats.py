@@ -0,0 +1,146 @@
+# Generated by Django 4.0.1 on 2026-10-18 19:54
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+# Незавершенные статусы Goal.Status (to_do, in_progress) на момент миграции, как goals.stats.OPEN_STATUSES;
+# миграция не импортирует код приложения, чтобы не меняться вместе с ним
+STATUSES = '1, 2'
+STAT_COLUMNS = 'board_id, category_id, status, priority, due_date'
+NEW_COLUMNS = STAT_COLUMNS.replace(', ', ', new_rows.')
+OLD_COLUMNS = STAT_COLUMNS.replace(', ', ', old_rows.')
+
+# Сводные таблицы поддерживаются триггерами уровня оператора с переходными таблицами,
+# поэтому учитывают любые способы записи: save(), bulk_create(), bulk_update(), update(),
+# каскадные удаления и сырой SQL. Изменения одного оператора агрегируются и применяются
+# одним upsert на ключ. Ключи вставляются по порядку, чтобы параллельные операторы
+# блокировали общие строки статистики в одном порядке и не попадали во взаимную блокировку.
+# При обновлении учитываются только строки, в которых изменились колонки статистики;
+# если таких нет, триггер выходит сразу (колонки триггера UPDATE OF Postgres
+# не допускает вместе с переходными таблицами)
+GOAL_STATS_TRIGGER = f"""
+CREATE FUNCTION goals_goal_stats_update() RETURNS trigger AS $$
+DECLARE
+    changes text;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        changes := 'SELECT {STAT_COLUMNS}, 1 AS delta FROM new_rows';
+    ELSIF TG_OP = 'DELETE' THEN
+        changes := 'SELECT {STAT_COLUMNS}, -1 AS delta FROM old_rows';
+    ELSE
+        -- Обновления других колонок (comment_count, change_seq, title) статистику не меняют
+        IF NOT EXISTS (
+            SELECT 1 FROM new_rows JOIN old_rows USING (id)
+            WHERE (new_rows.{NEW_COLUMNS}) IS DISTINCT FROM (old_rows.{OLD_COLUMNS})
+        ) THEN
+            RETURN NULL;
+        END IF;
+        changes := 'SELECT new_rows.*, 1 AS delta FROM new_rows JOIN old_rows USING (id) '
+                   'WHERE (new_rows.{NEW_COLUMNS}) IS DISTINCT FROM (old_rows.{OLD_COLUMNS}) '
+                   'UNION ALL '
+                   'SELECT old_rows.*, -1 AS delta FROM new_rows JOIN old_rows USING (id) '
+                   'WHERE (new_rows.{NEW_COLUMNS}) IS DISTINCT FROM (old_rows.{OLD_COLUMNS})';
+    END IF;
+
+    EXECUTE format(
+        'INSERT INTO goals_goalstat (board_id, category_id, status, priority, count) '
+        'SELECT board_id, category_id, status, priority, sum(delta) FROM (%s) AS changes '
+        'GROUP BY board_id, category_id, status, priority HAVING sum(delta) <> 0 '
+        'ORDER BY board_id, category_id, status, priority '
+        'ON CONFLICT (board_id, category_id, status, priority) '
+        'DO UPDATE SET count = goals_goalstat.count + EXCLUDED.count',
+        changes
+    );
+    EXECUTE format(
+        'INSERT INTO goals_goalduedatestat (board_id, due_date, count) '
+        'SELECT board_id, due_date, sum(delta) FROM (%s) AS changes '
+        'WHERE due_date IS NOT NULL AND status IN ({STATUSES}) '
+        'GROUP BY board_id, due_date HAVING sum(delta) <> 0 '
+        'ORDER BY board_id, due_date '
+        'ON CONFLICT (board_id, due_date) '
+        'DO UPDATE SET count = goals_goalduedatestat.count + EXCLUDED.count',
+        changes
+    );
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER goals_goal_stats_insert_trigger
+    AFTER INSERT ON goals_goal REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION goals_goal_stats_update();
+
+CREATE TRIGGER goals_goal_stats_update_trigger
+    AFTER UPDATE ON goals_goal REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION goals_goal_stats_update();
+
+CREATE TRIGGER goals_goal_stats_delete_trigger
+    AFTER DELETE ON goals_goal REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION goals_goal_stats_update();
+"""
+
+GOAL_STATS_BACKFILL = f"""
+INSERT INTO goals_goalstat (board_id, category_id, status, priority, count)
+SELECT board_id, category_id, status, priority, count(*) FROM goals_goal
+GROUP BY board_id, category_id, status, priority;
+
+INSERT INTO goals_goalduedatestat (board_id, due_date, count)
+SELECT board_id, due_date, count(*) FROM goals_goal
+WHERE due_date IS NOT NULL AND status IN ({STATUSES})
+GROUP BY board_id, due_date;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0012_boarddeletion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GoalStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.PositiveSmallIntegerField(choices=[(1, 'К выполнению'), (2, 'В процессе'), (3, 'Выполнено'), (4, 'Архив')], verbose_name='Статус')),
+                ('priority', models.PositiveSmallIntegerField(choices=[(1, 'Низкий'), (2, 'Средний'), (3, 'Высокий'), (4, 'Критический')], verbose_name='Приоритет')),
+                ('count', models.IntegerField(default=0, verbose_name='Количество')),
+                ('board', models.ForeignKey(db_constraint=False, db_index=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='goals.board', verbose_name='Доска')),
+                ('category', models.ForeignKey(db_constraint=False, db_index=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='goals.goalcategory', verbose_name='Категория')),
+            ],
+            options={
+                'verbose_name': 'Статистика целей',
+                'verbose_name_plural': 'Статистика целей',
+            },
+        ),
+        migrations.CreateModel(
+            name='GoalDueDateStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('due_date', models.DateField(verbose_name='Дата выполнения')),
+                ('count', models.IntegerField(default=0, verbose_name='Количество')),
+                ('board', models.ForeignKey(db_constraint=False, db_index=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='goals.board', verbose_name='Доска')),
+            ],
+            options={
+                'verbose_name': 'Статистика сроков целей',
+                'verbose_name_plural': 'Статистика сроков целей',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='goalstat',
+            constraint=models.UniqueConstraint(fields=('board', 'category', 'status', 'priority'), name='goals_goalstat_unique_key'),
+        ),
+        migrations.AddConstraint(
+            model_name='goalduedatestat',
+            constraint=models.UniqueConstraint(fields=('board', 'due_date'), name='goals_goalduedatestat_unique_key'),
+        ),
+        migrations.RunSQL(
+            GOAL_STATS_TRIGGER,
+            reverse_sql="""
+                DROP TRIGGER goals_goal_stats_insert_trigger ON goals_goal;
+                DROP TRIGGER goals_goal_stats_update_trigger ON goals_goal;
+                DROP TRIGGER goals_goal_stats_delete_trigger ON goals_goal;
+                DROP FUNCTION goals_goal_stats_update();
+            """,
+        ),
+        migrations.RunSQL(GOAL_STATS_BACKFILL, reverse_sql=migrations.RunSQL.noop),
+    ]
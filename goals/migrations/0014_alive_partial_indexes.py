@@ -0,0 +1,62 @@
+# Generated by Django 4.0.1 on 2026-10-18 19:57
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Индексы пересоздаются через CONCURRENTLY, чтобы не блокировать запись в таблицы;
+    # такие операции нельзя выполнять в транзакции. status 4 - Goal.Status.archived
+    atomic = False
+
+    dependencies = [
+        ('goals', '0013_goal_stats'),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name='board',
+            name='goals_board_title_trgm_idx',
+        ),
+        RemoveIndexConcurrently(
+            model_name='goal',
+            name='goals_goal_search_idx',
+        ),
+        RemoveIndexConcurrently(
+            model_name='goalcategory',
+            name='goals_category_title_trgm_idx',
+        ),
+        AddIndexConcurrently(
+            model_name='board',
+            index=django.contrib.postgres.indexes.GinIndex(condition=models.Q(('is_deleted', False)), fields=['title'], name='goals_board_title_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        AddIndexConcurrently(
+            model_name='board',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['id'], name='goals_board_alive_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='goal',
+            index=django.contrib.postgres.indexes.GinIndex(condition=models.Q(('status', 4), _negated=True), fields=['search_vector'], name='goals_goal_search_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='goal',
+            index=models.Index(condition=models.Q(('status', 4), _negated=True), fields=['board', 'title', 'id'], name='goals_goal_board_title_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='goal',
+            index=models.Index(condition=models.Q(('status', 4), _negated=True), fields=['board', 'created', 'id'], name='goals_goal_board_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='goalcategory',
+            index=django.contrib.postgres.indexes.GinIndex(condition=models.Q(('is_deleted', False)), fields=['title'], name='goals_category_title_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        AddIndexConcurrently(
+            model_name='goalcategory',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['board', 'title', 'id'], name='goals_cat_board_title_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='goalcategory',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['board', 'created', 'id'], name='goals_cat_board_created_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.0.1 on 2026-10-18 20:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0015_cold_storage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedgoal',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Количество комментариев'),
+        ),
+        migrations.AddField(
+            model_name='archivedgoal',
+            name='last_activity_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Дата последнего комментария'),
+        ),
+        migrations.AddField(
+            model_name='goal',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество комментариев'),
+        ),
+        migrations.AddField(
+            model_name='goal',
+            name='last_activity_at',
+            field=models.DateTimeField(blank=True, default=None, editable=False, null=True, verbose_name='Дата последнего комментария'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+from django.db import migrations
+from django.db.models import Count, IntegerField, Max, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+BATCH_SIZE = 10_000
+
+
+def backfill_in_batches(model, comment_model):
+    """ Проставляет comment_count и last_activity_at пачками по id, каждая пачка коммитится отдельно """
+    comments = comment_model.objects.filter(goal=OuterRef('pk')).order_by().values('goal')
+    comment_count = Subquery(comments.annotate(count=Count('pk')).values('count')[:1], output_field=IntegerField())
+    last_activity_at = Subquery(comments.annotate(last=Max('updated')).values('last')[:1])
+    last_id = 0
+    while True:
+        ids = list(model.objects.filter(pk__gt=last_id).order_by('pk').values_list('pk', flat=True)[:BATCH_SIZE])
+        if not ids:
+            break
+        model.objects.filter(pk__in=ids).update(
+            comment_count=Coalesce(comment_count, Value(0)), last_activity_at=last_activity_at
+        )
+        last_id = ids[-1]
+
+
+def backfill_activity(apps, schema_editor):
+    backfill_in_batches(apps.get_model("goals", "Goal"), apps.get_model("goals", "GoalComment"))
+    backfill_in_batches(apps.get_model("goals", "ArchivedGoal"), apps.get_model("goals", "ArchivedGoalComment"))
+
+
+class Migration(migrations.Migration):
+    # Без общей транзакции, чтобы не держать блокировки на всех строках сразу
+    atomic = False
+
+    dependencies = [
+        ('goals', '0016_goal_comment_activity'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_activity, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,200 @@
+# Generated by Django 4.0.1 on 2026-10-18 20:20
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+SYNC_TABLES = ('goals_board', 'goals_boardparticipant', 'goals_goalcategory', 'goals_goal', 'goals_goalcomment')
+
+# Номер изменения и транзакция записи проставляются триггерами БД, поэтому учитывают
+# любые способы записи: save(), bulk_create(), bulk_update(), update() и сырой SQL.
+# Номера выдаются в порядке записи, а не фиксации транзакций, поэтому токен синхронизации
+# хранит еще и xmin снимка: строки транзакций, не завершенных к моменту выдачи токена,
+# отдаются клиенту повторно по change_xid
+CHANGE_SEQ_FUNCTION = """
+CREATE SEQUENCE goals_change_seq;
+
+CREATE FUNCTION goals_change_seq_update() RETURNS trigger AS $$
+BEGIN
+    NEW.change_seq := nextval('goals_change_seq');
+    NEW.change_xid := pg_current_xact_id()::text::bigint;
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+-- Аргументы триггера: тип объекта, выражение доски и выражение пользователя по old_rows
+CREATE FUNCTION goals_change_tombstone() RETURNS trigger AS $$
+BEGIN
+    EXECUTE format(
+        'INSERT INTO goals_synctombstone (kind, object_id, board_id, user_id, change_seq, change_xid) '
+        'SELECT %L, id, %s, %s, nextval(''goals_change_seq''), pg_current_xact_id()::text::bigint FROM old_rows',
+        TG_ARGV[0], TG_ARGV[1], TG_ARGV[2]
+    );
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+"""
+
+TOMBSTONE_ARGS = {
+    'goals_board': ('board', 'id', 'NULL'),
+    'goals_boardparticipant': ('participant', 'board_id', 'user_id'),
+    'goals_goalcategory': ('category', 'board_id', 'NULL'),
+    'goals_goal': ('goal', 'board_id', 'NULL'),
+    'goals_goalcomment': ('comment', 'board_id', 'NULL'),
+}
+
+
+def create_triggers(table: str) -> str:
+    return f"""
+CREATE TRIGGER {table}_change_seq_trigger
+    BEFORE INSERT OR UPDATE ON {table}
+    FOR EACH ROW EXECUTE FUNCTION goals_change_seq_update();
+
+CREATE TRIGGER {table}_tombstone_trigger
+    AFTER DELETE ON {table} REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION goals_change_tombstone({', '.join(f"'{arg}'" for arg in TOMBSTONE_ARGS[table])});
+"""
+
+
+def drop_triggers(table: str) -> str:
+    return f"""
+DROP TRIGGER {table}_change_seq_trigger ON {table};
+DROP TRIGGER {table}_tombstone_trigger ON {table};
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('goals', '0017_backfill_goal_comment_activity'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('board', 'Доска'), ('participant', 'Участник'), ('category', 'Категория'), ('goal', 'Цель'), ('comment', 'Комментарий')], max_length=16, verbose_name='Тип объекта')),
+                ('object_id', models.BigIntegerField(verbose_name='ID объекта')),
+                ('change_seq', models.BigIntegerField(verbose_name='Номер изменения')),
+                ('change_xid', models.BigIntegerField(verbose_name='Транзакция изменения')),
+            ],
+            options={
+                'verbose_name': 'Удаленный объект',
+                'verbose_name_plural': 'Удаленные объекты',
+            },
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='change_seq',
+            field=models.BigIntegerField(editable=False, null=True, verbose_name='Номер изменения'),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='change_xid',
+            field=models.BigIntegerField(editable=False, null=True, verbose_name='Транзакция изменения'),
+        ),
+        migrations.AddField(
+            model_name='boardparticipant',
+            name='change_seq',
+            field=models.BigIntegerField(editable=False, null=True, verbose_name='Номер изменения'),
+        ),
+        migrations.AddField(
+            model_name='boardparticipant',
+            name='change_xid',
+            field=models.BigIntegerField(editable=False, null=True, verbose_name='Транзакция изменения'),
+        ),
+        migrations.AddField(
+            model_name='goal',
+            name='change_seq',
+            field=models.BigIntegerField(editable=False, null=True, verbose_name='Номер изменения'),
+        ),
+        migrations.AddField(
+            model_name='goal',
+            name='change_xid',
+            field=models.BigIntegerField(editable=False, null=True, verbose_name='Транзакция изменения'),
+        ),
+        migrations.AddField(
+            model_name='goalcategory',
+            name='change_seq',
+            field=models.BigIntegerField(editable=False, null=True, verbose_name='Номер изменения'),
+        ),
+        migrations.AddField(
+            model_name='goalcategory',
+            name='change_xid',
+            field=models.BigIntegerField(editable=False, null=True, verbose_name='Транзакция изменения'),
+        ),
+        migrations.AddField(
+            model_name='goalcomment',
+            name='change_seq',
+            field=models.BigIntegerField(editable=False, null=True, verbose_name='Номер изменения'),
+        ),
+        migrations.AddField(
+            model_name='goalcomment',
+            name='change_xid',
+            field=models.BigIntegerField(editable=False, null=True, verbose_name='Транзакция изменения'),
+        ),
+        migrations.AddIndex(
+            model_name='boardparticipant',
+            index=models.Index(fields=['board', 'change_seq'], name='goals_participant_change_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='boardparticipant',
+            index=models.Index(fields=['board', 'change_xid'], name='goals_participant_xid_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='goal',
+            index=models.Index(fields=['board', 'change_seq'], name='goals_goal_board_change_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='goal',
+            index=models.Index(fields=['board', 'change_xid'], name='goals_goal_board_xid_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='goalcategory',
+            index=models.Index(fields=['board', 'change_seq'], name='goals_cat_board_change_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='goalcategory',
+            index=models.Index(fields=['board', 'change_xid'], name='goals_cat_board_xid_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='goalcomment',
+            index=models.Index(fields=['board', 'change_seq'], name='goals_comment_board_change_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='goalcomment',
+            index=models.Index(fields=['board', 'change_xid'], name='goals_comment_board_xid_idx'),
+        ),
+        migrations.AddField(
+            model_name='synctombstone',
+            name='board',
+            field=models.ForeignKey(db_constraint=False, db_index=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='goals.board', verbose_name='Доска'),
+        ),
+        migrations.AddField(
+            model_name='synctombstone',
+            name='user',
+            field=models.ForeignKey(db_constraint=False, db_index=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Пользователь'),
+        ),
+        migrations.AddIndex(
+            model_name='synctombstone',
+            index=models.Index(fields=['change_seq'], name='goals_tombstone_change_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='synctombstone',
+            index=models.Index(fields=['change_xid'], name='goals_tombstone_xid_idx'),
+        ),
+        migrations.RunSQL(
+            CHANGE_SEQ_FUNCTION,
+            reverse_sql="""
+                DROP FUNCTION goals_change_tombstone();
+                DROP FUNCTION goals_change_seq_update();
+                DROP SEQUENCE goals_change_seq;
+            """,
+        ),
+        *(
+            migrations.RunSQL(create_triggers(table), reverse_sql=drop_triggers(table))
+            for table in SYNC_TABLES
+        ),
+    ]
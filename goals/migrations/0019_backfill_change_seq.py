@@ -0,0 +1,40 @@
+from django.db import migrations
+
+BATCH_SIZE = 10_000
+SYNC_MODELS = ('Board', 'BoardParticipant', 'GoalCategory', 'Goal', 'GoalComment')
+
+
+def stamp_in_batches(model):
+    """
+    Проставляет номер изменения существующим строкам пачками по id, каждая пачка коммитится отдельно.
+    Значение задает триггер goals_change_seq_update при любом UPDATE строки
+    """
+    last_id = 0
+    while True:
+        ids = list(
+            model.objects.filter(pk__gt=last_id, change_seq__isnull=True)
+            .order_by('pk')
+            .values_list('pk', flat=True)[:BATCH_SIZE]
+        )
+        if not ids:
+            break
+        model.objects.filter(pk__in=ids, change_seq__isnull=True).update(change_seq=None)
+        last_id = ids[-1]
+
+
+def backfill_change_seq(apps, schema_editor):
+    for model_name in SYNC_MODELS:
+        stamp_in_batches(apps.get_model("goals", model_name))
+
+
+class Migration(migrations.Migration):
+    # Без общей транзакции, чтобы не держать блокировки на всех строках сразу
+    atomic = False
+
+    dependencies = [
+        ('goals', '0018_sync_change_seq'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_change_seq, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,137 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+from goals.cache import get_list_cache_key, get_user_version, list_cache_enabled, record
+from goals.fast_serializers import ValuesSerializer, get_values_serializer
+
+
+class ConditionalGetMixin:
+    """
+    Примесь для условных GET-запросов по ETag и Last-Modified.
+    Валидаторы считаются до сериализации, и при совпадении с If-None-Match
+    или If-Modified-Since сразу возвращается 304 Not Modified
+    """
+    def get_validators(self) -> tuple[str | None, object]:
+        """ Метод для получения значения ETag и даты последнего изменения, None - без условных запросов """
+        return None, None
+
+    def make_etag(self, *parts) -> str:
+        """ Метод для построения ETag из адреса запроса, пользователя и версий данных """
+        key = ':'.join(str(part) for part in (self.request.get_full_path(), self.request.user.id, *parts))
+        return hashlib.md5(key.encode()).hexdigest()
+
+    def get(self, request, *args, **kwargs):
+        etag, last_modified = self.get_validators()
+        if etag is None:
+            return super().get(request, *args, **kwargs)
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+
+        response = get_conditional_response(request, etag=quote_etag(etag), last_modified=timestamp)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+
+        response['ETag'] = quote_etag(etag)
+        if timestamp is not None:
+            response['Last-Modified'] = http_date(timestamp)
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+
+
+class ListVersionMixin:
+    """ Примесь для получения версии кеша списков пользователя, одной на запрос """
+    def get_list_version(self) -> str:
+        if not hasattr(self, '_list_version'):
+            self._list_version = get_user_version(self.request.user.id)
+        return self._list_version
+
+
+class ConditionalListMixin(ListVersionMixin, ConditionalGetMixin):
+    """
+    Примесь условных GET-запросов для списков. Когда кеш списков включен, ETag строится
+    по версии кеша пользователя, той же, что входит в ключ закешированного ответа,
+    и 304 возвращается без запросов к БД. Иначе версия не видит записей других процессов,
+    и ETag строится одним агрегатным запросом по видимым строкам: количество строк
+    меняется, когда они пропадают из списка, а max(updated) - при создании и изменении.
+    Last-Modified для списков не отдается: max(updated) не меняется при удалении строк
+    """
+    def get_validators(self):
+        if list_cache_enabled():
+            return self.make_etag(self.get_list_version()), None
+        queryset = self.filter_queryset(self.get_queryset()).order_by()
+        aggregates = queryset.aggregate(count=Count('pk'), updated=Max('updated'))
+        return self.make_etag(aggregates['count'], aggregates['updated']), None
+
+
+class ConditionalObjectMixin(ConditionalGetMixin):
+    """ Примесь условных GET-запросов для одного объекта: версия - поле updated """
+    def get_object(self):
+        if not hasattr(self, '_object'):
+            self._object = super().get_object()
+        return self._object
+
+    def get_validators(self):
+        instance = self.get_object()
+        return self.make_etag(instance.pk, instance.updated), instance.updated
+
+
+class CachedListMixin(ListVersionMixin):
+    """
+    Примесь для кеширования ответов списков.
+    Ключ строится по пользователю, вьюшке и параметрам запроса и включает версию кеша
+    пользователя, которая меняется сигналом boards_changed при записи в любую из его досок.
+    При нескольких пишущих процессах без общего кеша кеширование выключено, см. list_cache_enabled
+    """
+    cache_timeout = 300
+
+    def list(self, request, *args, **kwargs):
+        if not list_cache_enabled():
+            return super().list(request, *args, **kwargs)
+        key = get_list_cache_key(request, type(self).__name__, self.get_list_version())
+        data = cache.get(key)
+        if data is not None:
+            record('hits')
+            return Response(data)
+
+        record('misses')
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(key, response.data, self.cache_timeout)
+        return response
+
+
+class FastReadListMixin:
+    """
+    Примесь быстрого пути чтения для списков.
+    При включенной настройке GOALS_FAST_READ список строится из queryset.values()
+    через ValuesSerializer вместо экземпляров моделей и ModelSerializer
+    """
+    fast_read = None
+
+    def use_fast_read(self) -> bool:
+        """ Метод для проверки, включен ли быстрый путь чтения """
+        if self.fast_read is not None:
+            return self.fast_read
+        return getattr(settings, 'GOALS_FAST_READ', False)
+
+    def get_values_serializer(self) -> ValuesSerializer:
+        """ Метод для получения быстрого сериализатора для сериализатора вьюшки """
+        return get_values_serializer(self.get_serializer_class())
+
+    def list(self, request, *args, **kwargs):
+        if not self.use_fast_read():
+            return super().list(request, *args, **kwargs)
+
+        values_serializer = self.get_values_serializer()
+        queryset = values_serializer.get_queryset(self.filter_queryset(self.get_queryset()))
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(values_serializer.many(page))
+        return Response(values_serializer.many(queryset))
@@ -1,9 +1,58 @@
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
 from django.utils import timezone
 
+from goals.signals import boards_changed
+
+
+class GoalStatus(models.IntegerChoices):
+    """ Класс для присвоения статусу цели """
+    to_do = 1, "К выполнению"
+    in_progress = 2, "В процессе"
+    done = 3, "Выполнено"
+    archived = 4, "Архив"
+
+
+# Условия «живых» строк: по ним фильтруют менеджеры alive, и ими же ограничены частичные
+# индексы, поэтому удаленные доски и категории и архивные цели не раздувают горячие индексы
+NOT_DELETED = models.Q(is_deleted=False)
+ARCHIVED = models.Q(status=GoalStatus.archived)
+NOT_ARCHIVED = ~ARCHIVED
+
+
+class AliveManager(models.Manager):
+    """ Менеджер для неудаленных объектов """
+    alive_condition = NOT_DELETED
+
+    def get_queryset(self):
+        return super().get_queryset().filter(self.alive_condition)
+
+
+class AliveGoalManager(AliveManager):
+    """ Менеджер для неархивных целей """
+    alive_condition = NOT_ARCHIVED
+
+
+class ChangeTrackedModel(models.Model):
+    """
+    Абстрактная модель с номером изменения строки для синхронизации клиентов (goals/sync.py).
+    Поля заполняются триггером БД при каждой вставке и изменении строки:
+    change_seq - значение общей последовательности goals_change_seq,
+    change_xid - id транзакции, записавшей строку
+    ------
+    change_seq : int
+    change_xid : int
+    """
+    class Meta:
+        abstract = True
+
+    change_seq = models.BigIntegerField(verbose_name="Номер изменения", null=True, editable=False)
+    change_xid = models.BigIntegerField(verbose_name="Транзакция изменения", null=True, editable=False)
+
 
 # Board
-class Board(models.Model):
+class Board(ChangeTrackedModel):
     """
     Модель класса  Board
     ------
@@ -15,14 +64,23 @@ class Board(models.Model):
     class Meta:
         verbose_name = "Доска"
         verbose_name_plural = "Доски"
+        indexes = [
+            GinIndex(
+                fields=["title"], name="goals_board_title_trgm_idx", opclasses=["gin_trgm_ops"], condition=NOT_DELETED
+            ),
+            models.Index(fields=["id"], name="goals_board_alive_idx", condition=NOT_DELETED),
+        ]
 
     title = models.CharField(verbose_name="Название", max_length=255)
     is_deleted = models.BooleanField(verbose_name="Удалена", default=False)
     created = models.DateTimeField(auto_now_add=True, verbose_name="Дата создания")
     updated = models.DateTimeField(auto_now=True, verbose_name="Дата последнего обновления")
 
+    objects = models.Manager()
+    alive = AliveManager()
 
-class BoardParticipant(models.Model):
+
+class BoardParticipant(ChangeTrackedModel):
     """
     Модель класса  BoardParticipant
     ------
@@ -36,6 +94,12 @@ class BoardParticipant(models.Model):
         unique_together = ("board", "user")
         verbose_name = "Участник"
         verbose_name_plural = "Участники"
+        indexes = [
+            # Видимость объектов проверяется по пользователю, а не по доске
+            models.Index(fields=["user", "board"], name="goals_participant_user_idx"),
+            models.Index(fields=["board", "change_seq"], name="goals_participant_change_idx"),
+            models.Index(fields=["board", "change_xid"], name="goals_participant_xid_idx"),
+        ]
 
     class Role(models.IntegerChoices):
         """ Класс для присвоения ролей участникам досок """
@@ -65,8 +129,13 @@ class BoardParticipant(models.Model):
     updated = models.DateTimeField(auto_now=True, verbose_name="Дата последнего обновления")
 
 
+def user_board_ids(user):
+    """ Подзапрос id неудаленных досок, в которых участвует пользователь """
+    return BoardParticipant.objects.filter(user=user, board__is_deleted=False).values('board_id')
+
+
 # Goal
-class GoalCategory(models.Model):
+class GoalCategory(ChangeTrackedModel):
     """
     Модель класса  GoalCategory
     ------
@@ -80,6 +149,19 @@ class GoalCategory(models.Model):
     class Meta:
         verbose_name = "Категория"
         verbose_name_plural = "Категории"
+        indexes = [
+            GinIndex(
+                fields=["title"], name="goals_category_title_trgm_idx", opclasses=["gin_trgm_ops"],
+                condition=NOT_DELETED,
+            ),
+            models.Index(fields=["board", "title", "id"], name="goals_cat_board_title_idx", condition=NOT_DELETED),
+            models.Index(
+                fields=["board", "created", "id"], name="goals_cat_board_created_idx", condition=NOT_DELETED
+            ),
+            # Изменения для синхронизации, включая удаленные категории
+            models.Index(fields=["board", "change_seq"], name="goals_cat_board_change_idx"),
+            models.Index(fields=["board", "change_xid"], name="goals_cat_board_xid_idx"),
+        ]
 
     board = models.ForeignKey(
         Board, verbose_name="Доска", on_delete=models.PROTECT, related_name="categories"
@@ -90,8 +172,11 @@ class GoalCategory(models.Model):
     created = models.DateTimeField(auto_now_add=True, verbose_name="Дата создания")
     updated = models.DateTimeField(auto_now=True, verbose_name="Дата последнего обновления")
 
+    objects = models.Manager()
+    alive = AliveManager()
+
 
-class Goal(models.Model):
+class Goal(ChangeTrackedModel):
     """
     Модель класса  Goal
     ------
@@ -102,19 +187,48 @@ class Goal(models.Model):
     due_date : str
     user : int
     category : int
+    board : int
     created : str
     updated : str
+    search_vector : str
+    comment_count : int
+    last_activity_at : str
     """
     class Meta:
         verbose_name = "Цель"
         verbose_name_plural = "Цели"
+        # Индексы под фильтры GoalDateFilter и сортировки списка целей;
+        # архивные цели (Status.archived) в список не попадают и в индексы не включаются
+        indexes = [
+            GinIndex(fields=["search_vector"], name="goals_goal_search_idx", condition=NOT_ARCHIVED),
+            models.Index(
+                fields=["category", "status"], name="goals_goal_cat_status_idx", condition=NOT_ARCHIVED
+            ),
+            models.Index(
+                fields=["category", "priority"], name="goals_goal_cat_priority_idx", condition=NOT_ARCHIVED
+            ),
+            models.Index(
+                fields=["category", "due_date"], name="goals_goal_cat_due_date_idx", condition=NOT_ARCHIVED
+            ),
+            models.Index(
+                fields=["category", "title", "id"], name="goals_goal_cat_title_idx", condition=NOT_ARCHIVED
+            ),
+            models.Index(
+                fields=["category", "created", "id"], name="goals_goal_cat_created_idx", condition=NOT_ARCHIVED
+            ),
+            models.Index(fields=["board", "title", "id"], name="goals_goal_board_title_idx", condition=NOT_ARCHIVED),
+            models.Index(
+                fields=["board", "created", "id"], name="goals_goal_board_created_idx", condition=NOT_ARCHIVED
+            ),
+            # Очередь переноса в холодное хранилище: архивные цели по дате архивации
+            models.Index(fields=["updated"], name="goals_goal_archived_idx", condition=ARCHIVED),
+            # Изменения для синхронизации, включая архивные цели
+            models.Index(fields=["board", "change_seq"], name="goals_goal_board_change_idx"),
+            models.Index(fields=["board", "change_xid"], name="goals_goal_board_xid_idx"),
+        ]
 
-    class Status(models.IntegerChoices):
-        """ Класс для присвоения статусу цели """
-        to_do = 1, "К выполнению"
-        in_progress = 2, "В процессе"
-        done = 3, "Выполнено"
-        archived = 4, "Архив"
+    # Статусы объявлены на уровне модуля, чтобы на них могли ссылаться условия индексов выше
+    Status = GoalStatus
 
     class Priority(models.IntegerChoices):
         """ Класс для присвоения приоритета цели """
@@ -134,28 +248,345 @@ class Goal(models.Model):
     due_date = models.DateField(verbose_name="Дата выполнения", null=True, blank=True, default=None)
     user = models.ForeignKey('core.User', verbose_name="Автор", on_delete=models.PROTECT)
     category = models.ForeignKey(GoalCategory, verbose_name='Категория', related_name='goals', on_delete=models.CASCADE)
+    # Дублирует category.board для проверки доступа без цепочки join, заполняется в save()
+    board = models.ForeignKey(
+        Board, verbose_name="Доска", related_name="goals", on_delete=models.PROTECT, editable=False
+    )
     created = models.DateTimeField(auto_now_add=True, verbose_name="Дата создания")
     updated = models.DateTimeField(auto_now=True, verbose_name="Дата последнего обновления")
+    # Заполняется триггером БД из title и description
+    search_vector = SearchVectorField(verbose_name="Поисковый вектор", null=True, editable=False)
+    # Поддерживаются обработчиками сигналов комментариев через F-выражения,
+    # расхождения исправляет команда reconcile_goal_activity
+    comment_count = models.PositiveIntegerField(verbose_name="Количество комментариев", default=0, editable=False)
+    last_activity_at = models.DateTimeField(
+        verbose_name="Дата последнего комментария", null=True, blank=True, default=None, editable=False
+    )
+
+    objects = models.Manager()
+    alive = AliveGoalManager()
+
+    _loaded_category_id = None
+    _loaded_board_id = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_category_id = instance.__dict__.get('category_id')
+        instance._loaded_board_id = instance.__dict__.get('board_id')
+        return instance
 
+    def save(self, *args, **kwargs):
+        """ Метод сохранения цели с синхронизацией доски по категории """
+        if self.board_id is None or self.category_id != self._loaded_category_id:
+            self.board_id = self.category.board_id
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'board'}
+        super().save(*args, **kwargs)
 
-class GoalComment(models.Model):
+        # При переносе цели на другую доску переносим и ее комментарии
+        if self._loaded_board_id is not None and self._loaded_board_id != self.board_id:
+            self.comments.update(board_id=self.board_id)
+        self._loaded_category_id = self.category_id
+        self._loaded_board_id = self.board_id
+
+
+class GoalComment(ChangeTrackedModel):
     """
     Модель класса GoalComment
     ------
     text : str
     user : int
     goal : int
+    board : int
     created : str
     updated : str
+    search_vector : str
     """
     class Meta:
         verbose_name = "Комментарий"
         verbose_name_plural = "Комментарии"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="goals_comment_search_idx"),
+            models.Index(fields=["goal", "-created"], name="goals_comment_goal_created_idx"),
+            models.Index(fields=["board", "change_seq"], name="goals_comment_board_change_idx"),
+            models.Index(fields=["board", "change_xid"], name="goals_comment_board_xid_idx"),
+        ]
 
     text = models.TextField(verbose_name="Текст")
     user = models.ForeignKey('core.User', verbose_name="Автор", related_name='comments', on_delete=models.PROTECT)
     goal = models.ForeignKey(Goal, verbose_name='Цель', related_name='comments', on_delete=models.PROTECT)
+    # Дублирует goal.board для проверки доступа без цепочки join, заполняется в save()
+    board = models.ForeignKey(
+        Board, verbose_name="Доска", related_name="comments", on_delete=models.PROTECT, editable=False
+    )
+    created = models.DateTimeField(auto_now_add=True, verbose_name="Дата создания")
+    updated = models.DateTimeField(auto_now=True, verbose_name="Дата последнего обновления")
+    # Заполняется триггером БД из text
+    search_vector = SearchVectorField(verbose_name="Поисковый вектор", null=True, editable=False)
+
+    _loaded_goal_id = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_goal_id = instance.__dict__.get('goal_id')
+        return instance
+
+    def save(self, *args, **kwargs):
+        """
+        Метод сохранения комментария с синхронизацией доски по цели.
+        Сохранение идет в одной транзакции с обновлением счетчиков цели в обработчике post_save
+        """
+        if self.board_id is None or self.goal_id != self._loaded_goal_id:
+            self.board_id = self.goal.board_id
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'board'}
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+        self._loaded_goal_id = self.goal_id
+
+
+class ArchivedGoal(models.Model):
+    """
+    Модель класса ArchivedGoal - холодное хранилище давно архивированных целей.
+    Строки переносятся из goals_goal с сохранением id и возвращаются обратно при восстановлении
+    ------
+    title : str
+    description : int
+    status : int
+    priority : int
+    due_date : str
+    user : int
+    category : int
+    board : int
+    created : str
+    updated : str
+    comment_count : int
+    last_activity_at : str
+    archived : str
+    """
+    class Meta:
+        verbose_name = "Цель в архиве"
+        verbose_name_plural = "Цели в архиве"
+
+    id = models.BigIntegerField(primary_key=True, verbose_name="ID")
+    title = models.CharField(verbose_name="Название", max_length=255)
+    description = models.TextField(verbose_name="Описание", null=True, blank=True, default=None)
+    status = models.PositiveSmallIntegerField(verbose_name="Статус", choices=Goal.Status.choices)
+    priority = models.PositiveSmallIntegerField(verbose_name="Приоритет", choices=Goal.Priority.choices)
+    due_date = models.DateField(verbose_name="Дата выполнения", null=True, blank=True, default=None)
+    user = models.ForeignKey('core.User', verbose_name="Автор", related_name="+", on_delete=models.PROTECT)
+    category = models.ForeignKey(
+        GoalCategory, verbose_name='Категория', related_name='archived_goals', on_delete=models.CASCADE
+    )
+    board = models.ForeignKey(
+        Board, verbose_name="Доска", related_name="archived_goals", on_delete=models.PROTECT
+    )
+    created = models.DateTimeField(verbose_name="Дата создания")
+    updated = models.DateTimeField(verbose_name="Дата последнего обновления")
+    comment_count = models.PositiveIntegerField(verbose_name="Количество комментариев", default=0)
+    last_activity_at = models.DateTimeField(verbose_name="Дата последнего комментария", null=True, blank=True)
+    archived = models.DateTimeField(verbose_name="Дата переноса в архив")
+
+
+class ArchivedGoalComment(models.Model):
+    """
+    Модель класса ArchivedGoalComment - комментарии целей из холодного хранилища
+    ------
+    text : str
+    user : int
+    goal : int
+    board : int
+    created : str
+    updated : str
+    """
+    class Meta:
+        verbose_name = "Комментарий в архиве"
+        verbose_name_plural = "Комментарии в архиве"
+
+    id = models.BigIntegerField(primary_key=True, verbose_name="ID")
+    text = models.TextField(verbose_name="Текст")
+    user = models.ForeignKey('core.User', verbose_name="Автор", related_name="+", on_delete=models.PROTECT)
+    goal = models.ForeignKey(
+        ArchivedGoal, verbose_name='Цель', related_name='comments', on_delete=models.CASCADE
+    )
+    board = models.ForeignKey(Board, verbose_name="Доска", related_name="+", on_delete=models.PROTECT)
+    created = models.DateTimeField(verbose_name="Дата создания")
+    updated = models.DateTimeField(verbose_name="Дата последнего обновления")
+
+
+class BoardDeletion(models.Model):
+    """
+    Модель класса BoardDeletion - фоновая задача удаления доски
+    ------
+    board : int
+    status : int
+    categories_deleted : int
+    goals_archived : int
+    goals_total : int
+    created : str
+    updated : str
+    finished : str
+    """
+    class Meta:
+        verbose_name = "Удаление доски"
+        verbose_name_plural = "Удаления досок"
+
+    class Status(models.IntegerChoices):
+        """ Класс для присвоения статуса задаче удаления """
+        pending = 1, "В очереди"
+        running = 2, "Выполняется"
+        done = 3, "Завершено"
+
+    board = models.OneToOneField(
+        Board, verbose_name="Доска", related_name="deletion", on_delete=models.PROTECT
+    )
+    status = models.PositiveSmallIntegerField(
+        verbose_name="Статус", choices=Status.choices, default=Status.pending
+    )
+    categories_deleted = models.PositiveIntegerField(verbose_name="Удалено категорий", default=0)
+    goals_archived = models.PositiveIntegerField(verbose_name="Архивировано целей", default=0)
+    goals_total = models.PositiveIntegerField(verbose_name="Целей к архивации", null=True, default=None)
     created = models.DateTimeField(auto_now_add=True, verbose_name="Дата создания")
     updated = models.DateTimeField(auto_now=True, verbose_name="Дата последнего обновления")
+    finished = models.DateTimeField(verbose_name="Дата завершения", null=True, default=None)
+
+    def run_batch(self, batch_size: int) -> bool:
+        """
+        Метод для обработки одной пачки: сначала удаляются категории, затем архивируются цели.
+        Выборка строится по текущему состоянию строк, поэтому задачу можно прервать и продолжить.
+        Возвращает True, когда удаление доски завершено
+        """
+        with transaction.atomic():
+            if self.goals_total is None:
+                self.status = self.Status.running
+                self.goals_total = Goal.alive.filter(board_id=self.board_id).count()
+
+            category_ids = list(
+                GoalCategory.alive.filter(board_id=self.board_id)
+                .order_by('id').values_list('id', flat=True)[:batch_size]
+            )
+            goal_ids = [] if category_ids else list(
+                Goal.alive.filter(board_id=self.board_id)
+                .order_by('id').values_list('id', flat=True)[:batch_size]
+            )
+            if category_ids:
+                self.categories_deleted += GoalCategory.objects.filter(id__in=category_ids).update(
+                    is_deleted=True, updated=timezone.now()
+                )
+            elif goal_ids:
+                self.goals_archived += Goal.objects.filter(id__in=goal_ids).update(
+                    status=Goal.Status.archived, updated=timezone.now()
+                )
+            else:
+                self.status = self.Status.done
+                self.finished = timezone.now()
+            self.save()
+            if category_ids or goal_ids:
+                boards_changed.send(sender=BoardDeletion, board_ids={self.board_id})
+        return self.status == self.Status.done
+
+
+class GoalStat(models.Model):
+    """
+    Модель класса GoalStat - количество целей доски по категории, статусу и приоритету
+    ------
+    board : int
+    category : int
+    status : int
+    priority : int
+    count : int
+    """
+    class Meta:
+        verbose_name = "Статистика целей"
+        verbose_name_plural = "Статистика целей"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["board", "category", "status", "priority"], name="goals_goalstat_unique_key"
+            ),
+        ]
 
+    # Таблица поддерживается триггерами БД на goals_goal и пересчитывается командой
+    # rebuild_board_stats, поэтому ссылки не ограничиваются внешними ключами в БД;
+    # поиск по доске идет по уникальному ключу, отдельные индексы не нужны
+    board = models.ForeignKey(
+        Board, verbose_name="Доска", related_name="+", on_delete=models.DO_NOTHING,
+        db_constraint=False, db_index=False,
+    )
+    category = models.ForeignKey(
+        GoalCategory, verbose_name="Категория", related_name="+", on_delete=models.DO_NOTHING,
+        db_constraint=False, db_index=False,
+    )
+    status = models.PositiveSmallIntegerField(verbose_name="Статус", choices=Goal.Status.choices)
+    priority = models.PositiveSmallIntegerField(verbose_name="Приоритет", choices=Goal.Priority.choices)
+    count = models.IntegerField(verbose_name="Количество", default=0)
+
+
+class GoalDueDateStat(models.Model):
+    """
+    Модель класса GoalDueDateStat - количество незавершенных целей доски по дате выполнения
+    ------
+    board : int
+    due_date : str
+    count : int
+    """
+    class Meta:
+        verbose_name = "Статистика сроков целей"
+        verbose_name_plural = "Статистика сроков целей"
+        constraints = [
+            models.UniqueConstraint(fields=["board", "due_date"], name="goals_goalduedatestat_unique_key"),
+        ]
 
+    board = models.ForeignKey(
+        Board, verbose_name="Доска", related_name="+", on_delete=models.DO_NOTHING,
+        db_constraint=False, db_index=False,
+    )
+    due_date = models.DateField(verbose_name="Дата выполнения")
+    count = models.IntegerField(verbose_name="Количество", default=0)
+
+
+class SyncTombstone(models.Model):
+    """
+    Модель класса SyncTombstone - запись об удалении строки для синхронизации клиентов.
+    Создается триггером БД при удалении досок, участников, категорий, целей и комментариев,
+    в том числе при переносе целей в холодное хранилище
+    ------
+    kind : str
+    object_id : int
+    board : int
+    user : int
+    change_seq : int
+    change_xid : int
+    """
+    class Meta:
+        verbose_name = "Удаленный объект"
+        verbose_name_plural = "Удаленные объекты"
+        indexes = [
+            models.Index(fields=["change_seq"], name="goals_tombstone_change_idx"),
+            models.Index(fields=["change_xid"], name="goals_tombstone_xid_idx"),
+        ]
+
+    class Kind(models.TextChoices):
+        """ Класс для присвоения типа удаленного объекта """
+        board = "board", "Доска"
+        participant = "participant", "Участник"
+        category = "category", "Категория"
+        goal = "goal", "Цель"
+        comment = "comment", "Комментарий"
+
+    kind = models.CharField(verbose_name="Тип объекта", max_length=16, choices=Kind.choices)
+    object_id = models.BigIntegerField(verbose_name="ID объекта")
+    # Строки доски и пользователя к этому моменту могут быть уже удалены
+    board = models.ForeignKey(
+        Board, verbose_name="Доска", related_name="+", on_delete=models.DO_NOTHING,
+        db_constraint=False, db_index=False,
+    )
+    user = models.ForeignKey(
+        'core.User', verbose_name="Пользователь", related_name="+", on_delete=models.DO_NOTHING,
+        db_constraint=False, db_index=False, null=True,
+    )
+    change_seq = models.BigIntegerField(verbose_name="Номер изменения")
+    change_xid = models.BigIntegerField(verbose_name="Транзакция изменения")
@@ -0,0 +1,151 @@
+import base64
+import binascii
+import json
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(LimitOffsetPagination):
+    """
+    Пагинация limit/offset с опциональным режимом keyset.
+    Режим включается параметром cursor (пустое значение - первая страница):
+    страница выбирается по значениям полей сортировки и id без OFFSET и COUNT,
+    ссылки next/previous содержат непрозрачный курсор
+    """
+    cursor_query_param = 'cursor'
+    keyset_default_limit = 100
+    max_limit = 1_000
+    tie_breaker = 'id'
+    invalid_cursor_message = 'Invalid cursor'
+
+    keyset = False
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """ Метод для выбора страницы в режиме limit/offset или keyset """
+        self.keyset = self.cursor_query_param in request.query_params
+        if not self.keyset:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.limit = self.get_limit(request) or self.keyset_default_limit
+        self.ordering = self.get_ordering(queryset)
+        position, self.reverse = self.decode_cursor(request, queryset.model)
+
+        ordering = self.ordering
+        if self.reverse:
+            ordering = [self.invert(field) for field in ordering]
+        if position is not None:
+            queryset = queryset.filter(self.get_keyset_filter(ordering, position))
+
+        results = list(queryset.order_by(*ordering)[:self.limit + 1])
+        has_more = len(results) > self.limit
+        results = results[:self.limit]
+        if self.reverse:
+            results.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_next_link(self):
+        if not self.keyset:
+            return super().get_next_link()
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.get_position(self.page[-1]), reverse=False)
+
+    def get_previous_link(self):
+        if not self.keyset:
+            return super().get_previous_link()
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.get_position(self.page[0]), reverse=True)
+
+    def get_ordering(self, queryset) -> list[str]:
+        """ Метод для получения сортировки queryset с id в качестве последнего ключа """
+        ordering = [
+            field for field in (queryset.query.order_by or queryset.model._meta.ordering)
+            if isinstance(field, str)
+        ]
+        if not any(field.lstrip('-') in (self.tie_breaker, 'pk') for field in ordering):
+            descending = bool(ordering) and ordering[0].startswith('-')
+            ordering.append(f"-{self.tie_breaker}" if descending else self.tie_breaker)
+        return ordering
+
+    @staticmethod
+    def invert(field: str) -> str:
+        """ Метод для смены направления сортировки поля """
+        return field[1:] if field.startswith('-') else f"-{field}"
+
+    @staticmethod
+    def get_keyset_filter(ordering: list[str], position: list) -> Q:
+        """ Метод для построения условия «строка после position» для заданной сортировки """
+        keyset_filter = Q()
+        equal = Q()
+        for field, value in zip(ordering, position):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            keyset_filter |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+        return keyset_filter
+
+    def get_position(self, instance) -> list:
+        """ Метод для получения значений ключей сортировки объекта или строки values() """
+        if isinstance(instance, dict):
+            return [instance[field.lstrip('-')] for field in self.ordering]
+        return [getattr(instance, field.lstrip('-')) for field in self.ordering]
+
+    def encode_cursor(self, position: list, reverse: bool) -> str:
+        """ Метод для построения ссылки с закодированным курсором """
+        payload = json.dumps({'o': self.ordering, 'p': position, 'r': reverse}, default=str)
+        cursor = base64.urlsafe_b64encode(payload.encode()).decode()
+        url = remove_query_param(self.request.build_absolute_uri(), self.offset_query_param)
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request, model) -> tuple[list | None, bool]:
+        """ Метод для разбора курсора из параметров запроса """
+        cursor = request.query_params[self.cursor_query_param]
+        if not cursor:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            position, reverse = payload['p'], bool(payload['r'])
+            if payload['o'] != self.ordering or not isinstance(position, list) or len(position) != len(self.ordering):
+                raise ValueError
+            position = self.coerce_position(model, position)
+        except (binascii.Error, ValueError, TypeError, KeyError, ValidationError, FieldDoesNotExist):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def coerce_position(self, model, position: list) -> list:
+        """
+        Метод для приведения значений курсора к типам полей сортировки (id - int, created - datetime,
+        title - str): подделанный курсор должен давать «Invalid cursor», а не ошибку в запросе к БД
+        """
+        values = []
+        for field_name, value in zip(self.ordering, position):
+            name = field_name.lstrip('-')
+            field = model._meta.pk if name == 'pk' else model._meta.get_field(name)
+            if value is None and field.null:
+                values.append(None)
+                continue
+            if value is None or isinstance(value, (dict, list, bool)):
+                raise ValueError
+            values.append(field.to_python(value))
+        return values
@@ -3,64 +3,95 @@ from rest_framework import permissions
 from goals.models import BoardParticipant
 
 
-class BoardPermissions(permissions.BasePermission):
-    """ Класс для проверки и предоставления доступа к доскам """
+class BoardRoleResolver:
+    """
+    Класс для определения ролей пользователя на досках в рамках одного запроса.
+    Роли загружаются из BoardParticipant не более одного раза на доску
+    и запоминаются на объекте запроса
+    """
+    request_attr = '_board_roles'
+
+    def __init__(self, request):
+        self.user = request.user
+        self.roles: dict[int, int | None] = {}
+
+    @classmethod
+    def for_request(cls, request) -> 'BoardRoleResolver':
+        """ Метод для получения резолвера, привязанного к запросу """
+        resolver = getattr(request, cls.request_attr, None)
+        if resolver is None:
+            resolver = cls(request)
+            setattr(request, cls.request_attr, resolver)
+        return resolver
+
+    def load(self, board_ids) -> None:
+        """ Метод для загрузки ролей пользователя на досках одним запросом """
+        missing = {board_id for board_id in board_ids if board_id not in self.roles}
+        if not missing:
+            return
+        self.roles.update(dict.fromkeys(missing))
+        self.roles.update(
+            BoardParticipant.objects.filter(
+                user=self.user,
+                board_id__in=missing,
+            ).values_list('board_id', 'role')
+        )
+
+    def get_role(self, board_id: int) -> int | None:
+        """ Метод для получения роли пользователя на доске """
+        self.load([board_id])
+        return self.roles[board_id]
+
+
+class BoardRolePermissions(permissions.BasePermission):
+    """ Базовый класс для проверки доступа по роли пользователя на доске """
+    edit_roles = (
+        BoardParticipant.Role.owner,
+        BoardParticipant.Role.writer,
+    )
+
+    def get_board_id(self, obj) -> int:
+        """ Метод для получения id доски, к которой относится объект: категории, цели или комментария """
+        return obj.board_id
+
+    def has_board_role(self, request, obj, roles=None) -> bool:
+        """ Метод для проверки роли пользователя на доске объекта """
+        role = BoardRoleResolver.for_request(request).get_role(self.get_board_id(obj))
+        if roles is None:
+            return role is not None
+        return role in roles
+
     def has_object_permission(self, request, view, obj):
         if not request.user.is_authenticated:
             return False
         if request.method in permissions.SAFE_METHODS:
-            return BoardParticipant.objects.filter(
-                user=request.user,
-                board=obj
-            ).exists()
-        return BoardParticipant.objects.filter(
-            user=request.user,
-            board=obj,
-            role=BoardParticipant.Role.owner
-        ).exists()
-
-
-class GoalCategoryPermissions(permissions.BasePermission):
+            return self.has_board_role(request, obj)
+        return self.has_board_role(request, obj, self.edit_roles)
+
+
+class BoardPermissions(BoardRolePermissions):
+    """ Класс для проверки и предоставления доступа к доскам """
+    edit_roles = (BoardParticipant.Role.owner,)
+
+    def get_board_id(self, board):
+        return board.id
+
+
+class BoardContentPermissions(BoardRolePermissions):
+    """ Класс для проверки доступа к наполнению доски, например к импорту целей и комментариев """
+    def get_board_id(self, board):
+        return board.id
+
+
+class GoalCategoryPermissions(BoardRolePermissions):
     """ Класс для проверки и предоставления доступа к категориям целей """
-    def has_object_permission(self, request, view, category):
-        if not request.user.is_authenticated:
-            return False
-        if request.method in permissions.SAFE_METHODS:
-            return BoardParticipant.objects.filter(
-                user=request.user,
-                board=category.board
-            ).exists()
-        return BoardParticipant.objects.filter(
-            user=request.user,
-            board=category.board,
-            role__in=[
-                BoardParticipant.Role.owner,
-                BoardParticipant.Role.writer,
-            ]
-        ).exists()
-
-
-class GoalPermissions(permissions.BasePermission):
+
+
+class GoalPermissions(BoardRolePermissions):
     """ Класс для проверки и предоставления доступа к целям """
-    def has_object_permission(self, request, view, goal):
-        if not request.user.is_authenticated:
-            return False
-        if request.method in permissions.SAFE_METHODS:
-            return BoardParticipant.objects.filter(
-                user=request.user,
-                board=goal.category.board
-            ).exists()
-        return BoardParticipant.objects.filter(
-            user=request.user,
-            board=goal.category.board,
-            role__in=[
-                BoardParticipant.Role.owner,
-                BoardParticipant.Role.writer,
-            ]
-        ).exists()
-
-
-class CommentPermissions(permissions.BasePermission):
+
+
+class CommentPermissions(BoardRolePermissions):
     """ Класс для проверки и предоставления доступа к комментариям """
     def has_object_permission(self, request, view, comment):
         if not request.user.is_authenticated:
@@ -68,13 +99,6 @@ class CommentPermissions(permissions.BasePermission):
         if request.method in permissions.SAFE_METHODS:
             return True
         if request.method == 'POST':
-            return BoardParticipant.objects.filter(
-                user=request.user,
-                board=comment.goal.category.board,
-                role__in=[
-                    BoardParticipant.Role.owner,
-                    BoardParticipant.Role.writer,
-                ]
-            ).exists()
+            return self.has_board_role(request, comment, self.edit_roles)
         if request.method in ['PUT', 'PATCH', 'DELETE']:
-            return comment.user == request.user
+            return comment.user_id == request.user.id
@@ -0,0 +1,99 @@
+import csv
+import io
+from abc import ABC, abstractmethod
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # orjson необязателен, без него используется стандартный JSONRenderer
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSON-рендерер на orjson, совпадающий по байтам с JSONRenderer DRF для компактного вывода:
+    символы вне ASCII без экранирования, U+2028 и U+2029 экранируются.
+    С отступами, при ASCII-выводе, для неподдерживаемых типов и без orjson работает JSONRenderer
+    """
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if orjson is None or indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
+
+
+class StreamingRenderer(BaseRenderer, ABC):
+    """
+    Базовый класс рендереров потоковой выгрузки.
+    Метод stream отдает строки частями по chunk_size, не накапливая выгрузку в памяти;
+    render используется для обычных ответов, например ошибок
+    """
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        rows = data if isinstance(data, list) else [data]
+        return ''.join(self.stream(rows, list(self.flatten(rows[0])) if rows else [])).encode()
+
+    @abstractmethod
+    def stream(self, rows, field_names: list[str], chunk_size: int = 1_000):
+        """ Метод для построчного формирования выгрузки """
+
+    @classmethod
+    def flatten(cls, data: dict, prefix: str = '') -> dict:
+        """ Метод для раскрытия вложенных словарей в ключи через точку и списков в строку """
+        result = {}
+        for key, value in data.items():
+            if isinstance(value, dict):
+                result.update(cls.flatten(value, f"{prefix}{key}."))
+            elif isinstance(value, list):
+                result[f"{prefix}{key}"] = '; '.join(str(item) for item in value)
+            else:
+                result[f"{prefix}{key}"] = value
+        return result
+
+
+class NDJSONRenderer(StreamingRenderer):
+    """ Рендерер выгрузки в формате NDJSON: один JSON-объект на строку """
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+
+    def stream(self, rows, field_names, chunk_size=1_000):
+        dumps = FastJSONRenderer().render
+        lines = []
+        for row in rows:
+            lines.append(dumps(row).decode())
+            if len(lines) >= chunk_size:
+                yield '\n'.join(lines) + '\n'
+                lines = []
+        if lines:
+            yield '\n'.join(lines) + '\n'
+
+
+class CSVRenderer(StreamingRenderer):
+    """ Рендерер выгрузки в формате CSV с заголовком, вложенные поля раскрываются через точку """
+    media_type = 'text/csv'
+    format = 'csv'
+
+    def stream(self, rows, field_names, chunk_size=1_000):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(field_names)
+        count = 0
+        for row in rows:
+            writer.writerow(self.flatten(row).values())
+            count += 1
+            if count % chunk_size == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue()
@@ -1,9 +1,14 @@
 from django.db import transaction
+from django.db.models import Prefetch, prefetch_related_objects
+from django.utils import timezone
 from rest_framework import serializers
 
 from core.models import User
 from core.serializers import UserSerializer
-from goals.models import Goal, GoalCategory, GoalComment, Board, BoardParticipant
+from goals.models import ArchivedGoal, Goal, GoalCategory, GoalComment, Board, BoardDeletion, BoardParticipant
+
+# Служебные поля синхронизации (ChangeTrackedModel) в ответы API не попадают
+CHANGE_FIELDS = ("change_seq", "change_xid")
 
 
 # GoalCategory
@@ -15,7 +20,7 @@ class GoalCategoryCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = GoalCategory
         read_only_fields = ("id", "created", "updated", "user")
-        fields = "__all__"
+        exclude = CHANGE_FIELDS
 
 
 class GoalCategorySerializer(serializers.ModelSerializer):
@@ -25,7 +30,15 @@ class GoalCategorySerializer(serializers.ModelSerializer):
     class Meta:
         model = GoalCategory
         read_only_fields = ("id", "created", "updated", "user", "board")
-        fields = "__all__"
+        exclude = CHANGE_FIELDS
+
+
+class GoalCategorySuggestSerializer(serializers.ModelSerializer):
+    """ Сериализатор подсказок для поиска категорий """
+    class Meta:
+        model = GoalCategory
+        fields = ("id", "title", "board")
+        read_only_fields = fields
 
 
 # Goal
@@ -37,7 +50,7 @@ class GoalCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Goal
         read_only_fields = ("id", "created", "updated", "user")
-        fields = "__all__"
+        exclude = ("search_vector", "board", *CHANGE_FIELDS)
 
     def validate_category(self, value):
         """ Метод проверки прав на взаимодействие с категорией """
@@ -57,7 +70,7 @@ class GoalSerializer(serializers.ModelSerializer):
     class Meta:
         model = Goal
         read_only_fields = ("id", "created", "updated", "user")
-        fields = "__all__"
+        exclude = ("search_vector", "board", *CHANGE_FIELDS)
 
     def validate_category(self, value):
         if value.user != self.context["request"].user:
@@ -66,6 +79,43 @@ class GoalSerializer(serializers.ModelSerializer):
         return value
 
 
+class ArchivedGoalSerializer(serializers.ModelSerializer):
+    """ Сериализатор цели из холодного хранилища, совпадает по полям с GoalSerializer """
+    user = UserSerializer(read_only=True)
+
+    class Meta:
+        model = ArchivedGoal
+        read_only_fields = ("id", "created", "updated", "user")
+        exclude = ("board", "archived")
+
+
+class GoalBulkSerializer(serializers.ModelSerializer):
+    """
+    Сериализатор одного элемента пакетного создания и обновления целей.
+    Категория принимается как id и проверяется для всего пакета одним запросом во вьюшке
+    """
+    id = serializers.IntegerField(required=False)
+    category = serializers.IntegerField()
+
+    class Meta:
+        model = Goal
+        fields = ("id", "title", "description", "status", "priority", "due_date", "category")
+
+
+class GoalImportSerializer(serializers.ModelSerializer):
+    """
+    Сериализатор одной строки импорта целей.
+    Категория принимается как id, автор - как username участника доски;
+    обе ссылки проверяются для всего файла запросами к промежуточной таблице
+    """
+    category = serializers.IntegerField()
+    user = serializers.CharField(required=False, max_length=150)
+
+    class Meta:
+        model = Goal
+        fields = ("title", "description", "status", "priority", "due_date", "category", "user")
+
+
 # GoalComment
 
 class GoalCommentCreateSerializer(serializers.ModelSerializer):
@@ -75,7 +125,7 @@ class GoalCommentCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = GoalComment
         read_only_fields = ("id", "created", "updated", "user")
-        fields = "__all__"
+        exclude = ("search_vector", "board", *CHANGE_FIELDS)
 
 
 class GoalCommentSerializer(serializers.ModelSerializer):
@@ -85,7 +135,17 @@ class GoalCommentSerializer(serializers.ModelSerializer):
     class Meta:
         model = GoalComment
         read_only_fields = ("id", "created", "updated", "user", "goal")
-        fields = "__all__"
+        exclude = ("search_vector", "board", *CHANGE_FIELDS)
+
+
+class GoalCommentImportSerializer(serializers.ModelSerializer):
+    """ Сериализатор одной строки импорта комментариев, цель принимается как id, автор - как username """
+    goal = serializers.IntegerField()
+    user = serializers.CharField(required=False, max_length=150)
+
+    class Meta:
+        model = GoalComment
+        fields = ("goal", "text", "user")
 
 
 # Board Participant
@@ -94,16 +154,24 @@ class BoardParticipantSerializer(serializers.ModelSerializer):
     role = serializers.ChoiceField(
         required=True, choices=BoardParticipant.editable_choices
     )
-    user = serializers.SlugRelatedField(
-        slug_field="username", queryset=User.objects.all()
-    )
+    # Пользователи по username загружаются одним запросом в BoardSerializer.validate_participants
+    user = serializers.CharField()
 
     class Meta:
         model = BoardParticipant
-        fields = "__all__"
+        exclude = CHANGE_FIELDS
         read_only_fields = ("id", "created", "updated", "board")
 
 
+class BoardParticipantSyncSerializer(serializers.ModelSerializer):
+    """ Сериализатор участника доски для синхронизации, пользователь выводится по username """
+    user = serializers.CharField(source="user.username", read_only=True)
+
+    class Meta:
+        model = BoardParticipant
+        exclude = CHANGE_FIELDS
+
+
 # Board
 class BoardCreateSerializer(serializers.ModelSerializer):
     """ Сериализатор для создания досок """
@@ -112,7 +180,7 @@ class BoardCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Board
         read_only_fields = ("id", "created", "updated")
-        fields = "__all__"
+        exclude = CHANGE_FIELDS
 
     def create(self, validated_data):
         """ Метод для создания досок """
@@ -131,43 +199,80 @@ class BoardSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Board
-        fields = "__all__"
+        exclude = CHANGE_FIELDS
         read_only_fields = ("id", "created", "updated")
 
+    def validate_participants(self, participants):
+        """ Метод для получения пользователей всех участников одним запросом """
+        usernames = {part["user"] for part in participants}
+        users = {user.username: user for user in User.objects.filter(username__in=usernames)}
+
+        errors = [
+            {} if part["user"] in users
+            else {"user": [f"Object with username={part['user']} does not exist."]}
+            for part in participants
+        ]
+        if any(errors):
+            raise serializers.ValidationError(errors)
+
+        for part in participants:
+            part["user"] = users[part["user"]]
+        return participants
+
     def update(self, instance, validated_data):
-        """ Метод для обновления данных по участникам дсосок """
+        """ Метод для обновления данных по участникам досок пакетными запросами """
         owner = validated_data.pop("user", self.context["request"].user)
         new_participants = validated_data.pop("participants")
         new_by_id = {part["user"].id: part for part in new_participants}
+        new_by_id.pop(owner.id, None)
+
+        to_delete, to_update = [], []
+        now = timezone.now()
+        for old_participant in instance.participants.exclude(user=owner):
+            new_part = new_by_id.pop(old_participant.user_id, None)
+            if new_part is None:
+                to_delete.append(old_participant.id)
+            elif old_participant.role != new_part["role"]:
+                old_participant.role = new_part["role"]
+                old_participant.updated = now
+                to_update.append(old_participant)
+        to_create = [
+            BoardParticipant(board=instance, user=new_part["user"], role=new_part["role"])
+            for new_part in new_by_id.values()
+        ]
 
-        old_participants = instance.participants.exclude(user=owner)
         with transaction.atomic():
-            for old_participant in old_participants:
-                if old_participant.user_id not in new_by_id:
-                    old_participant.delete()
-                else:
-                    if (
-                            old_participant.role
-                            != new_by_id[old_participant.user_id]["role"]
-                    ):
-                        old_participant.role = new_by_id[old_participant.user_id][
-                            "role"
-                        ]
-                        old_participant.save()
-                    new_by_id.pop(old_participant.user_id)
-            for new_part in new_by_id.values():
-                BoardParticipant.objects.create(
-                    board=instance, user=new_part["user"], role=new_part["role"]
-                )
+            if to_delete:
+                BoardParticipant.objects.filter(id__in=to_delete).delete()
+            if to_update:
+                BoardParticipant.objects.bulk_update(to_update, ["role", "updated"])
+            if to_create:
+                BoardParticipant.objects.bulk_create(to_create)
 
             instance.title = validated_data["title"]
             instance.save()
 
         return instance
 
+    def to_representation(self, instance):
+        # После обновления кеш prefetch сбрасывается, загружаем участников заново одним запросом
+        if "participants" not in getattr(instance, "_prefetched_objects_cache", {}):
+            prefetch_related_objects(
+                [instance],
+                Prefetch("participants", queryset=BoardParticipant.objects.select_related("user").order_by("id")),
+            )
+        return super().to_representation(instance)
+
 
 class BoardListSerializer(serializers.ModelSerializer):
     """ Сериализатор списка досок """
     class Meta:
         model = Board
+        exclude = CHANGE_FIELDS
+
+
+class BoardDeletionSerializer(serializers.ModelSerializer):
+    """ Сериализатор хода удаления доски """
+    class Meta:
+        model = BoardDeletion
         fields = "__all__"
@@ -0,0 +1,64 @@
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+# Сигнал об изменении данных досок. Отправляется обработчиками post_save/post_delete
+# и явно в местах массовой записи (update(), bulk_create(), bulk_update()),
+# которые не вызывают сигналы моделей. Аргументы: board_ids и необязательный user_ids
+boards_changed = Signal()
+
+
+@receiver([post_save, post_delete], sender='goals.Board')
+def board_changed(sender, instance, **kwargs):
+    """ Обработчик изменения доски """
+    boards_changed.send(sender=sender, board_ids={instance.id})
+
+
+@receiver([post_save, post_delete], sender='goals.BoardParticipant')
+def participant_changed(sender, instance, **kwargs):
+    """ Обработчик изменения участника: состав досок меняется только у самого пользователя """
+    boards_changed.send(sender=sender, board_ids=set(), user_ids={instance.user_id})
+
+
+@receiver([post_save, post_delete], sender='goals.GoalCategory')
+@receiver([post_save, post_delete], sender='goals.GoalComment')
+def board_content_changed(sender, instance, **kwargs):
+    """ Обработчик изменения категории или комментария """
+    boards_changed.send(sender=sender, board_ids={instance.board_id})
+
+
+@receiver([post_save, post_delete], sender='goals.Goal')
+def goal_changed(sender, instance, **kwargs):
+    """ Обработчик изменения цели, в том числе переноса на другую доску """
+    board_ids = {instance.board_id, instance._loaded_board_id} - {None}
+    boards_changed.send(sender=sender, board_ids=board_ids)
+
+
+@receiver(post_save, sender='goals.GoalComment')
+def comment_saved(sender, instance, created, raw=False, **kwargs):
+    """
+    Обработчик сохранения комментария: счетчик комментариев и дата последней активности
+    цели обновляются одним UPDATE с F-выражениями, без чтения цели
+    """
+    if raw:
+        return
+    goals = sender.goal.field.related_model.objects
+    last_activity_at = Greatest('last_activity_at', Value(instance.updated))
+    moved_from = instance._loaded_goal_id if instance._loaded_goal_id != instance.goal_id else None
+    if created or moved_from is not None:
+        goals.filter(pk=instance.goal_id).update(
+            comment_count=F('comment_count') + 1, last_activity_at=last_activity_at
+        )
+    else:
+        goals.filter(pk=instance.goal_id).update(last_activity_at=last_activity_at)
+    if not created and moved_from is not None:
+        goals.filter(pk=moved_from).update(comment_count=Greatest(F('comment_count') - 1, 0))
+
+
+@receiver(post_delete, sender='goals.GoalComment')
+def comment_deleted(sender, instance, **kwargs):
+    """ Обработчик удаления комментария: счетчик цели уменьшается, дата активности не меняется """
+    sender.goal.field.related_model.objects.filter(pk=instance.goal_id).update(
+        comment_count=Greatest(F('comment_count') - 1, 0)
+    )
@@ -0,0 +1,67 @@
+from django.db import connection, transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from goals.models import Goal, GoalDueDateStat, GoalStat
+
+OPEN_STATUSES = (Goal.Status.to_do, Goal.Status.in_progress)
+
+
+def get_board_stats(board_id: int) -> dict:
+    """
+    Функция для получения статистики целей доски из сводных таблиц.
+    Читает строки GoalStat доски (не больше категорий x статусов x приоритетов)
+    и сумму просроченных незавершенных целей, не обращаясь к goals_goal
+    """
+    by_status = dict.fromkeys(Goal.Status.values, 0)
+    by_priority = dict.fromkeys(Goal.Priority.values, 0)
+    by_category = {}
+    rows = GoalStat.objects.filter(board_id=board_id).values_list('category_id', 'status', 'priority', 'count')
+    for category_id, status, priority, count in rows:
+        by_status[status] += count
+        if status == Goal.Status.archived:
+            continue
+        by_priority[priority] += count
+        by_category[category_id] = by_category.get(category_id, 0) + count
+
+    overdue = GoalDueDateStat.objects.filter(
+        board_id=board_id, due_date__lt=timezone.localdate()
+    ).aggregate(count=Sum('count'))['count']
+    return {
+        'board': board_id,
+        'total': sum(count for status, count in by_status.items() if status != Goal.Status.archived),
+        'overdue': overdue or 0,
+        'by_status': by_status,
+        'by_priority': by_priority,
+        'by_category': {category_id: count for category_id, count in sorted(by_category.items()) if count},
+    }
+
+
+def rebuild_stats(board_ids=None) -> None:
+    """
+    Функция для полного пересчета сводных таблиц по goals_goal для всех или указанных досок.
+    На время пересчета запись в goals_goal блокируется, чтение остается доступным
+    """
+    board_filter, params = '', []
+    if board_ids is not None:
+        board_filter, params = 'WHERE board_id = ANY(%s)', [list(board_ids)]
+    open_filter = 'AND' if board_filter else 'WHERE'
+    statuses = ', '.join(str(status) for status in OPEN_STATUSES)
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"LOCK TABLE {Goal._meta.db_table} IN SHARE MODE")
+        for model in (GoalStat, GoalDueDateStat):
+            cursor.execute(f"DELETE FROM {model._meta.db_table} {board_filter}", params)
+        cursor.execute(
+            f"INSERT INTO {GoalStat._meta.db_table} (board_id, category_id, status, priority, count) "
+            f"SELECT board_id, category_id, status, priority, count(*) FROM {Goal._meta.db_table} {board_filter} "
+            f"GROUP BY board_id, category_id, status, priority",
+            params,
+        )
+        cursor.execute(
+            f"INSERT INTO {GoalDueDateStat._meta.db_table} (board_id, due_date, count) "
+            f"SELECT board_id, due_date, count(*) FROM {Goal._meta.db_table} {board_filter} "
+            f"{open_filter} due_date IS NOT NULL AND status IN ({statuses}) "
+            f"GROUP BY board_id, due_date",
+            params,
+        )
@@ -0,0 +1,109 @@
+import base64
+import binascii
+from typing import NamedTuple
+
+from django.db import connection
+from django.db.models import Q
+
+from goals.fast_serializers import get_values_serializer
+from goals.models import Board, BoardParticipant, Goal, GoalCategory, GoalComment, SyncTombstone, user_board_ids
+from goals.serializers import (
+    BoardListSerializer, BoardParticipantSyncSerializer, GoalCategorySerializer, GoalCommentSerializer, GoalSerializer,
+)
+
+
+class SyncToken(NamedTuple):
+    """
+    Токен синхронизации: последний выданный номер изменения и xmin снимка на момент выдачи.
+    Изменения после токена - строки с большим номером и строки транзакций, которые
+    к моменту выдачи еще не завершились (их id транзакции не меньше xmin)
+    """
+    seq: int
+    xmin: int
+
+    def encode(self) -> str:
+        """ Метод для кодирования токена в непрозрачную строку """
+        return base64.urlsafe_b64encode(f"{self.seq}:{self.xmin}".encode()).decode()
+
+    @classmethod
+    def decode(cls, token: str) -> 'SyncToken':
+        """ Метод для разбора токена, при ошибке выбрасывает ValueError """
+        try:
+            seq, xmin = base64.urlsafe_b64decode(token.encode()).decode().split(':')
+            return cls(int(seq), int(xmin))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as error:
+            raise ValueError('Invalid token') from error
+
+    def changed(self) -> Q:
+        """ Метод для получения условия строк, измененных после токена """
+        return Q(change_seq__gt=self.seq) | Q(change_xid__gte=self.xmin)
+
+
+# Разделы ответа в виде (ключ, модель, менеджер полной выгрузки доски, сериализатор, поле доски)
+SYNC_SECTIONS = (
+    ('boards', Board, Board.alive, BoardListSerializer, 'id'),
+    ('participants', BoardParticipant, BoardParticipant.objects, BoardParticipantSyncSerializer, 'board_id'),
+    ('categories', GoalCategory, GoalCategory.alive, GoalCategorySerializer, 'board_id'),
+    ('goals', Goal, Goal.alive, GoalSerializer, 'board_id'),
+    ('comments', GoalComment, GoalComment.objects, GoalCommentSerializer, 'board_id'),
+)
+
+
+def get_current_token() -> SyncToken:
+    """
+    Функция для получения токена текущего состояния.
+    Вызывается до чтения изменений: все строки с номером не больше токена, которые
+    не попадут в ответ, записаны незавершенными транзакциями и будут отданы по xmin
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT CASE WHEN is_called THEN last_value ELSE 0 END, "
+            "pg_snapshot_xmin(pg_current_snapshot())::text::bigint FROM goals_change_seq"
+        )
+        return SyncToken(*cursor.fetchone())
+
+
+def get_changes(user, since: SyncToken | None) -> dict:
+    """
+    Функция для получения изменений всех досок пользователя после токена since одним ответом.
+    Изменения выбираются по индексам (board, change_seq) и (board, change_xid), поэтому
+    стоимость зависит от объема изменений, а не от объема данных. Без токена и для досок,
+    в которые пользователь добавлен после токена, отдаются все живые строки доски.
+    Удаленные строки перечисляются в deleted, удаленные мягко и архивные - в своих разделах
+    """
+    token = get_current_token()
+    # Доски в разделе boards отдаются и после мягкого удаления, содержимое - только живых досок
+    participant_boards = BoardParticipant.objects.filter(user=user).values('board_id')
+    content_boards = user_board_ids(user)
+    if since is None:
+        full_boards = list(content_boards.values_list('board_id', flat=True))
+    else:
+        full_boards = list(content_boards.filter(since.changed()).values_list('board_id', flat=True))
+
+    data = {'token': token.encode()}
+    for key, model, alive, serializer_class, board_field in SYNC_SECTIONS:
+        values_serializer = get_values_serializer(serializer_class)
+        querysets = []
+        if since is not None:
+            boards = participant_boards if model is Board else content_boards
+            querysets.append(
+                model.objects.filter(since.changed(), **{f"{board_field}__in": boards}).order_by('change_seq')
+            )
+        if full_boards:
+            querysets.append(alive.filter(**{f"{board_field}__in": full_boards}).order_by('id'))
+        rows = {}
+        for queryset in querysets:
+            for row in values_serializer.iterator(values_serializer.get_queryset(queryset)):
+                rows[row['id']] = row
+        data[key] = list(rows.values())
+
+    data['deleted'] = []
+    if since is not None:
+        tombstones = SyncTombstone.objects.filter(
+            since.changed(),
+            Q(board_id__in=content_boards) | Q(kind=SyncTombstone.Kind.participant, user=user),
+        ).order_by('change_seq').values_list('kind', 'object_id', 'board_id')
+        data['deleted'] = [
+            {'type': kind, 'id': object_id, 'board': board_id} for kind, object_id, board_id in tombstones
+        ]
+    return data
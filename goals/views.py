@@ -1,11 +1,53 @@
-from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.generics import CreateAPIView, ListAPIView, RetrieveUpdateDestroyAPIView
-from rest_framework import permissions, filters
-from rest_framework.pagination import LimitOffsetPagination
+import codecs
 
-from goals.filters import GoalDateFilter
-from goals.models import Goal, GoalCategory, GoalComment
-from goals.permissions import BoardPermissions, GoalCategoryPermissions, GoalPermissions, CommentPermissions
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+from django.http import Http404, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework.exceptions import NotFound, UnsupportedMediaType, ValidationError
+from rest_framework.generics import (
+    CreateAPIView,
+    GenericAPIView,
+    ListAPIView,
+    RetrieveAPIView,
+    RetrieveUpdateDestroyAPIView,
+)
+from rest_framework import permissions, filters, status
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from goals.filters import FullTextSearchFilter, GoalDateFilter, TrigramSearchFilter
+from goals.cache import get_stats
+from goals.cold_storage import restore_goals
+from goals.fast_serializers import get_values_serializer
+from goals.importer import GoalCommentImporter, GoalImporter
+from goals.mixins import CachedListMixin, ConditionalListMixin, ConditionalObjectMixin, FastReadListMixin
+from goals.models import (
+    ArchivedGoal,
+    Board,
+    BoardDeletion,
+    BoardParticipant,
+    Goal,
+    GoalCategory,
+    GoalComment,
+    user_board_ids,
+)
+from goals.pagination import KeysetPagination
+from goals.renderers import CSVRenderer, FastJSONRenderer, NDJSONRenderer
+from goals.signals import boards_changed
+from goals.stats import get_board_stats
+from goals.sync import SyncToken, get_changes
+from goals.permissions import (
+    BoardContentPermissions,
+    BoardPermissions,
+    BoardRoleResolver,
+    CommentPermissions,
+    GoalCategoryPermissions,
+    GoalPermissions,
+)
 from goals.serializers import *
 
 
@@ -17,25 +59,52 @@ class GoalCategoryCreateView(CreateAPIView):
     serializer_class = GoalCategoryCreateSerializer
 
 
-class GoalCategoryListView(ListAPIView):
+class GoalCategoryListView(CachedListMixin, FastReadListMixin, ListAPIView):
     """ Вьюшка для выведения списка категорий """
     model = GoalCategory
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = GoalCategorySerializer
-    pagination_class = LimitOffsetPagination
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+    pagination_class = KeysetPagination
     filter_backends = [
         filters.OrderingFilter,
-        filters.SearchFilter,
+        TrigramSearchFilter,
     ]
     ordering_fields = ['title', 'created']
     ordering = ['title']
-    search_fields = ['title', 'board']
 
     def get_queryset(self):
         """ Метод для получения отфильрованных категорий """
-        return GoalCategory.objects.filter(
-            board__participants__user=self.request.user, is_deleted=False
-        )
+        return GoalCategory.alive.filter(board_id__in=user_board_ids(self.request.user)).select_related('user')
+
+
+class GoalCategorySuggestView(ListAPIView):
+    """ Вьюшка для подсказок по названиям категорий """
+    model = GoalCategory
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = GoalCategorySuggestSerializer
+    pagination_class = None
+    query_param = 'q'
+    default_limit = 10
+    max_limit = 50
+
+    def get_limit(self) -> int:
+        """ Метод для получения количества подсказок """
+        try:
+            limit = int(self.request.query_params.get('limit', self.default_limit))
+        except ValueError:
+            limit = self.default_limit
+        return max(1, min(limit, self.max_limit))
+
+    def get_queryset(self):
+        """ Метод для получения наиболее похожих категорий из досок пользователя """
+        search = self.request.query_params.get(self.query_param, '').strip()
+        if not search:
+            return GoalCategory.objects.none()
+        queryset = GoalCategory.alive.filter(
+            board_id__in=user_board_ids(self.request.user)
+        ).only('id', 'title', 'board_id')
+        return TrigramSearchFilter().search(queryset, search)[:self.get_limit()]
 
 
 class GoalCategoryView(RetrieveUpdateDestroyAPIView):
@@ -46,9 +115,7 @@ class GoalCategoryView(RetrieveUpdateDestroyAPIView):
 
     def get_queryset(self):
         """ Метод для получения отфильрованных категорий """
-        return GoalCategory.objects.filter(
-            board__participants__user=self.request.user, is_deleted=False
-        )
+        return GoalCategory.alive.filter(board_id__in=user_board_ids(self.request.user)).select_related('user')
 
     def perform_destroy(self, instance):
         """ Метод для удаления категорий """
@@ -66,25 +133,59 @@ class GoalCreateView(CreateAPIView):
     serializer_class = GoalCreateSerializer
 
 
-class GoalListView(ListAPIView):
+class GoalListView(ConditionalListMixin, CachedListMixin, FastReadListMixin, ListAPIView):
     """ Вьюшка для выведения списка целей """
     model = Goal
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = GoalSerializer
-    pagination_class = LimitOffsetPagination
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+    pagination_class = KeysetPagination
     filter_backends = [
         DjangoFilterBackend,
         filters.OrderingFilter,
-        filters.SearchFilter,
+        FullTextSearchFilter,
     ]
     filterset_class = GoalDateFilter
     ordering_fields = ['title', 'created']
     ordering = ['title']
-    search_fields = ['title']
 
     def get_queryset(self):
         """ Метод для получения отфильрованных целей """
-        return Goal.objects.filter(category__board__participants__user=self.request.user).exclude(status=Goal.Status.archived)
+        return Goal.alive.filter(board_id__in=user_board_ids(self.request.user)).select_related('user')
+
+
+class GoalExportView(GenericAPIView):
+    """
+    Вьюшка для потоковой выгрузки целей в NDJSON (по умолчанию) или CSV (?format=csv).
+    Строки читаются серверным курсором частями по chunk_size и сразу отдаются клиенту,
+    поэтому память не зависит от размера выгрузки. Поддерживаются параметры GoalDateFilter
+    """
+    model = Goal
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = GoalSerializer
+    renderer_classes = [NDJSONRenderer, CSVRenderer]
+    pagination_class = None
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = GoalDateFilter
+    chunk_size = 2_000
+
+    def get_queryset(self):
+        """ Метод для получения целей пользователя в порядке первичного ключа """
+        return Goal.alive.filter(board_id__in=user_board_ids(self.request.user)).order_by('id')
+
+    def get(self, request, *args, **kwargs):
+        """ Метод для потоковой выгрузки целей """
+        values_serializer = get_values_serializer(self.get_serializer_class())
+        queryset = values_serializer.get_queryset(self.filter_queryset(self.get_queryset()))
+        rows = values_serializer.iterator(queryset.iterator(chunk_size=self.chunk_size))
+
+        renderer = request.accepted_renderer
+        response = StreamingHttpResponse(
+            renderer.stream(rows, values_serializer.get_field_names(), self.chunk_size),
+            content_type=f"{renderer.media_type}; charset={renderer.charset}",
+        )
+        response['Content-Disposition'] = f'attachment; filename="goals.{renderer.format}"'
+        return response
 
 
 class GoalView(RetrieveUpdateDestroyAPIView):
@@ -95,7 +196,9 @@ class GoalView(RetrieveUpdateDestroyAPIView):
 
     def get_queryset(self):
         """ Метод для получения отфильрованных целей """
-        return Goal.objects.filter(category__board__participants__user=self.request.user)
+        return Goal.objects.filter(
+            board_id__in=user_board_ids(self.request.user)
+        ).select_related('user')
 
     def perform_destroy(self, instance):
         """ Метод для удаления целей """
@@ -103,6 +206,205 @@ class GoalView(RetrieveUpdateDestroyAPIView):
         instance.save()
         return instance
 
+    def retrieve(self, request, *args, **kwargs):
+        """ Метод для получения цели, в том числе перенесенной в холодное хранилище """
+        try:
+            return super().retrieve(request, *args, **kwargs)
+        except Http404:
+            instance = get_archived_goal(request, self.kwargs[self.lookup_field])
+            self.check_object_permissions(request, instance)
+            return Response(ArchivedGoalSerializer(instance).data)
+
+
+def get_archived_goal(request, pk) -> ArchivedGoal:
+    """ Функция для получения цели из холодного хранилища среди досок пользователя """
+    return get_object_or_404(
+        ArchivedGoal.objects.filter(board_id__in=user_board_ids(request.user)).select_related('user'), pk=pk
+    )
+
+
+class GoalRestoreView(GenericAPIView):
+    """ Вьюшка для возврата цели с комментариями из холодного хранилища """
+    model = ArchivedGoal
+    permission_classes = [permissions.IsAuthenticated, GoalPermissions]
+    serializer_class = GoalSerializer
+
+    def post(self, request, *args, **kwargs):
+        """ Метод для восстановления цели """
+        instance = get_archived_goal(request, self.kwargs['pk'])
+        self.check_object_permissions(request, instance)
+        restore_goals([instance.id])
+        goal = Goal.objects.select_related('user').get(pk=instance.id)
+        return Response(self.get_serializer(goal).data)
+
+
+class GoalBulkView(GenericAPIView):
+    """
+    Вьюшка для пакетной работы с целями: POST - создание, PATCH - обновление,
+    DELETE - архивация по списку id. Доступ к категориям и целям пакета проверяется
+    одним запросом, запись идет через bulk_create/bulk_update в одной транзакции,
+    в ответе возвращается результат по каждому элементу
+    """
+    model = Goal
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = GoalBulkSerializer
+    max_batch_size = 10_000
+    write_batch_size = 1_000
+
+    def get_queryset(self):
+        """ Метод для получения целей, доступных пользователю """
+        return Goal.objects.filter(board_id__in=user_board_ids(self.request.user))
+
+    def get_items(self) -> list:
+        """ Метод для получения элементов пакета из тела запроса """
+        items = self.request.data
+        if not isinstance(items, list):
+            raise ValidationError({'non_field_errors': ['Expected a list of items.']})
+        if len(items) > self.max_batch_size:
+            raise ValidationError({'non_field_errors': [f'Ensure there are no more than {self.max_batch_size} items.']})
+        return items
+
+    def validate_items(self, items: list, partial: bool = False) -> tuple[dict, dict]:
+        """ Метод для валидации элементов пакета по отдельности, без обращений к БД """
+        valid, errors = {}, {}
+        for index, item in enumerate(items):
+            serializer = self.get_serializer(data=item, partial=partial)
+            if serializer.is_valid():
+                valid[index] = dict(serializer.validated_data)
+            else:
+                errors[index] = (status.HTTP_400_BAD_REQUEST, serializer.errors)
+        return valid, errors
+
+    def check_categories(self, valid: dict, errors: dict) -> dict:
+        """ Метод для проверки категорий всего пакета одним запросом """
+        category_ids = {data['category'] for data in valid.values() if 'category' in data}
+        categories = GoalCategory.objects.only('id', 'board_id', 'user_id', 'is_deleted').in_bulk(category_ids)
+        for index, data in list(valid.items()):
+            if 'category' not in data:
+                continue
+            category = categories.get(data['category'])
+            if category is None:
+                error = f'Invalid pk "{data["category"]}" - object does not exist.'
+            elif category.is_deleted:
+                error = 'not allowed in deleted category'
+            elif category.user_id != self.request.user.id:
+                error = 'not owner of category'
+            else:
+                continue
+            errors[index] = (status.HTTP_400_BAD_REQUEST, {'category': [error]})
+            del valid[index]
+        return categories
+
+    def check_goals(self, ids: dict, errors: dict) -> dict:
+        """ Метод для загрузки целей пакета и проверки прав на их изменение """
+        goals_by_id = self.get_queryset().select_related('user').in_bulk(set(ids.values()))
+        BoardRoleResolver.for_request(self.request).load({goal.board_id for goal in goals_by_id.values()})
+
+        goals = {}
+        for index, goal_id in ids.items():
+            goal = goals_by_id.get(goal_id)
+            if goal is None:
+                errors[index] = (status.HTTP_404_NOT_FOUND, {'detail': 'Not found.'})
+            elif not GoalPermissions().has_object_permission(self.request, self, goal):
+                errors[index] = (
+                    status.HTTP_403_FORBIDDEN,
+                    {'detail': 'You do not have permission to perform this action.'},
+                )
+            else:
+                goals[index] = goal
+        return goals
+
+    def get_results_response(self, items_count: int, data: dict, errors: dict, success_status: int) -> Response:
+        """ Метод для формирования ответа с результатом по каждому элементу пакета """
+        results = []
+        for index in range(items_count):
+            if index in data:
+                results.append({'index': index, 'status': success_status, 'data': data[index]})
+            else:
+                error_status, error = errors[index]
+                results.append({'index': index, 'status': error_status, 'errors': error})
+        return Response(results, status=status.HTTP_207_MULTI_STATUS if errors else success_status)
+
+    def serialize_goals(self, goals: dict) -> dict:
+        """ Метод для сериализации сохраненных целей с сохранением индексов пакета """
+        return dict(zip(goals, GoalSerializer(list(goals.values()), many=True).data))
+
+    def post(self, request, *args, **kwargs):
+        """ Метод для пакетного создания целей """
+        items = self.get_items()
+        valid, errors = self.validate_items(items)
+        categories = self.check_categories(valid, errors)
+
+        goals = {}
+        for index, data in valid.items():
+            data.pop('id', None)
+            category = categories[data.pop('category')]
+            goals[index] = Goal(**data, category=category, board_id=category.board_id, user=request.user)
+
+        with transaction.atomic():
+            Goal.objects.bulk_create(goals.values(), batch_size=self.write_batch_size)
+            boards_changed.send(sender=Goal, board_ids={goal.board_id for goal in goals.values()})
+        return self.get_results_response(len(items), self.serialize_goals(goals), errors, status.HTTP_201_CREATED)
+
+    def patch(self, request, *args, **kwargs):
+        """ Метод для пакетного обновления целей """
+        items = self.get_items()
+        valid, errors = self.validate_items(items, partial=True)
+        for index, data in list(valid.items()):
+            if 'id' not in data:
+                errors[index] = (status.HTTP_400_BAD_REQUEST, {'id': ['This field is required.']})
+                del valid[index]
+
+        categories = self.check_categories(valid, errors)
+        goals = self.check_goals({index: data['id'] for index, data in valid.items() if index not in errors}, errors)
+
+        now = timezone.now()
+        fields, moved_ids = {'updated'}, set()
+        board_ids = {goal.board_id for goal in goals.values()}
+        for index, goal in goals.items():
+            data = valid[index]
+            data.pop('id')
+            if 'category' in data:
+                category = categories[data.pop('category')]
+                if category.board_id != goal.board_id:
+                    moved_ids.add(goal.id)
+                goal.category = category
+                goal.board_id = category.board_id
+                fields.update({'category', 'board'})
+            for field, value in data.items():
+                setattr(goal, field, value)
+                fields.add(field)
+            goal.updated = now
+
+        with transaction.atomic():
+            Goal.objects.bulk_update(goals.values(), fields, batch_size=self.write_batch_size)
+            if moved_ids:
+                GoalComment.objects.filter(goal_id__in=moved_ids).update(
+                    board_id=Subquery(Goal.objects.filter(pk=OuterRef('goal_id')).values('board_id')[:1])
+                )
+            board_ids.update(goal.board_id for goal in goals.values())
+            boards_changed.send(sender=Goal, board_ids=board_ids)
+        return self.get_results_response(len(items), self.serialize_goals(goals), errors, status.HTTP_200_OK)
+
+    def delete(self, request, *args, **kwargs):
+        """ Метод для пакетной архивации целей по списку id """
+        items = self.get_items()
+        ids, errors = {}, {}
+        for index, item in enumerate(items):
+            if isinstance(item, int) and not isinstance(item, bool):
+                ids[index] = item
+            else:
+                errors[index] = (status.HTTP_400_BAD_REQUEST, {'id': ['A valid integer is required.']})
+
+        goals = self.check_goals(ids, errors)
+        with transaction.atomic():
+            Goal.objects.filter(pk__in={goal.id for goal in goals.values()}).update(
+                status=Goal.Status.archived, updated=timezone.now()
+            )
+            boards_changed.send(sender=Goal, board_ids={goal.board_id for goal in goals.values()})
+        data = {index: {'id': goal.id} for index, goal in goals.items()}
+        return self.get_results_response(len(items), data, errors, status.HTTP_200_OK)
+
 
 # GoalComments View
 
@@ -113,22 +415,26 @@ class GoalCommentCreateView(CreateAPIView):
     serializer_class = GoalCommentCreateSerializer
 
 
-class GoalCommentListView(ListAPIView):
+class GoalCommentListView(ConditionalListMixin, FastReadListMixin, ListAPIView):
     """ Вьюшка для выведения списка комментариев """
     model = GoalComment
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = GoalCommentSerializer
-    pagination_class = LimitOffsetPagination
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+    pagination_class = KeysetPagination
     filter_backends = [
         DjangoFilterBackend,
         filters.OrderingFilter,
+        FullTextSearchFilter,
     ]
     filterset_fields = ['goal']
     ordering = ['-created']
 
     def get_queryset(self):
         """ Метод для получения отфильрованных комментариев """
-        return GoalComment.objects.filter(goal__category__board__participants__user=self.request.user)
+        return GoalComment.objects.filter(
+            board_id__in=user_board_ids(self.request.user)
+        ).select_related('user')
 
 
 class GoalCommentView(RetrieveUpdateDestroyAPIView):
@@ -139,7 +445,9 @@ class GoalCommentView(RetrieveUpdateDestroyAPIView):
 
     def get_queryset(self):
         """ Метод для получения отфильрованных комментариев """
-        return GoalComment.objects.filter(goal__category__board__participants__user=self.request.user)
+        return GoalComment.objects.filter(
+            board_id__in=user_board_ids(self.request.user)
+        ).select_related('user')
 
 
 # Board View
@@ -150,22 +458,23 @@ class BoardCreateView(CreateAPIView):
     serializer_class = BoardCreateSerializer
 
 
-class BoardListView(ListAPIView):
+class BoardListView(CachedListMixin, ListAPIView):
     """ Вьюшка для выведения списка досок """
     model = Board
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = BoardListSerializer
     filter_backends = [
         filters.OrderingFilter,
+        TrigramSearchFilter,
     ]
     ordering = ['title']
 
     def get_queryset(self):
         """ Метод для получения отфильрованных комментариев """
-        return Board.objects.filter(participants__user=self.request.user, is_deleted=False)
+        return Board.alive.filter(participants__user=self.request.user)
 
 
-class BoardView(RetrieveUpdateDestroyAPIView):
+class BoardView(ConditionalObjectMixin, RetrieveUpdateDestroyAPIView):
     """ Вьюшка для взаимодействия с досками """
     model = Board
     permission_classes = [permissions.IsAuthenticated, BoardPermissions]
@@ -173,17 +482,119 @@ class BoardView(RetrieveUpdateDestroyAPIView):
 
     def get_queryset(self):
         """ Метод для получения отфильрованных досок """
-        return Board.objects.filter(participants__user=self.request.user, is_deleted=False)
+        # Участники с пользователями подгружаются в BoardSerializer одним запросом,
+        # чтобы ответ 304 не загружал их впустую
+        return Board.alive.filter(participants__user=self.request.user)
 
     def perform_destroy(self, instance: Board):
         """ Метод для удаления досок """
-        # При удалении доски помечаем ее как is_deleted,
-        # «удаляем» категории, обновляем статус целей
+        # При удалении доски помечаем ее как is_deleted, а «удаление» категорий
+        # и архивацию целей выполняет фоновая команда process_board_deletions
         with transaction.atomic():
             instance.is_deleted = True
             instance.save()
-            instance.categories.update(is_deleted=True)
-            Goal.objects.filter(category__board=instance).update(
-                status=Goal.Status.archived
-            )
+            BoardDeletion.objects.get_or_create(board=instance)
         return instance
+
+
+class BoardImportView(GenericAPIView):
+    """
+    Базовая вьюшка импорта в доску из тела запроса в формате CSV (text/csv)
+    или NDJSON (application/x-ndjson). Тело читается построчно, в ответе - отчет
+    по каждой строке файла, при ошибках в отдельных строках - статус 207
+    """
+    model = Board
+    permission_classes = [permissions.IsAuthenticated, BoardContentPermissions]
+    importer_class = None
+    content_types = {
+        'text/csv': 'csv',
+        'application/x-ndjson': 'ndjson',
+    }
+
+    def get_queryset(self):
+        """ Метод для получения досок пользователя """
+        return Board.alive.filter(participants__user=self.request.user)
+
+    def post(self, request, *args, **kwargs):
+        """ Метод для импорта строк в доску """
+        board = self.get_object()
+        content_type = request.content_type.split(';')[0].strip()
+        import_format = self.content_types.get(content_type)
+        if import_format is None:
+            raise UnsupportedMediaType(content_type)
+
+        stream = request.stream
+        lines = codecs.iterdecode(iter(stream.readline, b''), 'utf-8-sig') if stream is not None else []
+        try:
+            report = self.importer_class(board, request.user).run(lines, import_format)
+        except UnicodeDecodeError:
+            raise ValidationError({'non_field_errors': ['File must be UTF-8 encoded.']})
+
+        has_errors = any(result['status'] != status.HTTP_201_CREATED for result in report)
+        return Response(report, status=status.HTTP_207_MULTI_STATUS if has_errors else status.HTTP_201_CREATED)
+
+
+class GoalImportView(BoardImportView):
+    """ Вьюшка для импорта целей в доску """
+    importer_class = GoalImporter
+
+
+class GoalCommentImportView(BoardImportView):
+    """ Вьюшка для импорта комментариев к целям доски """
+    importer_class = GoalCommentImporter
+
+
+class BoardStatsView(RetrieveAPIView):
+    """ Вьюшка для получения статистики целей доски из сводных таблиц """
+    model = Board
+    permission_classes = [permissions.IsAuthenticated, BoardPermissions]
+
+    def get_queryset(self):
+        """ Метод для получения досок пользователя """
+        return Board.alive.filter(participants__user=self.request.user)
+
+    def retrieve(self, request, *args, **kwargs):
+        """ Метод для получения количества целей по статусам, приоритетам, категориям и просроченных """
+        return Response(get_board_stats(self.get_object().id))
+
+
+class SyncView(APIView):
+    """
+    Вьюшка для синхронизации клиента: изменения всех досок пользователя после токена ?since=<token>.
+    Ответ содержит новый токен, который передается в следующий запрос; без токена отдаются все данные
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+    since_query_param = 'since'
+    invalid_token_message = 'Invalid token'
+
+    def get(self, request, *args, **kwargs):
+        """ Метод для получения изменений после токена """
+        since = request.query_params.get(self.since_query_param)
+        try:
+            token = SyncToken.decode(since) if since else None
+        except ValueError:
+            raise NotFound(self.invalid_token_message)
+        return Response(get_changes(request.user, token))
+
+
+class BoardDeletionView(RetrieveAPIView):
+    """ Вьюшка для отслеживания фонового удаления доски """
+    model = BoardDeletion
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = BoardDeletionSerializer
+    lookup_field = 'board'
+    lookup_url_kwarg = 'pk'
+
+    def get_queryset(self):
+        """ Метод для получения задач удаления досок пользователя """
+        return BoardDeletion.objects.filter(board__participants__user=self.request.user)
+
+
+class ListCacheStatsView(APIView):
+    """ Вьюшка для просмотра счетчиков кеша списков """
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        """ Метод для получения количества попаданий и промахов кеша """
+        return Response(get_stats())
@@ -0,0 +1,55 @@
+import pytest
+from django.core.management import call_command
+
+from goals.models import Board, BoardDeletion, Goal, GoalCategory
+
+
+@pytest.mark.django_db
+def test_board_deletion(user_factory, get_auth_client, board_participant_factory, goal_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    board = board_participant.board
+    goal_factory.create_batch(5, category__board=board)
+
+    auth_client = get_auth_client(user)
+    response = auth_client.delete(f"/goals/board/{board.id}")
+
+    assert response.status_code == 204
+    assert Board.objects.get(pk=board.pk).is_deleted
+    assert Goal.objects.filter(board=board).exclude(status=Goal.Status.archived).count() == 5
+    assert auth_client.get("/goals/goal/list").data == []
+
+    response = auth_client.get(f"/goals/board/{board.id}/deletion")
+    assert response.status_code == 200
+    assert response.data["status"] == BoardDeletion.Status.pending
+
+    call_command("process_board_deletions", once=True, batch_size=2)
+
+    assert not GoalCategory.objects.filter(board=board, is_deleted=False).exists()
+    assert not Goal.objects.filter(board=board).exclude(status=Goal.Status.archived).exists()
+
+    response = auth_client.get(f"/goals/board/{board.id}/deletion")
+    assert response.data["status"] == BoardDeletion.Status.done
+    assert response.data["categories_deleted"] == 5
+    assert response.data["goals_archived"] == 5
+    assert response.data["goals_total"] == 5
+    assert response.data["finished"] is not None
+
+
+@pytest.mark.django_db
+def test_board_deletion_resumes(board_participant_factory, goal_factory):
+    board = board_participant_factory().board
+    goal_factory.create_batch(3, category__board=board)
+    board.is_deleted = True
+    board.save()
+    deletion = BoardDeletion.objects.create(board=board)
+
+    assert not deletion.run_batch(batch_size=2)
+    assert GoalCategory.objects.filter(board=board, is_deleted=False).count() == 1
+
+    deletion = BoardDeletion.objects.get(pk=deletion.pk)
+    while not deletion.run_batch(batch_size=2):
+        pass
+
+    assert deletion.goals_archived == 3
+    assert deletion.categories_deleted == 3
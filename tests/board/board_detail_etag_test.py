@@ -0,0 +1,26 @@
+import pytest
+
+
+@pytest.mark.django_db
+def test_board_detail_not_modified(
+    user_factory, get_auth_client, board_participant_factory, django_assert_num_queries
+):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    board = board_participant.board
+
+    auth_client = get_auth_client(user)
+    response = auth_client.get(f"/goals/board/{board.id}")
+    etag = response["ETag"]
+
+    # Сессия, пользователь, доска и роль пользователя на ней
+    with django_assert_num_queries(4):
+        response = auth_client.get(f"/goals/board/{board.id}", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+
+    response = auth_client.get(f"/goals/board/{board.id}", HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+    assert response.status_code == 304
+
+    board.title = "renamed"
+    board.save()
+    assert auth_client.get(f"/goals/board/{board.id}", HTTP_IF_NONE_MATCH=etag).status_code == 200
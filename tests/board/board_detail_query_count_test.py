@@ -0,0 +1,20 @@
+import pytest
+
+from goals.models import BoardParticipant
+
+
+@pytest.mark.django_db
+def test_board_detail_query_count(user_factory, get_auth_client, board_participant_factory, count_queries):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    board_participant_factory(board=board_participant.board, role=BoardParticipant.Role.reader)
+
+    auth_client = get_auth_client(user)
+    small_board = count_queries(auth_client.get, f"/goals/board/{board_participant.board.id}")
+
+    board_participant_factory.create_batch(
+        20, board=board_participant.board, role=BoardParticipant.Role.reader
+    )
+    large_board = count_queries(auth_client.get, f"/goals/board/{board_participant.board.id}")
+
+    assert small_board == large_board
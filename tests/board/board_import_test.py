@@ -0,0 +1,141 @@
+import json
+
+import pytest
+
+from goals.importer import BaseImporter
+from goals.models import BoardParticipant, Goal, GoalComment
+
+
+@pytest.mark.django_db
+def test_board_import_goals_csv(
+    user_factory, get_auth_client, board_participant_factory, goal_category_factory, monkeypatch
+):
+    monkeypatch.setattr(BaseImporter, "copy_batch_size", 2)
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    board = board_participant.board
+    writer = board_participant_factory(board=board, role=BoardParticipant.Role.writer).user
+    category = goal_category_factory(board=board)
+    other_category = goal_category_factory()
+    content = (
+        "title,description,status,priority,due_date,category,user\n"
+        f"Imported,\"Описание, с запятой\",2,3,2030-01-02,{category.id},\n"
+        f"Вторая,,,,,{category.id},{writer.username}\n"
+        f",,,,,{category.id},\n"
+        f"Чужая категория,,,,,{other_category.id},\n"
+        f"Чужой автор,,,,,{category.id},nobody\n"
+        f"Третья,,1,1,,{category.id},\n"
+    )
+
+    auth_client = get_auth_client(user)
+    response = auth_client.post(f"/goals/board/{board.id}/import/goals", data=content, content_type="text/csv")
+
+    assert response.status_code == 207
+    report = response.json()
+    assert [result["row"] for result in report] == [1, 2, 3, 4, 5, 6]
+    assert [result["status"] for result in report] == [201, 201, 400, 400, 400, 201]
+    assert "title" in report[2]["errors"]
+    assert report[3]["errors"] == {"category": [f'Invalid pk "{other_category.id}" - object does not exist.']}
+    assert report[4]["errors"] == {"user": ["User with username=nobody is not a participant of the board."]}
+
+    first = Goal.objects.get(pk=report[0]["id"])
+    assert (first.title, first.description, first.status, first.priority) == ("Imported", "Описание, с запятой", 2, 3)
+    assert str(first.due_date) == "2030-01-02"
+    assert first.user == user
+    assert first.board_id == board.id
+    second = Goal.objects.get(pk=report[1]["id"])
+    assert (second.user, second.status, second.priority, second.description) == (writer, 1, 2, None)
+    assert Goal.objects.filter(board=board).count() == 3
+
+    search = auth_client.get("/goals/goal/list", {"search": "imported"})
+    assert [goal["id"] for goal in search.data] == [first.id]
+
+
+@pytest.mark.django_db
+def test_board_import_comments_ndjson(user_factory, get_auth_client, board_participant_factory, goal_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal = goal_factory(category__board=board_participant.board)
+    other_goal = goal_factory()
+    lines = [
+        json.dumps({"goal": goal.id, "text": "Комментарий"}),
+        "",
+        "not json",
+        json.dumps({"goal": other_goal.id, "text": "Чужой"}),
+        json.dumps({"goal": goal.id, "text": "Еще один"}),
+    ]
+
+    auth_client = get_auth_client(user)
+    response = auth_client.post(
+        f"/goals/board/{board_participant.board.id}/import/comments",
+        data="\n".join(lines),
+        content_type="application/x-ndjson",
+    )
+
+    assert response.status_code == 207
+    report = response.json()
+    assert [result["status"] for result in report] == [201, 400, 400, 201]
+    assert report[1]["errors"] == {"non_field_errors": ["Invalid row."]}
+    assert report[2]["errors"] == {"goal": [f'Invalid pk "{other_goal.id}" - object does not exist.']}
+    comments = GoalComment.objects.filter(goal=goal).order_by("id")
+    assert [comment.text for comment in comments] == ["Комментарий", "Еще один"]
+    assert all(comment.board_id == goal.board_id for comment in comments)
+    goal.refresh_from_db()
+    assert goal.comment_count == 2
+    assert goal.last_activity_at == comments[0].created
+
+
+@pytest.mark.django_db
+def test_board_import_all_valid(user_factory, get_auth_client, board_participant_factory, goal_category_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    category = goal_category_factory(board=board_participant.board)
+
+    auth_client = get_auth_client(user)
+    response = auth_client.post(
+        f"/goals/board/{board_participant.board.id}/import/goals",
+        data=json.dumps({"title": "Цель", "category": category.id}),
+        content_type="application/x-ndjson",
+    )
+
+    assert response.status_code == 201
+    assert response.json()[0]["status"] == 201
+
+
+@pytest.mark.django_db
+def test_board_import_writer_cannot_set_other_author(
+    user_factory, get_auth_client, board_participant_factory, goal_category_factory
+):
+    owner = user_factory()
+    board_participant = board_participant_factory(user=owner)
+    board = board_participant.board
+    writer = board_participant_factory(board=board, role=BoardParticipant.Role.writer).user
+    category = goal_category_factory(board=board)
+    content = (
+        "title,category,user\n"
+        f"Своя,{category.id},\n"
+        f"Своя явно,{category.id},{writer.username}\n"
+        f"От владельца,{category.id},{owner.username}\n"
+    )
+
+    auth_client = get_auth_client(writer)
+    response = auth_client.post(f"/goals/board/{board.id}/import/goals", data=content, content_type="text/csv")
+
+    report = response.json()
+    assert [result["status"] for result in report] == [201, 201, 400]
+    assert report[2]["errors"] == {"user": ["Only the board owner can import rows of other users."]}
+    assert set(Goal.objects.filter(board=board).values_list("user", flat=True)) == {writer.id}
+
+
+@pytest.mark.django_db
+def test_board_import_permissions(user_factory, get_auth_client, board_participant_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user, role=BoardParticipant.Role.reader)
+
+    auth_client = get_auth_client(user)
+    url = f"/goals/board/{board_participant.board.id}/import/goals"
+
+    assert auth_client.post(url, data="", content_type="text/csv").status_code == 403
+    board_participant.role = BoardParticipant.Role.writer
+    board_participant.save()
+    assert auth_client.post(url, data="{}", content_type="application/json").status_code == 415
@@ -0,0 +1,37 @@
+import pytest
+
+from goals.models import BoardParticipant
+
+
+@pytest.mark.django_db
+def test_board_list_cache_participant_removed(user_factory, get_auth_client, board_participant_factory):
+    owner = user_factory()
+    reader = user_factory()
+    board_participant = board_participant_factory(user=owner)
+    board_participant_factory(board=board_participant.board, user=reader, role=BoardParticipant.Role.reader)
+
+    reader_client = get_auth_client(reader)
+    assert len(reader_client.get("/goals/board/list").data) == 1
+
+    owner_client = get_auth_client(owner)
+    response = owner_client.patch(
+        f"/goals/board/{board_participant.board.id}",
+        data={"title": "board", "participants": []},
+        content_type="application/json",
+    )
+    assert response.status_code == 200
+
+    reader_client = get_auth_client(reader)
+    assert reader_client.get("/goals/board/list").data == []
+
+
+@pytest.mark.django_db
+def test_list_cache_stats(user_factory, get_auth_client):
+    admin = user_factory(is_staff=True)
+
+    auth_client = get_auth_client(admin)
+    response = auth_client.get("/goals/cache/stats")
+
+    assert response.status_code == 200
+    assert response.data == {"enabled": True, "hits": 0, "misses": 0}
+    assert get_auth_client(user_factory()).get("/goals/cache/stats").status_code == 403
@@ -0,0 +1,14 @@
+import pytest
+
+
+@pytest.mark.django_db
+def test_board_list_search(user_factory, get_auth_client, board_participant_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user, board__title="Marketing roadmap")
+    board_participant_factory(user=user, board__title="Personal")
+
+    auth_client = get_auth_client(user)
+    response = auth_client.get("/goals/board/list", {"search": "roadmap"})
+
+    assert response.status_code == 200
+    assert [item["id"] for item in response.data] == [board_participant.board.id]
@@ -0,0 +1,122 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from goals.models import Goal, GoalDueDateStat, GoalStat
+from goals.stats import get_board_stats
+
+
+def get_stats_rows(board_id):
+    return (
+        sorted(GoalStat.objects.filter(board_id=board_id, count__gt=0).values_list(
+            "category_id", "status", "priority", "count"
+        )),
+        sorted(GoalDueDateStat.objects.filter(board_id=board_id, count__gt=0).values_list("due_date", "count")),
+    )
+
+
+@pytest.mark.django_db
+def test_board_stats(user_factory, get_auth_client, board_participant_factory, goal_factory, goal_category_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    board = board_participant.board
+    category = goal_category_factory(board=board, user=user)
+    yesterday = timezone.localdate() - timedelta(days=1)
+    goal_factory.create_batch(2, category=category, priority=Goal.Priority.high, due_date=yesterday)
+    goal_factory(category=category, status=Goal.Status.done, due_date=yesterday)
+    goal = goal_factory(category=category)
+
+    auth_client = get_auth_client(user)
+    response = auth_client.get(f"/goals/board/{board.id}/stats")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "board": board.id,
+        "total": 4,
+        "overdue": 2,
+        "by_status": {"1": 3, "2": 0, "3": 1, "4": 0},
+        "by_priority": {"1": 0, "2": 2, "3": 2, "4": 0},
+        "by_category": {str(category.id): 4},
+    }
+
+    auth_client.delete(f"/goals/goal/{goal.id}")
+    stats = auth_client.get(f"/goals/board/{board.id}/stats").json()
+    assert (stats["total"], stats["by_status"]["4"]) == (3, 1)
+
+
+@pytest.mark.django_db
+def test_board_stats_incremental(user_factory, get_auth_client, board_participant_factory, goal_category_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    board = board_participant.board
+    category = goal_category_factory(board=board, user=user)
+    other_category = goal_category_factory(board=board, user=user)
+    today = timezone.localdate()
+
+    auth_client = get_auth_client(user)
+    response = auth_client.post("/goals/goal/bulk", data=[
+        {"title": f"Goal {number}", "category": category.id, "due_date": str(today - timedelta(days=number))}
+        for number in range(5)
+    ], content_type="application/json")
+    ids = [result["data"]["id"] for result in response.json()]
+    auth_client.patch("/goals/goal/bulk", data=[
+        {"id": ids[0], "status": Goal.Status.done},
+        {"id": ids[1], "category": other_category.id, "priority": Goal.Priority.low},
+    ], content_type="application/json")
+    auth_client.delete("/goals/goal/bulk", data=[ids[2]], content_type="application/json")
+    Goal.objects.filter(pk=ids[3]).update(due_date=None)
+    goal = Goal.objects.get(pk=ids[4])
+    goal.title = "renamed"
+    goal.save()
+
+    incremental = get_stats_rows(board.id)
+    call_command("rebuild_board_stats", board=[board.id])
+
+    assert get_stats_rows(board.id) == incremental
+    stats = get_board_stats(board.id)
+    assert stats["by_status"] == {1: 3, 2: 0, 3: 1, 4: 1}
+    assert stats["overdue"] == 2
+
+
+@pytest.mark.django_db
+def test_board_stats_board_deletion(user_factory, get_auth_client, board_participant_factory, goal_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    board = board_participant.board
+    goal_factory.create_batch(3, category__board=board)
+
+    auth_client = get_auth_client(user)
+    auth_client.delete(f"/goals/board/{board.id}")
+    call_command("process_board_deletions", once=True, batch_size=2)
+
+    stats = get_board_stats(board.id)
+    assert stats["total"] == 0
+    assert stats["by_status"][Goal.Status.archived] == 3
+
+
+@pytest.mark.django_db
+def test_board_stats_query_count(
+    user_factory, get_auth_client, board_participant_factory, goal_factory, count_queries
+):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    board = board_participant.board
+
+    auth_client = get_auth_client(user)
+    url = f"/goals/board/{board.id}/stats"
+    goal_factory(category__board=board)
+    small = count_queries(auth_client.get, url)
+    goal_factory.create_batch(20, category__board=board)
+
+    assert count_queries(auth_client.get, url) == small
+
+
+@pytest.mark.django_db
+def test_board_stats_not_participant(user_factory, get_auth_client, board_factory):
+    board = board_factory()
+
+    response = get_auth_client(user_factory()).get(f"/goals/board/{board.id}/stats")
+
+    assert response.status_code == 404
@@ -0,0 +1,59 @@
+import pytest
+
+from goals.models import BoardParticipant
+
+
+def make_update_data(keep, new_users):
+    return {
+        "title": "test board",
+        "participants": [
+            {"user": participant.user.username, "role": BoardParticipant.Role.writer}
+            for participant in keep
+        ] + [
+            {"user": user.username, "role": BoardParticipant.Role.reader}
+            for user in new_users
+        ],
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("size", [2, 30])
+def test_board_update_query_count(
+    size, user_factory, get_auth_client, board_participant_factory, django_assert_num_queries
+):
+    owner = user_factory()
+    board_participant = board_participant_factory(user=owner)
+    board = board_participant.board
+    # Участники, у которых меняется роль, которые удаляются, и новые пользователи
+    changed = board_participant_factory.create_batch(size, board=board, role=BoardParticipant.Role.reader)
+    board_participant_factory.create_batch(size, board=board, role=BoardParticipant.Role.reader)
+    new_users = user_factory.create_batch(size)
+
+    auth_client = get_auth_client(owner)
+    with django_assert_num_queries(15):
+        response = auth_client.patch(
+            f"/goals/board/{board.id}",
+            data=make_update_data(changed, new_users),
+            content_type="application/json",
+        )
+
+    assert response.status_code == 200
+    assert len(response.data["participants"]) == 1 + 2 * size
+    assert BoardParticipant.objects.filter(board=board, role=BoardParticipant.Role.writer).count() == size
+    assert BoardParticipant.objects.filter(board=board, role=BoardParticipant.Role.reader).count() == size
+
+
+@pytest.mark.django_db
+def test_board_update_unknown_user(user_factory, get_auth_client, board_participant_factory):
+    owner = user_factory()
+    board_participant = board_participant_factory(user=owner)
+
+    auth_client = get_auth_client(owner)
+    response = auth_client.patch(
+        f"/goals/board/{board_participant.board.id}",
+        data={"title": "test", "participants": [{"user": "missing", "role": BoardParticipant.Role.reader}]},
+        content_type="application/json",
+    )
+
+    assert response.status_code == 400
+    assert response.data["participants"] == [{"user": ["Object with username=missing does not exist."]}]
@@ -0,0 +1,149 @@
+import asyncio
+import time
+
+import pytest
+
+from bot.tg.async_client import AsyncTgClient
+from bot.tg.client import TgClientError
+from bot.tg.fake_server import FakeTelegramServer
+
+
+@pytest.fixture
+def server():
+    with FakeTelegramServer() as server:
+        yield server
+
+
+def make_client(url: str, delays: list, **options) -> AsyncTgClient:
+    tg_client = AsyncTgClient("test", api_url=url, **options)
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    tg_client.sleep = sleep
+    return tg_client
+
+
+def run(tg_client: AsyncTgClient, coroutine):
+    async def main():
+        try:
+            return await coroutine
+        finally:
+            await tg_client.close()
+
+    return asyncio.run(main())
+
+
+def test_get_updates_and_send_message(server):
+    server.add_message(chat_id=5, text="hello")
+
+    async def run():
+        tg_client = AsyncTgClient("test", api_url=server.url)
+        updates = await tg_client.get_updates(timeout=0)
+        message = updates.result[0].message
+        response = await tg_client.send_message(chat_id=message.chat.id, text=f"echo {message.text}")
+        await tg_client.close()
+        return response
+
+    response = asyncio.run(run())
+
+    assert response.ok is True
+    assert response.result.text == "echo hello"
+    assert server.sent == [{"chat_id": 5, "text": "echo hello"}]
+
+
+def test_send_message_concurrently_over_pool(server):
+    server.latency = 0.05
+    connections = set()
+    finish_request = server.http.finish_request
+
+    def count_connections(request, client_address):
+        connections.add(client_address)
+        finish_request(request, client_address)
+
+    server.http.finish_request = count_connections
+
+    async def run():
+        tg_client = AsyncTgClient("test", api_url=server.url, pool_size=4)
+        await asyncio.gather(*(tg_client.send_message(chat_id=1, text=str(number)) for number in range(20)))
+        await tg_client.close()
+
+    asyncio.run(run())
+
+    assert len(server.sent) == 20
+    # Запросы идут не больше чем через pool_size соединений, соединения переиспользуются
+    assert len(connections) == 4
+
+
+def test_retries_honour_retry_after(server):
+    delays = []
+    server.fail_next("sendMessage", status=429, retry_after=3)
+    server.fail_next("sendMessage", status=503)
+    tg_client = make_client(server.url, delays)
+
+    run(tg_client, tg_client.send_message(chat_id=1, text="hello"))
+
+    assert server.calls == ["sendMessage"] * 3
+    assert delays[0] == 3
+    assert 0 <= delays[1] <= tg_client.backoff * 2
+    stats = tg_client.get_stats()["sendMessage"]
+    assert (stats["calls"], stats["errors"], stats["retries"]) == (3, 2, 2)
+
+
+def test_raises_after_retries(server):
+    delays = []
+    server.fail_next("getUpdates", status=500, count=3)
+    tg_client = make_client(server.url, delays, retries=2)
+
+    with pytest.raises(TgClientError):
+        run(tg_client, tg_client.get_updates(timeout=0))
+
+    assert len(delays) == 2
+
+
+def test_connection_errors_are_retried():
+    delays = []
+    with FakeTelegramServer() as server:
+        url = server.url
+    tg_client = make_client(url, delays, retries=1, connect_timeout=0.5)
+
+    with pytest.raises(TgClientError):
+        run(tg_client, tg_client.get_updates(timeout=0))
+
+    assert len(delays) == 1
+    assert tg_client.get_stats()["getUpdates"]["errors"] == 2
+
+
+def test_send_message_read_timeout_not_retried(server):
+    delays = []
+    server.latency = 0.5
+    tg_client = make_client(server.url, delays, read_timeout=0.1)
+
+    with pytest.raises(TgClientError, match="Timeout"):
+        run(tg_client, tg_client.send_message(chat_id=1, text="hello"))
+
+    # Сообщение могло дойти, поэтому повтора нет
+    assert server.calls == ["sendMessage"]
+    assert delays == []
+
+
+def test_get_updates_read_timeout_retried(server):
+    delays = []
+    tg_client = make_client(server.url, delays, retries=1, read_timeout=0.1)
+    server.add_message(chat_id=1, text="hello")
+    # Первый ответ getUpdates задерживается дольше таймаута чтения
+    api_get_updates = server.api_getUpdates
+    calls = []
+
+    def slow_get_updates(params):
+        calls.append(params)
+        if len(calls) == 1:
+            time.sleep(0.5)
+        return api_get_updates(params)
+
+    server.api_getUpdates = slow_get_updates
+
+    updates = run(tg_client, tg_client.get_updates(timeout=0))
+
+    assert len(updates.result) == 1
+    assert len(delays) == 1
@@ -0,0 +1,118 @@
+import pytest
+
+from bot.tg.client import TgClient, TgClientError
+from bot.tg.fake_server import FakeTelegramServer
+
+
+@pytest.fixture
+def server():
+    with FakeTelegramServer() as server:
+        yield server
+
+
+@pytest.fixture
+def delays():
+    return []
+
+
+@pytest.fixture
+def tg_client(server, delays):
+    tg_client = TgClient("test", api_url=server.url, retries=2)
+    tg_client.sleep = delays.append
+    yield tg_client
+    tg_client.close()
+
+
+def test_send_message_retries_server_errors(server, tg_client, delays):
+    server.fail_next("sendMessage", status=502, count=2)
+
+    response = tg_client.send_message(chat_id=1, text="hello")
+
+    assert response.ok is True
+    assert server.sent == [{"chat_id": 1, "text": "hello"}]
+    assert server.calls == ["sendMessage"] * 3
+    assert len(delays) == 2
+    # Пауза со случайной составляющей не превышает экспоненциальную границу
+    assert 0 <= delays[0] <= tg_client.backoff
+    assert 0 <= delays[1] <= tg_client.backoff * 2
+
+
+def test_send_message_honours_retry_after(server, tg_client, delays):
+    server.fail_next("sendMessage", status=429, retry_after=7)
+
+    tg_client.send_message(chat_id=1, text="hello")
+
+    assert delays == [7]
+    assert len(server.sent) == 1
+
+
+def test_request_raises_after_retries(server, tg_client, delays):
+    server.fail_next("getUpdates", status=500, count=3)
+
+    with pytest.raises(TgClientError):
+        tg_client.get_updates(timeout=0)
+
+    assert server.calls == ["getUpdates"] * 3
+    assert len(delays) == 2
+
+
+def test_client_errors_are_not_retried(tg_client, delays):
+    response = tg_client.request("unknownMethod", {})
+
+    assert response["error_code"] == 404
+    assert delays == []
+
+
+@pytest.mark.parametrize("status, body", [(403, b"<html>Forbidden</html>"), (200, b"")])
+def test_non_json_response_raises_client_error(server, tg_client, delays, status, body):
+    server.api_sendMessage = lambda params: (status, body)
+
+    with pytest.raises(TgClientError, match=f"HTTP {status} without JSON body"):
+        tg_client.send_message(chat_id=1, text="hello")
+
+    assert delays == []
+
+
+def test_connection_errors_are_retried(delays):
+    with FakeTelegramServer() as server:
+        url = server.url
+    tg_client = TgClient("test", api_url=url, retries=1, connect_timeout=0.5)
+    tg_client.sleep = delays.append
+
+    with pytest.raises(TgClientError):
+        tg_client.get_updates(timeout=0)
+
+    assert len(delays) == 1
+    assert tg_client.get_stats()["getUpdates"]["errors"] == 2
+
+
+def test_client_stats(server, tg_client):
+    server.fail_next("sendMessage", status=500)
+    for number in range(3):
+        tg_client.send_message(chat_id=1, text=str(number))
+    tg_client.get_updates(timeout=0)
+
+    stats = tg_client.get_stats()
+
+    assert stats["sendMessage"]["calls"] == 4
+    assert stats["sendMessage"]["errors"] == 1
+    assert stats["sendMessage"]["retries"] == 1
+    assert stats["getUpdates"]["calls"] == 1
+    assert stats["getUpdates"]["errors"] == 0
+    assert 0 < stats["sendMessage"]["latency_avg"] <= stats["sendMessage"]["latency_max"]
+
+
+def test_client_reuses_connection(server, tg_client):
+    connections = set()
+    handle = server.http.finish_request
+
+    def finish_request(request, client_address):
+        connections.add(client_address)
+        handle(request, client_address)
+
+    server.http.finish_request = finish_request
+    for number in range(5):
+        tg_client.send_message(chat_id=1, text=str(number))
+
+    assert len(server.sent) == 5
+    assert len(connections) == 1
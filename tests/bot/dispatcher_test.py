@@ -0,0 +1,130 @@
+import asyncio
+import threading
+import time
+
+from bot.tg.dispatcher import AsyncChatDispatcher, ChatDispatcher
+
+
+def test_dispatcher_keeps_chat_order():
+    handled = []
+    lock = threading.Lock()
+
+    def handler(item):
+        chat_id, number = item
+        time.sleep(0.001 * (number % 3))
+        with lock:
+            handled.append(item)
+
+    dispatcher = ChatDispatcher(handler, workers=4, max_pending=10)
+    for number in range(60):
+        dispatcher.submit(number % 5, (number % 5, number))
+    dispatcher.shutdown()
+
+    assert len(handled) == 60
+    for chat_id in range(5):
+        numbers = [number for chat, number in handled if chat == chat_id]
+        assert numbers == sorted(numbers)
+
+
+def test_dispatcher_runs_chats_concurrently():
+    started = threading.Barrier(3, timeout=5)
+    dispatcher = ChatDispatcher(lambda item: started.wait(), workers=3)
+
+    for chat_id in range(3):
+        dispatcher.submit(chat_id, chat_id)
+    dispatcher.shutdown()
+
+    assert not started.broken
+
+
+def test_dispatcher_backpressure():
+    release = threading.Event()
+    dispatcher = ChatDispatcher(lambda item: release.wait(5), workers=1, max_pending=2)
+
+    assert dispatcher.submit(1, "a")
+    assert dispatcher.submit(2, "b")
+    assert not dispatcher.submit(3, "c", timeout=0.05)
+
+    release.set()
+    assert dispatcher.submit(3, "c", timeout=5)
+    dispatcher.shutdown()
+
+
+def test_dispatcher_survives_handler_errors():
+    handled = []
+
+    def handler(item):
+        if item == "fail":
+            raise ValueError(item)
+        handled.append(item)
+
+    dispatcher = ChatDispatcher(handler, workers=2)
+    for item in ("fail", "ok"):
+        dispatcher.submit(1, item)
+    dispatcher.shutdown()
+
+    assert handled == ["ok"]
+
+
+def test_async_dispatcher_keeps_chat_order():
+    handled = []
+
+    async def handler(item):
+        chat_id, number = item
+        await asyncio.sleep(0.001 * (number % 3))
+        handled.append(item)
+
+    async def run():
+        dispatcher = AsyncChatDispatcher(handler, max_pending=10)
+        for number in range(60):
+            await dispatcher.submit(number % 5, (number % 5, number))
+        await dispatcher.shutdown()
+
+    asyncio.run(run())
+
+    assert len(handled) == 60
+    for chat_id in range(5):
+        numbers = [number for chat, number in handled if chat == chat_id]
+        assert numbers == sorted(numbers)
+
+
+def test_async_dispatcher_runs_chats_concurrently():
+    async def run():
+        events = [asyncio.Event() for _ in range(100)]
+
+        async def handler(chat_id):
+            events[chat_id].set()
+            # Обработчик ждет, пока начнутся обработчики всех чатов
+            await asyncio.gather(*(event.wait() for event in events))
+
+        dispatcher = AsyncChatDispatcher(handler, max_pending=100)
+        for chat_id in range(100):
+            await dispatcher.submit(chat_id, chat_id)
+        await asyncio.wait_for(dispatcher.shutdown(), 5)
+
+    asyncio.run(run())
+
+
+def test_async_dispatcher_backpressure():
+    async def run():
+        release = asyncio.Event()
+
+        async def handler(item):
+            if item == "boom":
+                raise ValueError(item)
+            await release.wait()
+
+        dispatcher = AsyncChatDispatcher(handler, max_pending=2)
+        await dispatcher.submit(1, "boom")
+        await dispatcher.submit(1, "a")
+        await dispatcher.submit(2, "b")
+        blocked = asyncio.create_task(dispatcher.submit(3, "c"))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+
+        release.set()
+        await asyncio.wait_for(blocked, 5)
+        await dispatcher.shutdown()
+        assert dispatcher.queues == {}
+
+    asyncio.run(run())
@@ -0,0 +1,62 @@
+import time
+
+import pytest
+from django.test import override_settings
+
+from bot.tg.state import CacheStateStore, DBStateStore, MemoryStateStore, TgState, get_state_store
+
+
+@pytest.mark.parametrize("store_class", [MemoryStateStore, CacheStateStore, DBStateStore])
+@pytest.mark.django_db
+def test_state_store_by_chat(store_class):
+    store = store_class(ttl=60)
+    store.set(1, TgState(TgState.GOAL_CREATE, category_id=5))
+    store.set(2, TgState(TgState.CATEGORY_CHOOSE))
+
+    first, second, unknown = store.get(1), store.get(2), store.get(3)
+    assert (first.state, first.category_id) == (TgState.GOAL_CREATE, 5)
+    assert (second.state, second.category_id) == (TgState.CATEGORY_CHOOSE, None)
+    assert unknown.is_default
+
+    store.set(1, TgState())
+    assert store.get(1).is_default
+
+
+@pytest.mark.parametrize("store_class", [MemoryStateStore, DBStateStore])
+@pytest.mark.django_db
+def test_state_store_ttl(store_class):
+    store = store_class(ttl=0)
+    store.set(1, TgState(TgState.CATEGORY_CHOOSE))
+    time.sleep(0.01)
+
+    assert store.get(1).is_default
+
+
+@pytest.mark.django_db
+def test_db_state_store_clear_expired():
+    DBStateStore(ttl=0).set(1, TgState(TgState.CATEGORY_CHOOSE))
+    DBStateStore(ttl=60).set(2, TgState(TgState.CATEGORY_CHOOSE))
+
+    assert DBStateStore.clear_expired() == 1
+
+
+def test_memory_state_store_lru():
+    store = MemoryStateStore(ttl=60, max_size=2)
+    for chat_id in (1, 2):
+        store.set(chat_id, TgState(TgState.CATEGORY_CHOOSE))
+    store.get(1)
+    store.set(3, TgState(TgState.CATEGORY_CHOOSE))
+
+    assert not store.get(1).is_default
+    assert store.get(2).is_default
+    assert not store.get(3).is_default
+
+
+def test_get_state_store():
+    with override_settings(BOT_STATE_STORE="cache", BOT_STATE_TTL=10):
+        store = get_state_store()
+    assert isinstance(store, CacheStateStore)
+    assert store.ttl == 10
+
+    with override_settings(BOT_STATE_STORE="bot.tg.state.DBStateStore"):
+        assert isinstance(get_state_store(), DBStateStore)
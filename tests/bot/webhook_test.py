@@ -0,0 +1,111 @@
+import itertools
+
+import pytest
+
+from bot.management.commands.runbot import Command as BotCommand
+from bot.models import TgChatUpdate, TgUser
+from bot.tg.client import TgClient
+from bot.tg.fake_server import FakeTelegramServer
+from bot.views import BotWebhookView
+from goals.models import Goal
+
+SECRET = "webhook-secret"
+update_ids = itertools.count(1)
+
+
+@pytest.fixture
+def server(settings, monkeypatch):
+    settings.BOT_WEBHOOK_SECRET = SECRET
+    with FakeTelegramServer() as server:
+        bot = BotCommand()
+        bot.tg_client = TgClient("test", api_url=server.url)
+        monkeypatch.setattr(BotWebhookView, "bot", bot)
+        yield server
+
+
+def post_update(client, server, chat_id, text, secret=SECRET, update_id=None):
+    update = {"update_id": update_id or next(update_ids), "message": server.make_message(chat_id, text)}
+    return client.post(
+        "/bot/webhook", update, content_type="application/json", HTTP_X_TELEGRAM_BOT_API_SECRET_TOKEN=secret
+    )
+
+
+@pytest.mark.django_db
+def test_webhook_rejects_wrong_secret(client, server):
+    response = post_update(client, server, 1, "/goals", secret="wrong")
+
+    assert response.status_code == 403
+    assert not TgUser.objects.exists()
+
+
+@pytest.mark.django_db
+def test_webhook_disabled_without_secret(client, server, settings):
+    settings.BOT_WEBHOOK_SECRET = ""
+
+    response = post_update(client, server, 1, "/goals", secret="")
+
+    assert response.status_code == 403
+
+
+@pytest.mark.django_db
+def test_webhook_ignores_updates_without_message(client, server):
+    response = client.post(
+        "/bot/webhook", {"update_id": 1, "edited_message": {}}, content_type="application/json",
+        HTTP_X_TELEGRAM_BOT_API_SECRET_TOKEN=SECRET,
+    )
+
+    assert response.status_code == 200
+    assert server.calls == []
+
+
+@pytest.mark.django_db
+def test_webhook_rejects_invalid_update(client, server):
+    response = client.post(
+        "/bot/webhook", {"update_id": 1, "message": {"text": "/goals"}}, content_type="application/json",
+        HTTP_X_TELEGRAM_BOT_API_SECRET_TOKEN=SECRET,
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_webhook_answers_in_response(client, server):
+    response = post_update(client, server, 7, "/unknown")
+
+    assert response.status_code == 200
+    # Сообщение о подтверждении отправляется через API, последний ответ - в теле ответа вебхука
+    assert response.json() == {"method": "sendMessage", "chat_id": 7, "text": "Неизвестная команда /unknown"}
+    assert len(server.sent) == 1
+    assert server.sent[0]["text"].startswith("Подтвердите свой аккаунт")
+    assert TgUser.objects.filter(tg_chat_id=7).exists()
+
+
+@pytest.mark.django_db
+def test_webhook_create_goal(client, server, user_factory, board_participant_factory, goal_category_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal_category_factory(board=board_participant.board, user=user, title="Work")
+    TgUser.objects.create(tg_user_id=user.id, tg_chat_id=user.id, user=user, verification_code="code")
+
+    texts = [post_update(client, server, user.id, text).json()["text"] for text in ("/create", "Work", "Report")]
+
+    assert texts[1:] == ["Введите название цели", 'Цель "Report" создана']
+    assert Goal.objects.get(user=user).title == "Report"
+    assert server.sent == []
+
+
+@pytest.mark.django_db
+def test_webhook_skips_repeated_updates(client, server):
+    first = post_update(client, server, 7, "/unknown", update_id=10)
+    repeated = post_update(client, server, 7, "/unknown", update_id=10)
+    # Обновление с меньшим id, доставленное позже, - другое сообщение, и оно обрабатывается
+    older = post_update(client, server, 7, "/cancel", update_id=9)
+    other_chat = post_update(client, server, 8, "/unknown", update_id=10)
+
+    assert first.json()["text"] == "Неизвестная команда /unknown"
+    # Повтор подтверждается без обработки и ответа
+    assert (repeated.status_code, repeated.content) == (200, b"")
+    assert older.json()["text"] == "Операция отменена"
+    assert other_chat.json()["text"] == "Неизвестная команда /unknown"
+    assert [message["chat_id"] for message in server.sent] == [7, 8]
+    assert sorted(TgChatUpdate.objects.filter(tg_chat_id=7).values_list("update_id", flat=True)) == [9, 10]
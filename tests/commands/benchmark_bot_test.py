@@ -0,0 +1,22 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+
+def test_benchmark_bot():
+    out = StringIO()
+    call_command("benchmark_bot", updates=20, chats=4, workers=[1, 4], latency=0, stdout=out)
+
+    output = out.getvalue()
+    assert "workers=1" in output
+    assert "workers=4" in output
+    assert "updates/s" in output
+
+
+def test_benchmark_bot_async():
+    out = StringIO()
+    call_command("benchmark_bot", updates=20, chats=4, workers=[4], latency=0, use_async=True, stdout=out)
+
+    output = out.getvalue()
+    assert "connections=4" in output
+    assert "updates/s" in output
@@ -0,0 +1,13 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+
+def test_benchmark_serializers():
+    out = StringIO()
+    call_command("benchmark_serializers", rows=10, repeat=1, stdout=out)
+
+    output = out.getvalue()
+    for name in ("category", "goal", "comment"):
+        assert name in output
+    assert "rows/s" in output
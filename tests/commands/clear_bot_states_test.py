@@ -0,0 +1,44 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from bot.models import TgChatState, TgChatUpdate
+
+
+@pytest.mark.django_db
+def test_clear_bot_states(settings):
+    settings.BOT_STATE_STORE = "db"
+    TgChatState.objects.create(tg_chat_id=1, state=1, expires=timezone.now() - timedelta(seconds=1))
+    TgChatState.objects.create(tg_chat_id=2, state=1, expires=timezone.now() + timedelta(hours=1))
+    out = StringIO()
+
+    call_command("clear_bot_states", stdout=out)
+
+    assert "Cleared 1 expired chat states" in out.getvalue()
+    assert list(TgChatState.objects.values_list("tg_chat_id", flat=True)) == [2]
+
+
+@pytest.mark.django_db
+def test_clear_bot_states_webhook_updates(settings):
+    settings.BOT_UPDATE_TTL = 60
+    TgChatUpdate.objects.create(tg_chat_id=1, update_id=1, created=timezone.now() - timedelta(seconds=61))
+    TgChatUpdate.objects.create(tg_chat_id=1, update_id=2, created=timezone.now())
+    out = StringIO()
+
+    call_command("clear_bot_states", stdout=out)
+
+    assert "Cleared 1 expired webhook updates" in out.getvalue()
+    assert list(TgChatUpdate.objects.values_list("update_id", flat=True)) == [2]
+
+
+@pytest.mark.django_db
+def test_clear_bot_states_memory_store(settings):
+    settings.BOT_STATE_STORE = "memory"
+    out = StringIO()
+
+    call_command("clear_bot_states", stdout=out)
+
+    assert "Cleared 0 expired chat states" in out.getvalue()
@@ -0,0 +1,17 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from goals.models import Goal
+
+
+@pytest.mark.django_db
+def test_explain_queries():
+    out = StringIO()
+    call_command("explain_queries", goals=200, boards=10, stdout=out)
+
+    output = out.getvalue()
+    assert "goal list ordered by title" in output
+    assert "goal comment list by goal" in output
+    assert not Goal.objects.exists()
@@ -0,0 +1,31 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from goals.models import Goal
+
+
+@pytest.mark.django_db
+def test_import_goals(tmp_path, board_participant_factory, goal_category_factory):
+    board_participant = board_participant_factory()
+    category = goal_category_factory(board=board_participant.board)
+    path = tmp_path / "goals.ndjson"
+    path.write_text(
+        "\n".join(json.dumps(row) for row in [
+            {"title": "Цель", "category": category.id},
+            {"title": "Без категории"},
+        ]),
+        encoding="utf-8",
+    )
+    report_path = tmp_path / "report.ndjson"
+
+    out = StringIO()
+    call_command("import_goals", board_participant.board.id, str(path), report=str(report_path), stdout=out)
+
+    assert "Imported 1 rows, failed 1 rows" in out.getvalue()
+    report = [json.loads(line) for line in report_path.read_text().splitlines()]
+    assert [result["status"] for result in report] == [201, 400]
+    goal = Goal.objects.get(pk=report[0]["id"])
+    assert goal.user == board_participant.user
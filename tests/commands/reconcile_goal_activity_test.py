@@ -0,0 +1,27 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from goals.models import Goal
+
+
+@pytest.mark.django_db
+def test_reconcile_goal_activity(goal_factory, goal_comment_factory):
+    goal, empty_goal, other_goal = goal_factory.create_batch(3)
+    comments = goal_comment_factory.create_batch(2, goal=goal)
+    goal_comment_factory(goal=other_goal)
+    Goal.objects.filter(pk=goal.pk).update(comment_count=10, last_activity_at=None)
+    Goal.objects.filter(pk=empty_goal.pk).update(comment_count=1)
+
+    out = StringIO()
+    call_command("reconcile_goal_activity", batch_size=1, stdout=out)
+
+    assert "Reconciled comment activity of 2 goals" in out.getvalue()
+    goal.refresh_from_db()
+    empty_goal.refresh_from_db()
+    other_goal.refresh_from_db()
+    assert goal.comment_count == 2
+    assert goal.last_activity_at == max(comment.updated for comment in comments)
+    assert (empty_goal.comment_count, empty_goal.last_activity_at) == (0, None)
+    assert other_goal.comment_count == 1
@@ -0,0 +1,139 @@
+import os
+import signal
+import threading
+import time
+
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from bot.management.commands.runbot import Command
+from bot.models import TgChatState, TgUser
+from goals.models import Goal
+from bot.tg.client import TgClient
+from bot.tg.dc import GET_UPDATES_SCHEMA
+from bot.tg.fake_server import FakeTelegramServer
+
+
+@pytest.mark.django_db(transaction=True)
+def test_runbot_graceful_shutdown(monkeypatch):
+    with FakeTelegramServer() as server:
+        monkeypatch.setattr(Command, "tg_client", TgClient("test", api_url=server.url))
+        for chat_id in (1, 2):
+            server.add_message(chat_id=chat_id, text="/unknown")
+
+        def stop_when_answered():
+            # Два сообщения о подтверждении аккаунта и два ответа на неизвестную команду
+            server.wait_sent(4)
+            os.kill(os.getpid(), signal.SIGTERM)
+
+        stopper = threading.Thread(target=stop_when_answered)
+        stopper.start()
+        call_command("runbot", workers=2, poll_timeout=1)
+        stopper.join()
+
+        assert TgUser.objects.count() == 2
+        for chat_id in (1, 2):
+            texts = [message["text"] for message in server.sent if message["chat_id"] == chat_id]
+            assert texts[1] == "Неизвестная команда /unknown"
+        # Последний вызов подтверждает обработанные обновления
+        assert server.updates == []
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize("use_async", [False, True])
+def test_runbot_stop_interrupts_long_polling(monkeypatch, use_async):
+    with FakeTelegramServer() as server:
+        monkeypatch.setattr(Command, "tg_client", TgClient("test", api_url=server.url))
+        server.add_message(chat_id=1, text="/unknown")
+
+        def stop_while_polling():
+            server.wait_sent(2)
+            # Бот уже ждет следующих обновлений
+            time.sleep(0.5)
+            os.kill(os.getpid(), signal.SIGTERM)
+
+        stopper = threading.Thread(target=stop_while_polling)
+        stopper.start()
+        start = time.monotonic()
+        call_command("runbot", use_async=use_async, workers=1, poll_timeout=30)
+        stopper.join()
+
+        # Остановка не ждет окончания long polling
+        assert time.monotonic() - start < 5
+        assert server.updates == []
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize("use_async", [False, True])
+def test_runbot_clears_expired_states(monkeypatch, settings, use_async):
+    settings.BOT_STATE_STORE = "db"
+    TgChatState.objects.create(tg_chat_id=1, state=1, expires=timezone.now() - timedelta(seconds=1))
+    TgChatState.objects.create(tg_chat_id=2, state=1, expires=timezone.now() + timedelta(hours=1))
+    with FakeTelegramServer() as server:
+        monkeypatch.setattr(Command, "tg_client", TgClient("test", api_url=server.url))
+        stopper = threading.Timer(0.5, os.kill, (os.getpid(), signal.SIGTERM))
+        stopper.start()
+        call_command("runbot", use_async=use_async, workers=1, poll_timeout=1)
+        stopper.join()
+
+    assert list(TgChatState.objects.values_list("tg_chat_id", flat=True)) == [2]
+
+
+@pytest.mark.django_db
+def test_runbot_create_flows_by_chat(monkeypatch, user_factory, board_participant_factory, goal_category_factory):
+    first_user, second_user = user_factory.create_batch(2)
+    for user, title in ((first_user, "Work"), (second_user, "Home")):
+        board_participant = board_participant_factory(user=user)
+        goal_category_factory(board=board_participant.board, user=user, title=title)
+        TgUser.objects.create(tg_user_id=user.id, tg_chat_id=user.id, user=user, verification_code=f"code{user.id}")
+
+    with FakeTelegramServer() as server:
+        command = Command()
+        monkeypatch.setattr(command, "tg_client", TgClient("test", api_url=server.url))
+        messages = [
+            (first_user, "/create"), (second_user, "/create"),
+            (first_user, "Work"), (second_user, "Home"),
+            (second_user, "Cook dinner"), (first_user, "Write report"),
+        ]
+        for user, text in messages:
+            update = server.add_message(chat_id=user.id, text=text)
+            command.handle_message(GET_UPDATES_SCHEMA.load({"ok": True, "result": [update]}).result[0].message)
+
+    assert Goal.objects.get(user=first_user).title == "Write report"
+    assert Goal.objects.get(user=second_user).category.title == "Home"
+
+
+@pytest.mark.django_db(transaction=True)
+def test_runbot_async(monkeypatch, user_factory, board_participant_factory, goal_category_factory):
+    users = user_factory.create_batch(3)
+    for user in users:
+        board_participant = board_participant_factory(user=user)
+        goal_category_factory(board=board_participant.board, user=user, title=f"Category {user.id}")
+        TgUser.objects.create(tg_user_id=user.id, tg_chat_id=user.id, user=user, verification_code=f"code{user.id}")
+
+    with FakeTelegramServer(latency=0.01) as server:
+        monkeypatch.setattr(Command, "tg_client", TgClient("test", api_url=server.url))
+        for user in users:
+            for text in ("/create", f"Category {user.id}", f"Goal {user.id}"):
+                server.add_message(chat_id=user.id, text=text)
+        server.add_message(chat_id=100, text="/goals")
+
+        def stop_when_answered():
+            # По три ответа пользователям и два ответа новому чату
+            server.wait_sent(11)
+            os.kill(os.getpid(), signal.SIGTERM)
+
+        stopper = threading.Thread(target=stop_when_answered)
+        stopper.start()
+        call_command("runbot", use_async=True, workers=2, poll_timeout=1)
+        stopper.join()
+
+        for user in users:
+            texts = [message["text"] for message in server.sent if message["chat_id"] == user.id]
+            assert texts[1:] == ["Введите название цели", f'Цель "Goal {user.id}" создана']
+            assert Goal.objects.get(user=user).title == f"Goal {user.id}"
+        assert TgUser.objects.filter(tg_chat_id=100).exists()
+        assert server.updates == []
@@ -0,0 +1,60 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from bot.management.commands.webhook import Command
+from bot.tg.client import TgClient
+from bot.tg.fake_server import FakeTelegramServer
+
+
+@pytest.fixture
+def server(settings, monkeypatch):
+    settings.BOT_WEBHOOK_SECRET = "webhook-secret"
+    with FakeTelegramServer() as server:
+        monkeypatch.setattr(Command, "tg_client", TgClient("test", api_url=server.url, retries=0))
+        yield server
+
+
+def test_webhook_set_and_delete(server):
+    server.add_message(chat_id=1, text="/goals")
+    out = StringIO()
+
+    call_command(
+        "webhook", "set", "https://example.com/bot/webhook", max_connections=10, drop_pending_updates=True, stdout=out
+    )
+
+    assert "Webhook was set" in out.getvalue()
+    assert server.webhook["url"] == "https://example.com/bot/webhook"
+    assert server.webhook["secret_token"] == "webhook-secret"
+    assert server.webhook["max_connections"] == "10"
+    assert json.loads(server.webhook["allowed_updates"]) == ["message"]
+    assert server.updates == []
+    # Пока вебхук установлен, long polling недоступен
+    assert Command.tg_client.request("getUpdates", {"timeout": 0})["error_code"] == 409
+
+    call_command("webhook", "delete", stdout=out)
+
+    assert "Webhook was deleted" in out.getvalue()
+    assert server.webhook is None
+    assert Command.tg_client.get_updates(timeout=0).ok is True
+
+
+def test_webhook_set_errors(server, settings):
+    with pytest.raises(CommandError, match="HTTPS url"):
+        call_command("webhook", "set", "http://example.com/bot/webhook")
+    with pytest.raises(CommandError, match="url is required"):
+        call_command("webhook", "set")
+
+    settings.BOT_WEBHOOK_SECRET = ""
+    with pytest.raises(CommandError, match="BOT_WEBHOOK_SECRET"):
+        call_command("webhook", "set", "https://example.com/bot/webhook")
+    assert server.webhook is None
+
+
+def test_webhook_api_unavailable(server):
+    server.fail_next("deleteWebhook", status=502)
+
+    with pytest.raises(CommandError, match="HTTP 502"):
+        call_command("webhook", "delete")
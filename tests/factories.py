@@ -8,7 +8,8 @@ class UserFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = User
 
-    username = factory.Faker("name")
+    # Имена из Faker повторяются, а username уникален
+    username = factory.Sequence(lambda number: f"user{number}")
     password = factory.Faker("password")
 
     @classmethod
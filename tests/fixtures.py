@@ -1,6 +1,9 @@
 import pytest
 
 import factory
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from core.models import User
 from goals.models import *
@@ -14,3 +17,19 @@ def get_auth_client(client):
 
     return _get_auth_client
 
+
+@pytest.fixture
+def count_queries():
+    def _count_queries(func, *args, **kwargs):
+        with CaptureQueriesContext(connection) as context:
+            func(*args, **kwargs)
+        return len(context.captured_queries)
+
+    return _count_queries
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
@@ -0,0 +1,19 @@
+import pytest
+
+from goals.models import Board, Goal, GoalCategory
+
+
+@pytest.mark.django_db
+def test_alive_managers(board_factory, goal_category_factory, goal_factory):
+    board = board_factory()
+    deleted_board = board_factory(is_deleted=True)
+    category = goal_category_factory(board=board)
+    deleted_category = goal_category_factory(board=board, is_deleted=True)
+    goal = goal_factory(category=category)
+    archived_goal = goal_factory(category=category, status=Goal.Status.archived)
+
+    assert list(Board.alive.filter(pk__in=[board.pk, deleted_board.pk])) == [board]
+    assert list(GoalCategory.alive.filter(pk__in=[category.pk, deleted_category.pk])) == [category]
+    assert list(Goal.alive.filter(category=category)) == [goal]
+    assert Goal.objects.filter(category=category).count() == 2
+    assert Goal.objects.get(pk=archived_goal.pk).status == Goal.Status.archived
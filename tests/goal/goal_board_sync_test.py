@@ -0,0 +1,42 @@
+import pytest
+
+from goals.models import Goal, GoalComment
+
+
+@pytest.mark.django_db
+def test_goal_board_follows_category(
+    user_factory, get_auth_client, board_participant_factory, goal_category_factory, goal_comment_factory
+):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    other_board_participant = board_participant_factory(user=user)
+    comment = goal_comment_factory(goal__category__board=board_participant.board, goal__category__user=user)
+    goal = comment.goal
+    new_category = goal_category_factory(board=other_board_participant.board, user=user)
+
+    assert goal.board_id == board_participant.board.id
+    assert comment.board_id == board_participant.board.id
+
+    auth_client = get_auth_client(user)
+    response = auth_client.patch(
+        f"/goals/goal/{goal.id}",
+        data={"category": new_category.id},
+        content_type="application/json",
+    )
+
+    assert response.status_code == 200
+    assert Goal.objects.get(pk=goal.pk).board_id == other_board_participant.board.id
+    assert GoalComment.objects.get(pk=comment.pk).board_id == other_board_participant.board.id
+
+
+@pytest.mark.django_db
+def test_goal_list_visibility_by_board(user_factory, get_auth_client, board_participant_factory, goal_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal = goal_factory(category__board=board_participant.board)
+    goal_factory()
+
+    auth_client = get_auth_client(user)
+    response = auth_client.get("/goals/goal/list")
+
+    assert [item["id"] for item in response.data] == [goal.id]
@@ -0,0 +1,112 @@
+import pytest
+
+from goals.models import BoardParticipant, Goal
+
+
+@pytest.mark.django_db
+def test_goal_bulk_create(user_factory, get_auth_client, board_participant_factory, goal_category_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    category = goal_category_factory(board=board_participant.board, user=user)
+    deleted_category = goal_category_factory(board=board_participant.board, user=user, is_deleted=True)
+
+    data = [
+        {"title": "first", "category": category.id},
+        {"title": "second", "category": category.id, "priority": Goal.Priority.high},
+        {"title": "deleted", "category": deleted_category.id},
+        {"category": category.id},
+    ]
+
+    auth_client = get_auth_client(user)
+    response = auth_client.post("/goals/goal/bulk", data=data, content_type="application/json")
+
+    assert response.status_code == 207
+    assert [item["status"] for item in response.data] == [201, 201, 400, 400]
+    assert response.data[2]["errors"] == {"category": ["not allowed in deleted category"]}
+    assert "title" in response.data[3]["errors"]
+
+    goals = Goal.objects.filter(category=category).order_by("id")
+    assert [goal.title for goal in goals] == ["first", "second"]
+    assert all(goal.board_id == board_participant.board.id for goal in goals)
+    assert response.data[1]["data"]["id"] == goals[1].id
+    assert response.data[1]["data"]["user"]["id"] == user.id
+
+
+@pytest.mark.django_db
+def test_goal_bulk_create_query_count(
+    user_factory, get_auth_client, board_participant_factory, goal_category_factory, count_queries
+):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    category = goal_category_factory(board=board_participant.board, user=user)
+
+    auth_client = get_auth_client(user)
+    small = count_queries(
+        auth_client.post, "/goals/goal/bulk",
+        data=[{"title": "goal", "category": category.id}] * 2, content_type="application/json",
+    )
+    large = count_queries(
+        auth_client.post, "/goals/goal/bulk",
+        data=[{"title": "goal", "category": category.id}] * 200, content_type="application/json",
+    )
+
+    assert small == large
+    assert Goal.objects.count() == 202
+
+
+@pytest.mark.django_db
+def test_goal_bulk_update(
+    user_factory, get_auth_client, board_participant_factory, goal_category_factory, goal_factory
+):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    reader_participant = board_participant_factory(user=user, role=BoardParticipant.Role.reader)
+    goal = goal_factory(category__board=board_participant.board, user=user)
+    readonly_goal = goal_factory(category__board=reader_participant.board)
+    new_category = goal_category_factory(board=board_participant.board, user=user)
+
+    data = [
+        {"id": goal.id, "title": "renamed", "category": new_category.id},
+        {"id": readonly_goal.id, "title": "forbidden"},
+        {"id": 0, "title": "missing"},
+        {"title": "no id"},
+    ]
+
+    auth_client = get_auth_client(user)
+    response = auth_client.patch("/goals/goal/bulk", data=data, content_type="application/json")
+
+    assert [item["status"] for item in response.data] == [200, 403, 404, 400]
+    goal.refresh_from_db()
+    readonly_goal.refresh_from_db()
+    assert goal.title == "renamed"
+    assert goal.category_id == new_category.id
+    assert readonly_goal.title != "forbidden"
+
+
+@pytest.mark.django_db
+def test_goal_bulk_archive(user_factory, get_auth_client, board_participant_factory, goal_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goals = goal_factory.create_batch(3, category__board=board_participant.board)
+    other_goal = goal_factory()
+
+    auth_client = get_auth_client(user)
+    response = auth_client.delete(
+        "/goals/goal/bulk",
+        data=[goal.id for goal in goals] + [other_goal.id, "x"],
+        content_type="application/json",
+    )
+
+    assert [item["status"] for item in response.data] == [200, 200, 200, 404, 400]
+    assert Goal.objects.filter(status=Goal.Status.archived).count() == 3
+
+
+@pytest.mark.django_db
+def test_goal_bulk_requires_list(user_factory, get_auth_client, board_participant_factory):
+    user = user_factory()
+    board_participant_factory(user=user)
+
+    auth_client = get_auth_client(user)
+    response = auth_client.post("/goals/goal/bulk", data={"title": "goal"}, content_type="application/json")
+
+    assert response.status_code == 400
@@ -0,0 +1,87 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from goals.models import ArchivedGoal, ArchivedGoalComment, Goal, GoalComment
+
+
+def archive(goal, days):
+    Goal.objects.filter(pk=goal.pk).update(status=Goal.Status.archived, updated=timezone.now() - timedelta(days=days))
+
+
+@pytest.mark.django_db
+def test_goal_cold_storage(
+    user_factory, get_auth_client, board_participant_factory, goal_factory, goal_comment_factory
+):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    old_goal, recent_goal, active_goal = goal_factory.create_batch(3, category__board=board_participant.board)
+    goal_comment_factory.create_batch(2, goal=old_goal)
+    archive(old_goal, days=40)
+    archive(recent_goal, days=1)
+
+    auth_client = get_auth_client(user)
+    before = auth_client.get(f"/goals/goal/{old_goal.id}").json()
+    call_command("archive_goals", days=30, batch_size=1)
+
+    assert set(Goal.objects.values_list("id", flat=True)) == {recent_goal.id, active_goal.id}
+    assert list(ArchivedGoal.objects.values_list("id", flat=True)) == [old_goal.id]
+    assert not GoalComment.objects.filter(goal_id=old_goal.id).exists()
+    assert ArchivedGoalComment.objects.filter(goal_id=old_goal.id).count() == 2
+
+    response = auth_client.get(f"/goals/goal/{old_goal.id}")
+    assert response.status_code == 200
+    assert response.json() == before
+
+
+@pytest.mark.django_db
+def test_goal_cold_storage_restore(
+    user_factory, get_auth_client, board_participant_factory, goal_factory, goal_comment_factory
+):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal = goal_factory(category__board=board_participant.board, title="Restored searchable")
+    goal_comment_factory(goal=goal)
+    archive(goal, days=40)
+    call_command("archive_goals", days=30)
+
+    auth_client = get_auth_client(user)
+    response = auth_client.post(f"/goals/goal/{goal.id}/restore")
+
+    assert response.status_code == 200
+    assert response.json()["id"] == goal.id
+    restored = Goal.objects.get(pk=goal.id)
+    assert restored.status == Goal.Status.archived
+    assert restored.updated > timezone.now() - timedelta(minutes=1)
+    assert GoalComment.objects.filter(goal_id=goal.id).count() == 1
+    assert not ArchivedGoal.objects.exists()
+    assert not ArchivedGoalComment.objects.exists()
+
+    call_command("archive_goals", days=30)
+    assert Goal.objects.filter(pk=goal.id).exists()
+
+
+@pytest.mark.django_db
+def test_goal_cold_storage_restore_command(board_participant_factory, goal_factory):
+    goal = goal_factory(category__board=board_participant_factory().board)
+    archive(goal, days=40)
+    call_command("archive_goals", days=30)
+
+    call_command("archive_goals", restore=[goal.id])
+
+    assert Goal.objects.filter(pk=goal.id).exists()
+
+
+@pytest.mark.django_db
+def test_goal_cold_storage_not_participant(user_factory, get_auth_client, goal_factory):
+    goal = goal_factory()
+    archive(goal, days=40)
+    call_command("archive_goals", days=30)
+
+    auth_client = get_auth_client(user_factory())
+
+    assert auth_client.get(f"/goals/goal/{goal.id}").status_code == 404
+    assert auth_client.post(f"/goals/goal/{goal.id}/restore").status_code == 404
+    assert ArchivedGoal.objects.filter(pk=goal.id).exists()
@@ -0,0 +1,54 @@
+import pytest
+
+from goals.models import Goal, GoalComment
+
+
+@pytest.mark.django_db
+def test_goal_comment_activity(user_factory, get_auth_client, board_participant_factory, goal_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal = goal_factory(category__board=board_participant.board, user=user)
+
+    auth_client = get_auth_client(user)
+    for text in ("first", "second"):
+        auth_client.post("/goals/goal_comment/create", data={"goal": goal.id, "text": text})
+    first, second = GoalComment.objects.filter(goal=goal).order_by("id")
+
+    goal.refresh_from_db()
+    assert goal.comment_count == 2
+    assert goal.last_activity_at == second.updated
+
+    auth_client.patch(f"/goals/goal_comment/{first.id}", data={"text": "edited"}, content_type="application/json")
+    first.refresh_from_db()
+    goal.refresh_from_db()
+    assert goal.last_activity_at == first.updated
+
+    auth_client.delete(f"/goals/goal_comment/{second.id}")
+    goal.refresh_from_db()
+    assert goal.comment_count == 1
+    assert goal.last_activity_at == first.updated
+
+
+@pytest.mark.django_db
+def test_goal_list_comment_activity(
+    user_factory, get_auth_client, board_participant_factory, goal_factory, goal_comment_factory
+):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal = goal_factory(category__board=board_participant.board)
+
+    auth_client = get_auth_client(user)
+    response = auth_client.get("/goals/goal/list")
+    etag = response["ETag"]
+    assert response.data[0]["comment_count"] == 0
+    assert response.data[0]["last_activity_at"] is None
+
+    goal_comment_factory.create_batch(3, goal=goal)
+    updated = Goal.objects.get(pk=goal.id).updated
+    response = auth_client.get("/goals/goal/list", HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+    assert response.data[0]["comment_count"] == 3
+    assert response.data[0]["last_activity_at"] is not None
+    assert updated == goal.updated
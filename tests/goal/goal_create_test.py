@@ -29,6 +29,8 @@ def test_goal_create(user_factory, get_auth_client, board_participant_factory, g
         "priority": 2,
         "created": response.data["created"],
         "updated": response.data["updated"],
+        "comment_count": 0,
+        "last_activity_at": None,
     }
 
     assert response.status_code == 201
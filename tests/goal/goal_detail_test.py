@@ -19,6 +19,8 @@ def test_goal_detail(user_factory, get_auth_client, board_participant_factory, g
         "priority": 2,
         "created": goal.created.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
         "updated": goal.created.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+        "comment_count": 0,
+        "last_activity_at": None,
         "user": {
             "id": user.id,
             "username": user.username,
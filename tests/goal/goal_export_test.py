@@ -0,0 +1,69 @@
+import csv
+import io
+import json
+
+import pytest
+
+from goals.models import Goal
+from goals.views import GoalExportView
+
+
+@pytest.mark.django_db
+def test_goal_export_ndjson(user_factory, get_auth_client, board_participant_factory, goal_factory, monkeypatch):
+    monkeypatch.setattr(GoalExportView, "chunk_size", 2)
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal_factory.create_batch(5, category__board=board_participant.board)
+    goal_factory(category__board=board_participant.board, status=Goal.Status.archived)
+    goal_factory()
+
+    auth_client = get_auth_client(user)
+    response = auth_client.get("/goals/goal/export")
+    listed = {goal["id"]: goal for goal in auth_client.get("/goals/goal/list").json()}
+
+    assert response.status_code == 200
+    assert response.streaming
+    assert response["Content-Type"].startswith("application/x-ndjson")
+    lines = b"".join(response.streaming_content).decode().splitlines()
+    exported = [json.loads(line) for line in lines]
+    assert [goal["id"] for goal in exported] == sorted(listed)
+    assert exported == [listed[goal["id"]] for goal in exported]
+
+
+@pytest.mark.django_db
+def test_goal_export_csv(user_factory, get_auth_client, board_participant_factory, goal_factory, monkeypatch):
+    monkeypatch.setattr(GoalExportView, "chunk_size", 2)
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goals = goal_factory.create_batch(3, category__board=board_participant.board, status=Goal.Status.done)
+    goal_factory(category__board=board_participant.board, status=Goal.Status.to_do)
+
+    auth_client = get_auth_client(user)
+    response = auth_client.get("/goals/goal/export", {"format": "csv", "status": Goal.Status.done})
+
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/csv")
+    assert response["Content-Disposition"] == 'attachment; filename="goals.csv"'
+    rows = list(csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode())))
+    assert [int(row["id"]) for row in rows] == [goal.id for goal in goals]
+    assert rows[0]["user.username"] == goals[0].user.username
+    assert rows[0]["title"] == goals[0].title
+
+
+@pytest.mark.django_db
+def test_goal_export_empty_csv(user_factory, get_auth_client):
+    auth_client = get_auth_client(user_factory())
+    response = auth_client.get("/goals/goal/export", {"format": "csv"})
+
+    content = b"".join(response.streaming_content).decode()
+    assert content.splitlines() == [
+        "id,user.id,user.username,user.first_name,user.last_name,user.email,"
+        "title,description,status,priority,due_date,created,updated,comment_count,last_activity_at,category"
+    ]
+
+
+@pytest.mark.django_db
+def test_goal_export_not_authenticated(client):
+    response = client.get("/goals/goal/export")
+
+    assert response.status_code == 403
@@ -0,0 +1,117 @@
+import pytest
+
+from goals.cache import get_stats
+from goals.models import Goal
+
+
+@pytest.mark.django_db
+def test_goal_list_cache(user_factory, get_auth_client, board_participant_factory, goal_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal = goal_factory(category__board=board_participant.board)
+
+    auth_client = get_auth_client(user)
+    auth_client.get("/goals/goal/list")
+    response = auth_client.get("/goals/goal/list")
+
+    assert response.data[0]["title"] == goal.title
+    assert get_stats() == {"enabled": True, "hits": 1, "misses": 1}
+
+    goal.title = "changed"
+    goal.save()
+    response = auth_client.get("/goals/goal/list")
+
+    assert response.data[0]["title"] == "changed"
+    assert get_stats() == {"enabled": True, "hits": 1, "misses": 2}
+
+
+@pytest.mark.django_db
+def test_goal_list_cache_key_params(user_factory, get_auth_client, board_participant_factory, goal_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal_factory.create_batch(2, category__board=board_participant.board)
+
+    auth_client = get_auth_client(user)
+    auth_client.get("/goals/goal/list", {"ordering": "title", "limit": 1})
+    response = auth_client.get("/goals/goal/list", {"limit": 1, "ordering": "title"})
+    other_response = auth_client.get("/goals/goal/list", {"limit": 2, "ordering": "title"})
+
+    assert get_stats() == {"enabled": True, "hits": 1, "misses": 2}
+    assert len(response.data["results"]) == 1
+    assert len(other_response.data["results"]) == 2
+
+
+@pytest.mark.django_db
+def test_goal_list_cache_bulk_archive(user_factory, get_auth_client, board_participant_factory, goal_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal = goal_factory(category__board=board_participant.board)
+
+    auth_client = get_auth_client(user)
+    assert len(auth_client.get("/goals/goal/list").data) == 1
+
+    auth_client.delete("/goals/goal/bulk", data=[goal.id], content_type="application/json")
+
+    assert auth_client.get("/goals/goal/list").data == []
+    assert Goal.objects.get(pk=goal.pk).status == Goal.Status.archived
+
+
+@pytest.mark.django_db
+def test_goal_list_cache_other_boards_kept(user_factory, get_auth_client, board_participant_factory, goal_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal_factory(category__board=board_participant.board)
+
+    auth_client = get_auth_client(user)
+    auth_client.get("/goals/goal/list")
+    goal_factory()
+    auth_client.get("/goals/goal/list")
+
+    assert get_stats() == {"enabled": True, "hits": 1, "misses": 1}
+
+
+@pytest.mark.django_db
+def test_goal_list_cache_disabled_for_local_cache_with_multiple_writers(
+    user_factory, get_auth_client, board_participant_factory, goal_factory, settings
+):
+    settings.GOALS_MULTIPLE_WRITERS = True
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal = goal_factory(category__board=board_participant.board)
+
+    auth_client = get_auth_client(user)
+    auth_client.get("/goals/goal/list")
+    # Запись в обход сигналов, как в другом процессе, кеш которого API не видит
+    Goal.objects.filter(pk=goal.pk).update(title="changed")
+    response = auth_client.get("/goals/goal/list")
+
+    assert response.data[0]["title"] == "changed"
+    assert get_stats() == {"enabled": False, "hits": 0, "misses": 0}
+
+
+@pytest.mark.django_db
+def test_goal_list_cache_shared_with_multiple_writers(
+    user_factory, get_auth_client, board_participant_factory, goal_factory, settings, tmp_path
+):
+    settings.GOALS_MULTIPLE_WRITERS = True
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": str(tmp_path)},
+    }
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal_factory(category__board=board_participant.board)
+
+    auth_client = get_auth_client(user)
+    auth_client.get("/goals/goal/list")
+    auth_client.get("/goals/goal/list")
+
+    assert get_stats() == {"enabled": True, "hits": 1, "misses": 1}
+
+
+@pytest.mark.django_db
+def test_goal_list_cache_disabled_for_dummy_cache(user_factory, get_auth_client, settings):
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+
+    get_auth_client(user_factory()).get("/goals/goal/list")
+
+    assert get_stats() == {"enabled": False, "hits": 0, "misses": 0}
@@ -0,0 +1,115 @@
+import base64
+import json
+
+import pytest
+
+from goals.pagination import KeysetPagination
+
+
+@pytest.mark.django_db
+def test_goal_list_cursor(user_factory, get_auth_client, board_participant_factory, goal_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goals = goal_factory.create_batch(5, category__board=board_participant.board, title="same title")
+    expected_ids = sorted(goal.id for goal in goals)
+
+    auth_client = get_auth_client(user)
+    response = auth_client.get("/goals/goal/list", {"cursor": "", "limit": 2})
+
+    ids = []
+    pages = [response.data]
+    while response.data["next"]:
+        response = auth_client.get(response.data["next"])
+        pages.append(response.data)
+    for page in pages:
+        ids.extend(goal["id"] for goal in page["results"])
+
+    assert response.status_code == 200
+    assert "count" not in response.data
+    assert ids == expected_ids
+    assert [len(page["results"]) for page in pages] == [2, 2, 1]
+
+    response = auth_client.get(response.data["previous"])
+    assert [goal["id"] for goal in response.data["results"]] == expected_ids[2:4]
+
+
+@pytest.mark.django_db
+def test_goal_list_cursor_ordering(user_factory, get_auth_client, board_participant_factory, goal_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goals = goal_factory.create_batch(3, category__board=board_participant.board)
+    expected_ids = [goal.id for goal in sorted(goals, key=lambda goal: goal.created, reverse=True)]
+
+    auth_client = get_auth_client(user)
+    response = auth_client.get("/goals/goal/list", {"cursor": "", "limit": 2, "ordering": "-created"})
+    next_response = auth_client.get(response.data["next"])
+
+    ids = [goal["id"] for goal in response.data["results"] + next_response.data["results"]]
+    assert ids == expected_ids
+    assert next_response.data["next"] is None
+
+
+@pytest.mark.django_db
+def test_goal_list_cursor_no_count_query(
+    user_factory, get_auth_client, board_participant_factory, goal_factory, django_assert_max_num_queries
+):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal_factory.create_batch(3, category__board=board_participant.board)
+
+    auth_client = get_auth_client(user)
+    with django_assert_max_num_queries(10) as captured:
+        auth_client.get("/goals/goal/list", {"cursor": "", "limit": 2})
+
+    assert not any("COUNT(" in query["sql"] for query in captured.captured_queries)
+
+
+@pytest.mark.django_db
+def test_goal_list_invalid_cursor(user_factory, get_auth_client, board_participant_factory):
+    user = user_factory()
+    board_participant_factory(user=user)
+
+    auth_client = get_auth_client(user)
+    response = auth_client.get("/goals/goal/list", {"cursor": "broken"})
+
+    assert response.status_code == 404
+
+
+def make_cursor(ordering, position):
+    payload = json.dumps({"o": ordering, "p": position, "r": False})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("ordering, position", [
+    (["-created", "-id"], [{}, "x"]),
+    (["-created", "-id"], ["not a date", 1]),
+    (["title", "id"], ["title", "x"]),
+    (["title", "id"], [["title"], 1]),
+    (["title", "id"], "title"),
+])
+def test_goal_list_crafted_cursor(user_factory, get_auth_client, board_participant_factory, ordering, position):
+    user = user_factory()
+    board_participant_factory(user=user)
+    params = {"cursor": make_cursor(ordering, position)}
+    if ordering[0] == "-created":
+        params["ordering"] = "-created"
+
+    response = get_auth_client(user).get("/goals/goal/list", params)
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Invalid cursor"}
+
+
+@pytest.mark.django_db
+def test_goal_list_cursor_max_limit(
+    user_factory, get_auth_client, board_participant_factory, goal_factory, monkeypatch
+):
+    monkeypatch.setattr(KeysetPagination, "max_limit", 2)
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal_factory.create_batch(3, category__board=board_participant.board)
+
+    response = get_auth_client(user).get("/goals/goal/list", {"cursor": "", "limit": 1_000_000})
+
+    assert len(response.data["results"]) == 2
@@ -0,0 +1,108 @@
+import pytest
+from django.utils import timezone
+
+from goals.models import Goal
+
+
+@pytest.mark.django_db
+def test_goal_list_not_modified(user_factory, get_auth_client, board_participant_factory, goal_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal = goal_factory(category__board=board_participant.board, user=user, category__user=user)
+
+    auth_client = get_auth_client(user)
+    response = auth_client.get("/goals/goal/list")
+    etag = response["ETag"]
+    # Для списков Last-Modified не отдается: удаление строк не сдвигает max(updated)
+    assert not response.has_header("Last-Modified")
+
+    response = auth_client.get("/goals/goal/list", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert response.content == b""
+
+    auth_client.patch(f"/goals/goal/{goal.id}", data={"title": "new"}, content_type="application/json")
+    response = auth_client.get("/goals/goal/list", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_goal_list_etag_changes_when_goal_leaves_list(
+    user_factory, get_auth_client, board_participant_factory, goal_factory
+):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goals = goal_factory.create_batch(2, category__board=board_participant.board)
+
+    auth_client = get_auth_client(user)
+    etag = auth_client.get("/goals/goal/list")["ETag"]
+    goals[0].delete()
+
+    response = auth_client.get("/goals/goal/list", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert [goal["id"] for goal in response.data] == [goals[1].id]
+
+
+@pytest.mark.django_db
+def test_goal_list_etag_depends_on_query(user_factory, get_auth_client, board_participant_factory, goal_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal_factory.create_batch(2, category__board=board_participant.board)
+
+    auth_client = get_auth_client(user)
+    etag = auth_client.get("/goals/goal/list")["ETag"]
+    response = auth_client.get("/goals/goal/list", {"limit": 1}, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_goal_list_not_modified_by_cache_version(
+    user_factory, get_auth_client, board_participant_factory, goal_factory, django_assert_num_queries
+):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal = goal_factory(category__board=board_participant.board)
+
+    auth_client = get_auth_client(user)
+    etag = auth_client.get("/goals/goal/list")["ETag"]
+
+    # Только сессия и пользователь: валидатор берется из кеша, к спискам запросов нет
+    with django_assert_num_queries(2):
+        response = auth_client.get("/goals/goal/list", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+
+    # Закешированный ответ отдается с тем же ETag
+    assert auth_client.get("/goals/goal/list")["ETag"] == etag
+
+    goal.delete()
+    response = auth_client.get("/goals/goal/list", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response.data == []
+    assert response["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_goal_list_not_modified_by_aggregate(
+    user_factory, get_auth_client, board_participant_factory, goal_factory, settings, django_assert_num_queries
+):
+    # Без общего кеша при нескольких писателях ETag строится по видимым строкам
+    settings.GOALS_MULTIPLE_WRITERS = True
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal = goal_factory(category__board=board_participant.board)
+
+    auth_client = get_auth_client(user)
+    etag = auth_client.get("/goals/goal/list")["ETag"]
+
+    # Сессия, пользователь и один агрегатный запрос, список не сериализуется
+    with django_assert_num_queries(3) as captured:
+        response = auth_client.get("/goals/goal/list", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert "MAX(" in captured.captured_queries[-1]["sql"]
+
+    # Архивирование другим процессом, без сигнала boards_changed
+    Goal.objects.filter(pk=goal.pk).update(status=Goal.Status.archived, updated=timezone.now())
+    response = auth_client.get("/goals/goal/list", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response.data == []
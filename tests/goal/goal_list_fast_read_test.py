@@ -0,0 +1,77 @@
+from datetime import date
+
+import pytest
+from django.core.cache import cache
+
+from rest_framework.renderers import JSONRenderer
+
+from goals.renderers import FastJSONRenderer
+
+
+def get_content(auth_client, settings, fast_read, params):
+    settings.GOALS_FAST_READ = fast_read
+    cache.clear()
+    response = auth_client.get("/goals/goal/list", params)
+    assert response.status_code == 200
+    return response.content
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("params", [
+    {},
+    {"limit": 2, "offset": 1},
+    {"cursor": "", "limit": 2, "ordering": "-created"},
+    {"search": "цель"},
+])
+def test_goal_list_fast_read(user_factory, get_auth_client, board_participant_factory, goal_factory, settings, params):
+    user = user_factory(first_name="Иван", email="ivan@example.com")
+    board_participant = board_participant_factory(user=user)
+    goal_factory(category__board=board_participant.board, user=user, title="Первая цель\u2028", due_date=date(2030, 1, 2))
+    goal_factory(category__board=board_participant.board, description="Описание", title="Вторая цель")
+    goal_factory(category__board=board_participant.board)
+
+    auth_client = get_auth_client(user)
+    content = get_content(auth_client, settings, False, params)
+
+    assert get_content(auth_client, settings, True, params) == content
+
+
+@pytest.mark.django_db
+def test_goal_list_fast_read_cursor(user_factory, get_auth_client, board_participant_factory, goal_factory, settings):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal_factory.create_batch(3, category__board=board_participant.board)
+    settings.GOALS_FAST_READ = True
+
+    auth_client = get_auth_client(user)
+    response = auth_client.get("/goals/goal/list", {"cursor": "", "limit": 2})
+    next_response = auth_client.get(response.data["next"])
+
+    assert len(response.data["results"]) == 2
+    assert len(next_response.data["results"]) == 1
+    assert next_response.data["next"] is None
+
+
+@pytest.mark.parametrize("accepted_media_type", [None, "application/json; indent=2"])
+def test_fast_json_renderer(accepted_media_type):
+    data = {"title": "Цель\u2028", "items": [1, None, True], "nested": {"a": "b"}}
+
+    content = FastJSONRenderer().render(data, accepted_media_type)
+
+    assert content == JSONRenderer().render(data, accepted_media_type)
+    assert "Цель".encode() in content
+    assert FastJSONRenderer().render(None) == b""
+
+
+@pytest.mark.django_db
+def test_goal_list_fast_read_timezone(user_factory, get_auth_client, board_participant_factory, goal_factory, settings):
+    settings.TIME_ZONE = "Europe/Moscow"
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal_factory(category__board=board_participant.board)
+
+    auth_client = get_auth_client(user)
+    content = get_content(auth_client, settings, False, {})
+
+    assert get_content(auth_client, settings, True, {}) == content
+    assert b"+03:00" in content
@@ -0,0 +1,18 @@
+import pytest
+
+
+@pytest.mark.django_db
+def test_goal_list_query_count(
+    user_factory, get_auth_client, board_participant_factory, goal_factory, count_queries
+):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal_factory.create_batch(2, category__board=board_participant.board)
+
+    auth_client = get_auth_client(user)
+    small_page = count_queries(auth_client.get, "/goals/goal/list", {"limit": 100})
+
+    goal_factory.create_batch(20, category__board=board_participant.board)
+    large_page = count_queries(auth_client.get, "/goals/goal/list", {"limit": 100})
+
+    assert small_page == large_page
@@ -0,0 +1,34 @@
+import pytest
+
+
+@pytest.mark.django_db
+def test_goal_search(user_factory, get_auth_client, board_participant_factory, goal_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    in_description = goal_factory(
+        category__board=board_participant.board, title="Buy food", description="Fresh apples and milk"
+    )
+    in_title = goal_factory(category__board=board_participant.board, title="Apples for the pie")
+    goal_factory(category__board=board_participant.board, title="Write report")
+    goal_factory(title="Apples on another board")
+
+    auth_client = get_auth_client(user)
+    response = auth_client.get("/goals/goal/list", {"search": "apple"})
+
+    assert response.status_code == 200
+    assert [goal["id"] for goal in response.data] == [in_title.id, in_description.id]
+    assert "search_vector" not in response.data[0]
+
+
+@pytest.mark.django_db
+def test_goal_search_after_update(user_factory, get_auth_client, board_participant_factory, goal_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal = goal_factory(category__board=board_participant.board, title="Old title", user=user)
+    goal.description = "Renamed to something searchable"
+    goal.save()
+
+    auth_client = get_auth_client(user)
+    response = auth_client.get("/goals/goal/list", {"search": "searchable"})
+
+    assert [item["id"] for item in response.data] == [goal.id]
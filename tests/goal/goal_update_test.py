@@ -30,6 +30,8 @@ def test_goal_update(user_factory, get_auth_client, board_participant_factory, g
         "priority": 2,
         "created": goal.created.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
         "updated": response.data["updated"],
+        "comment_count": 0,
+        "last_activity_at": None,
         "user": {
             "id": user.id,
             "username": user.username,
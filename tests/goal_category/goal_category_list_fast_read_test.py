@@ -0,0 +1,31 @@
+import pytest
+from django.core.cache import cache
+
+
+def get_content(auth_client, settings, fast_read, params):
+    settings.GOALS_FAST_READ = fast_read
+    cache.clear()
+    response = auth_client.get("/goals/goal_category/list", params)
+    assert response.status_code == 200
+    return response.content
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("params", [
+    {},
+    {"limit": 1},
+    {"cursor": "", "limit": 1},
+    {"search": "Работа"},
+])
+def test_goal_category_list_fast_read(
+    user_factory, get_auth_client, board_participant_factory, goal_category_factory, settings, params
+):
+    user = user_factory(last_name="Петров")
+    board_participant = board_participant_factory(user=user)
+    goal_category_factory(board=board_participant.board, user=user, title="Работа")
+    goal_category_factory(board=board_participant.board, title="Рабочие задачи")
+
+    auth_client = get_auth_client(user)
+    content = get_content(auth_client, settings, False, params)
+
+    assert get_content(auth_client, settings, True, params) == content
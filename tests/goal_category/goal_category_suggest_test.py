@@ -0,0 +1,50 @@
+import pytest
+
+
+@pytest.mark.django_db
+def test_goal_category_suggest(
+    user_factory, get_auth_client, board_participant_factory, goal_category_factory, django_assert_num_queries
+):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    best = goal_category_factory(board=board_participant.board, title="Shopping")
+    close = goal_category_factory(board=board_participant.board, title="Shopping list for the weekend trip")
+    goal_category_factory(board=board_participant.board, title="Work")
+    goal_category_factory(board=board_participant.board, title="Shopping", is_deleted=True)
+    goal_category_factory(title="Shopping")
+
+    auth_client = get_auth_client(user)
+    auth_client.get("/goals/goal_category/suggest")
+    with django_assert_num_queries(3):
+        response = auth_client.get("/goals/goal_category/suggest", {"q": "shoping"})
+
+    assert response.status_code == 200
+    assert response.data == [
+        {"id": best.id, "title": best.title, "board": board_participant.board.id},
+        {"id": close.id, "title": close.title, "board": board_participant.board.id},
+    ]
+
+
+@pytest.mark.django_db
+def test_goal_category_suggest_limit(user_factory, get_auth_client, board_participant_factory, goal_category_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal_category_factory.create_batch(3, board=board_participant.board, title="Home")
+
+    auth_client = get_auth_client(user)
+    response = auth_client.get("/goals/goal_category/suggest", {"q": "home", "limit": 2})
+
+    assert len(response.data) == 2
+
+
+@pytest.mark.django_db
+def test_goal_category_list_search(user_factory, get_auth_client, board_participant_factory, goal_category_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    category = goal_category_factory(board=board_participant.board, title="Travel plans")
+    goal_category_factory(board=board_participant.board, title="Books")
+
+    auth_client = get_auth_client(user)
+    response = auth_client.get("/goals/goal_category/list", {"search": "travel"})
+
+    assert [item["id"] for item in response.data] == [category.id]
@@ -0,0 +1,18 @@
+import pytest
+
+
+@pytest.mark.django_db
+def test_goal_comment_list_not_modified(
+    user_factory, get_auth_client, board_participant_factory, goal_comment_factory
+):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    comment = goal_comment_factory(goal__category__board=board_participant.board)
+
+    auth_client = get_auth_client(user)
+    etag = auth_client.get("/goals/goal_comment/list")["ETag"]
+
+    assert auth_client.get("/goals/goal_comment/list", HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    goal_comment_factory(goal=comment.goal)
+    assert auth_client.get("/goals/goal_comment/list", HTTP_IF_NONE_MATCH=etag).status_code == 200
@@ -0,0 +1,31 @@
+import pytest
+
+
+def get_content(auth_client, settings, fast_read, params):
+    settings.GOALS_FAST_READ = fast_read
+    response = auth_client.get("/goals/goal_comment/list", params)
+    assert response.status_code == 200
+    return response.content
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("params", [
+    {},
+    {"limit": 1, "offset": 1},
+    {"cursor": "", "limit": 1},
+    {"search": "комментарий"},
+])
+def test_goal_comment_list_fast_read(
+    user_factory, get_auth_client, board_participant_factory, goal_factory, goal_comment_factory, settings, params
+):
+    user = user_factory(email="user@example.com")
+    board_participant = board_participant_factory(user=user)
+    goal = goal_factory(category__board=board_participant.board)
+    goal_comment_factory(goal=goal, user=user, text="Первый комментарий")
+    goal_comment_factory(goal=goal, text="Второй комментарий")
+    params = {"goal": goal.id, **params}
+
+    auth_client = get_auth_client(user)
+    content = get_content(auth_client, settings, False, params)
+
+    assert get_content(auth_client, settings, True, params) == content
@@ -0,0 +1,19 @@
+import pytest
+
+
+@pytest.mark.django_db
+def test_goal_comment_list_query_count(
+    user_factory, get_auth_client, board_participant_factory, goal_factory, goal_comment_factory, count_queries
+):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal = goal_factory(category__board=board_participant.board)
+    goal_comment_factory.create_batch(2, goal=goal)
+
+    auth_client = get_auth_client(user)
+    small_page = count_queries(auth_client.get, "/goals/goal_comment/list", {"limit": 100})
+
+    goal_comment_factory.create_batch(20, goal=goal)
+    large_page = count_queries(auth_client.get, "/goals/goal_comment/list", {"limit": 100})
+
+    assert small_page == large_page
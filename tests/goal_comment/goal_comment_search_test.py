@@ -0,0 +1,16 @@
+import pytest
+
+
+@pytest.mark.django_db
+def test_goal_comment_search(user_factory, get_auth_client, board_participant_factory, goal_factory, goal_comment_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal = goal_factory(category__board=board_participant.board)
+    comment = goal_comment_factory(goal=goal, text="Deployment is blocked by the database migration")
+    goal_comment_factory(goal=goal, text="Looks good to me")
+
+    auth_client = get_auth_client(user)
+    response = auth_client.get("/goals/goal_comment/list", {"search": "migrations"})
+
+    assert response.status_code == 200
+    assert [item["id"] for item in response.data] == [comment.id]
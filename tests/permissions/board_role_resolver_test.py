@@ -0,0 +1,86 @@
+import pytest
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from goals.models import BoardParticipant, Goal, GoalComment
+from goals.permissions import (
+    BoardPermissions,
+    BoardRoleResolver,
+    CommentPermissions,
+    GoalCategoryPermissions,
+    GoalPermissions,
+)
+
+
+def make_request(user, method="get"):
+    request = Request(getattr(APIRequestFactory(), method)("/"))
+    request.user = user
+    return request
+
+
+@pytest.mark.django_db
+def test_board_role_resolver_memoizes_roles(user_factory, board_participant_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user, role=BoardParticipant.Role.writer)
+    other_board_participant = board_participant_factory()
+    request = make_request(user)
+
+    resolver = BoardRoleResolver.for_request(request)
+    assert BoardRoleResolver.for_request(request) is resolver
+
+    resolver.load([board_participant.board_id, other_board_participant.board_id])
+    assert resolver.get_role(board_participant.board_id) == BoardParticipant.Role.writer
+    assert resolver.get_role(other_board_participant.board_id) is None
+
+
+@pytest.mark.django_db
+def test_board_role_resolver_single_query(django_assert_num_queries, user_factory, board_participant_factory):
+    user = user_factory()
+    boards = [board_participant_factory(user=user).board_id for _ in range(3)]
+    request = make_request(user)
+    resolver = BoardRoleResolver.for_request(request)
+
+    with django_assert_num_queries(1):
+        resolver.load(boards)
+    with django_assert_num_queries(0):
+        for board_id in boards:
+            assert resolver.get_role(board_id) == BoardParticipant.Role.owner
+
+
+@pytest.mark.django_db
+def test_detail_permissions_query_count(
+    django_assert_num_queries, user_factory, board_participant_factory, goal_comment_factory
+):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal_comment = goal_comment_factory(
+        goal__category__board=board_participant.board,
+        goal__category__user=user,
+        goal__user=user,
+        user=user,
+    )
+    comment = GoalComment.objects.select_related("goal__category").get(pk=goal_comment.pk)
+    goal = comment.goal
+    category = goal.category
+    board = board_participant.board
+
+    for method in ("get", "patch"):
+        request = make_request(user, method)
+        with django_assert_num_queries(1):
+            assert BoardPermissions().has_object_permission(request, None, board)
+        with django_assert_num_queries(0):
+            assert GoalCategoryPermissions().has_object_permission(request, None, category)
+            assert GoalPermissions().has_object_permission(request, None, goal)
+            assert CommentPermissions().has_object_permission(request, None, comment)
+
+
+@pytest.mark.django_db
+def test_detail_permissions_roles(user_factory, board_participant_factory, goal_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user, role=BoardParticipant.Role.reader)
+    goal = goal_factory(category__board=board_participant.board)
+    goal = Goal.objects.select_related("category").get(pk=goal.pk)
+
+    assert GoalPermissions().has_object_permission(make_request(user), None, goal)
+    assert not GoalPermissions().has_object_permission(make_request(user, "patch"), None, goal)
+    assert not GoalPermissions().has_object_permission(make_request(user_factory()), None, goal)
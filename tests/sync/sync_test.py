@@ -0,0 +1,114 @@
+import pytest
+
+from goals.models import BoardParticipant, Goal, GoalCategory
+from goals.sync import SyncToken, get_current_token
+
+
+@pytest.mark.django_db(transaction=True)
+def test_sync_full_and_empty_delta(
+    user_factory, get_auth_client, board_participant_factory, goal_factory, goal_comment_factory
+):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal = goal_factory(category__board=board_participant.board)
+    goal_comment_factory(goal=goal)
+    goal_factory(category=goal.category, status=Goal.Status.archived)
+    goal_factory()
+
+    auth_client = get_auth_client(user)
+    response = auth_client.get("/goals/sync")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [board["id"] for board in data["boards"]] == [board_participant.board.id]
+    assert [participant["user"] for participant in data["participants"]] == [user.username]
+    assert [category["id"] for category in data["categories"]] == [goal.category.id]
+    assert [row["id"] for row in data["goals"]] == [goal.id]
+    assert data["goals"][0]["comment_count"] == 1
+    assert "change_seq" not in data["goals"][0]
+    assert len(data["comments"]) == 1
+    assert data["deleted"] == []
+
+    response = auth_client.get("/goals/sync", {"since": data["token"]})
+    data = response.json()
+    assert all(data[key] == [] for key in ("boards", "participants", "categories", "goals", "comments", "deleted"))
+
+
+@pytest.mark.django_db(transaction=True)
+def test_sync_delta(
+    user_factory, get_auth_client, board_participant_factory, goal_factory, goal_comment_factory
+):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal, other_goal = goal_factory.create_batch(2, category__board=board_participant.board)
+    comment = goal_comment_factory(goal=goal)
+
+    auth_client = get_auth_client(user)
+    token = auth_client.get("/goals/sync").json()["token"]
+
+    Goal.objects.filter(pk=other_goal.pk).update(status=Goal.Status.archived)
+    GoalCategory.objects.filter(pk=goal.category_id).update(is_deleted=True)
+    comment_id = comment.id
+    comment.delete()
+
+    data = auth_client.get("/goals/sync", {"since": token}).json()
+    assert data["boards"] == []
+    assert [category["id"] for category in data["categories"]] == [goal.category_id]
+    assert [row["id"] for row in data["goals"]] == [other_goal.id, goal.id]
+    assert [row["status"] for row in data["goals"]] == [Goal.Status.archived, Goal.Status.to_do]
+    assert data["comments"] == []
+    assert data["deleted"] == [{"type": "comment", "id": comment_id, "board": board_participant.board.id}]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_sync_board_membership(
+    user_factory, get_auth_client, board_participant_factory, goal_factory
+):
+    user = user_factory()
+    board_participant_factory(user=user)
+    other_participant = board_participant_factory()
+    goal = goal_factory(category__board=other_participant.board)
+
+    auth_client = get_auth_client(user)
+    token = auth_client.get("/goals/sync").json()["token"]
+
+    participant = BoardParticipant.objects.create(
+        board=other_participant.board, user=user, role=BoardParticipant.Role.reader
+    )
+    data = auth_client.get("/goals/sync", {"since": token}).json()
+    assert [board["id"] for board in data["boards"]] == [other_participant.board.id]
+    assert {row["id"] for row in data["participants"]} == {participant.id, other_participant.id}
+    assert [row["id"] for row in data["goals"]] == [goal.id]
+
+    participant_id = participant.id
+    participant.delete()
+    data = auth_client.get("/goals/sync", {"since": data["token"]}).json()
+    assert data["goals"] == []
+    assert data["deleted"] == [{"type": "participant", "id": participant_id, "board": other_participant.board.id}]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_sync_unfinished_transaction(user_factory, get_auth_client, board_participant_factory, goal_factory):
+    user = user_factory()
+    board_participant = board_participant_factory(user=user)
+    goal = goal_factory(category__board=board_participant.board)
+    token = get_current_token()
+
+    # Токен, выданный при еще не завершенной транзакции цели: номер уже больше, но xmin меньше
+    stale_token = SyncToken(seq=token.seq, xmin=Goal.objects.get(pk=goal.pk).change_xid)
+    data = get_auth_client(user).get("/goals/sync", {"since": stale_token.encode()}).json()
+
+    assert [row["id"] for row in data["goals"]] == [goal.id]
+
+
+@pytest.mark.django_db
+def test_sync_invalid_token(user_factory, get_auth_client):
+    auth_client = get_auth_client(user_factory())
+
+    assert auth_client.get("/goals/sync", {"since": "not a token"}).status_code == 404
+    assert auth_client.get("/goals/sync", {"since": "bm90IGEgdG9rZW4="}).status_code == 404
+
+
+@pytest.mark.django_db
+def test_sync_not_authenticated(client):
+    assert client.get("/goals/sync").status_code == 403
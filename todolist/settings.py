@@ -30,6 +30,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'django_filters',
     'core',
@@ -98,6 +99,37 @@ DATABASES = {
 }
 
 
+# Cache
+# Кеш списков сбрасывается сигналом boards_changed в процессе, который пишет в БД.
+# Для одного процесса и тестов подходит locmemcache://. Если в БД пишут несколько процессов
+# (API, бот, board_deletions), задается GOALS_MULTIPLE_WRITERS=True и общий бэкенд,
+# например CACHE_URL=pymemcache://memcached:11211; с кешем процесса кеш списков тогда выключается
+# django-environ 0.9 сопоставляет pymemcache:// с PyLibMCCache, а не с PyMemcacheCache
+environ.Env.CACHE_SCHEMES['pymemcache'] = 'django.core.cache.backends.memcached.PyMemcacheCache'
+
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://"),
+}
+GOALS_MULTIPLE_WRITERS = env.bool("GOALS_MULTIPLE_WRITERS", default=False)
+
+# Быстрый путь чтения списков целей, категорий и комментариев через queryset.values()
+GOALS_FAST_READ = env.bool("GOALS_FAST_READ", default=True)
+
+# Через сколько дней архивные цели переносятся в холодное хранилище командой archive_goals
+GOALS_COLD_STORAGE_DAYS = env.int("GOALS_COLD_STORAGE_DAYS", default=30)
+
+# Хранилище состояний диалогов телеграмм-бота: memory для одного процесса,
+# cache (при общем бэкенде кеша) или db для нескольких процессов
+BOT_STATE_STORE = env.str("BOT_STATE_STORE", default="memory")
+# Через сколько секунд брошенный диалог создания цели сбрасывается
+BOT_STATE_TTL = env.int("BOT_STATE_TTL", default=3600)
+# Сколько секунд хранятся отметки обработанных обновлений вебхука для отбрасывания повторов
+BOT_UPDATE_TTL = env.int("BOT_UPDATE_TTL", default=86400)
+# Секрет, который Telegram передает в заголовке X-Telegram-Bot-Api-Secret-Token запросов вебхука;
+# пустое значение отключает вебхук. При вебхуке на нескольких процессах BOT_STATE_STORE - cache или db
+BOT_WEBHOOK_SECRET = env.str("BOT_WEBHOOK_SECRET", default="")
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
 